@@ -0,0 +1,120 @@
+"""
+Testler için ortak fixture'lar (tests/ ve library_project/tests/)
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from author_cache import AuthorCache
+from isbn import NegativeCache
+from resilience import CircuitBreaker
+
+LIBRARY_PROJECT_DIR = os.path.join(os.path.dirname(__file__), 'library_project')
+
+# Kök src klasöründekilerle aynı adı taşıyan (veya onlara bağlanan) modüller
+SHADOWED_MODULES = ('library', 'library_api', 'async_library', 'api', 'main_api')
+
+# Sahte Open Library yanıtları (yol -> JSON); diğer yollar 404 döner
+OPEN_LIBRARY = {
+    '/isbn/9780747532699.json': {
+        'title': "Harry Potter and the Philosopher's Stone",
+        'authors': [{'key': '/authors/OL23919A'}]
+    },
+    '/isbn/9780060853983.json': {
+        'title': 'Good Omens',
+        'authors': [{'key': '/authors/OL25712A'}, {'key': '/authors/OL1394244A'}]
+    },
+    '/isbn/9780134685991.json': {
+        'title': 'Python Crash Course',
+        'authors': [{'key': '/authors/OL7520487A'}]
+    },
+    '/authors/OL23919A.json': {'name': 'J. K. Rowling'},
+    '/authors/OL25712A.json': {'name': 'Terry Pratchett'},
+    '/authors/OL1394244A.json': {'name': 'Neil Gaiman'},
+    '/authors/OL7520487A.json': {'name': 'Eric Matthes'},
+}
+
+
+class FakeOpenLibrary:
+    """OPEN_LIBRARY yanıtlarını veren ve istekleri kaydeden httpx aktarımı"""
+
+    def __init__(self):
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        # ISBN'ler tireli de sorulabilir
+        data = OPEN_LIBRARY.get(request.url.path.replace('-', ''))
+        if data is None:
+            return httpx.Response(404, json={'error': 'notfound'})
+        return httpx.Response(200, json=data)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+
+@pytest.fixture(scope='session')
+def library_project(tmp_path_factory):
+    """
+    library_project modüllerini (library, library_api, main_api, api) yükler
+
+    library ve library_api kök src klasöründe de bulunduğu için modüller
+    sys.modules'e karışmadan yüklenir; diğer testler kök src sürümlerini
+    kullanmaya devam eder. api modülü içe aktarılırken kütüphane dosyasını
+    açtığı için bu sırada çalışma dizini geçici bir klasördür. FastAPI
+    kurulu değilse api None olur.
+    """
+    names = ['library', 'library_api', 'main_api']
+    if importlib.util.find_spec('fastapi') is not None:
+        names.append('api')
+    saved_modules = {name: sys.modules.pop(name)
+                     for name in SHADOWED_MODULES if name in sys.modules}
+    saved_path = list(sys.path)
+    cwd = os.getcwd()
+    sys.path[:0] = [LIBRARY_PROJECT_DIR, os.path.join(LIBRARY_PROJECT_DIR, 'src')]
+    os.chdir(tmp_path_factory.mktemp('library_project'))
+    try:
+        modules = {name: importlib.import_module(name) for name in names}
+    finally:
+        os.chdir(cwd)
+        sys.path[:] = saved_path
+        for name in SHADOWED_MODULES:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved_modules)
+    modules.setdefault('api', None)
+    return SimpleNamespace(**modules)
+
+
+@pytest.fixture
+def open_library():
+    """Sahte Open Library"""
+    return FakeOpenLibrary()
+
+
+@pytest.fixture
+def library_api(library_project, open_library, tmp_path):
+    """
+    Geçici klasörde, sahte Open Library'ye bağlı library_project LibraryAPI'si
+
+    HTTP önbelleği ve döküm dizini kapalıdır; yazar, negatif önbellek ve
+    devre kesici paylaşılan nesneler yerine teste özeldir.
+    """
+    library = library_project.library_api.LibraryAPI(
+        str(tmp_path / 'library.json'), cache_file=None, index_file=None,
+        author_cache=AuthorCache(), negative_cache=NegativeCache(),
+        circuit_breaker=CircuitBreaker())
+    library._client = httpx.Client(
+        base_url=library.api_base_url, transport=open_library.transport())
+    library._make_async_client = lambda: httpx.AsyncClient(
+        base_url=library.api_base_url, transport=open_library.transport())
+    yield library
+    library.close()
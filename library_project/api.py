@@ -6,20 +6,37 @@ FastAPI ile web servisi
 
 import sys
 import os
+import json
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 
 # src klasörünü Python path'ine ekle
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Ortak modüller (indeksler, önbellekler, depolama) kök src klasöründe
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import httpx
+from async_library import AsyncLibrary
+from author_cache import AuthorCache
+from encoded_body import EncodedBody, accepted_encodings, choose_encoding, gzip_chunks, iter_ndjson
+from isbn import is_valid_isbn
 from library_api import LibraryAPI
+from query_cache import QueryCache
 from book import Book
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Uygulama ömrü: HTTP bağlantı havuzu açılışta kurulur, kapanışta kapatılır"""
+    library.async_client  # bağlantı havuzunu ilk istekten önce oluştur
+    yield
+    await async_library.aclose()
+
 # FastAPI uygulaması oluştur
 app = FastAPI(
+    lifespan=lifespan,
     title="📚 Kütüphane Yönetim Sistemi API",
     description="Python 202 Bootcamp projesi - FastAPI ile geliştirilmiş kütüphane yönetim sistemi",
     version="3.0.0",
@@ -59,20 +76,73 @@ class BookList(BaseModel):
     books: List[BookResponse] = Field(..., description="Kitap listesi")
     total: int = Field(..., description="Toplam kitap sayısı")
 
+class BookPage(BookList):
+    """İmleç tabanlı kitap sayfası modeli"""
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfanın imleci; son sayfada boş")
+
+class SearchResultList(BookList):
+    """Sayfalı ve alaka puanına göre sıralı arama sonucu modeli"""
+    limit: int = Field(..., description="Sayfadaki maksimum kitap sayısı")
+    offset: int = Field(..., description="Atlanan sonuç sayısı")
+
+class SuggestionList(BaseModel):
+    """Otomatik tamamlama öneri modeli"""
+    suggestions: List[str] = Field(..., description="Başlık ve yazar önerileri")
+    query: str = Field(..., description="Aranan önek")
+
 class MessageResponse(BaseModel):
     """Mesaj yanıt modeli"""
     message: str = Field(..., description="Yanıt mesajı")
     success: bool = Field(..., description="İşlem başarılı mı?")
 
 class StatsResponse(BaseModel):
-    """İstatistik yanıt modeli"""
+    """İstatistik yanıt modeli (sadece kütüphane değişince değişen bilgiler)"""
     total_books: int = Field(..., description="Toplam kitap sayısı")
     filename: str = Field(..., description="Veri dosyası adı")
     file_exists: bool = Field(..., description="Dosya mevcut mu?")
     api_base_url: str = Field(..., description="API temel URL'i")
 
+class CacheStatsResponse(BaseModel):
+    """Önbellek sayaçları yanıt modeli"""
+    cache_hits: int = Field(0, description="Sorgu önbelleği isabet sayısı")
+    cache_misses: int = Field(0, description="Sorgu önbelleği ıskalama sayısı")
+    author_cache_hit_ratio: float = Field(0.0, description="Yazar adı önbelleği isabet oranı")
+    circuit_breaker: str = Field("closed", description="Open Library devre kesici durumu")
+
+class HealthResponse(MessageResponse):
+    """Sağlık kontrolü yanıt modeli"""
+    circuit_breaker: Dict[str, Any] = Field(..., description="Open Library devre kesici durumu")
+
 # Global kütüphane nesnesi
-library = LibraryAPI()
+# Yazar adları çalıştırmalar arasında korunur; kapanışta kaydedilir. Önbellek
+# dosyaları (HTTP, döküm dizini, yazarlar) kütüphane dosyasının yanında tutulur
+LIBRARY_FILE = "library.json"
+DATA_DIR = os.path.dirname(os.path.abspath(LIBRARY_FILE))
+library = LibraryAPI(LIBRARY_FILE, journal=True,
+                     author_cache=AuthorCache(filename=os.path.join(DATA_DIR, "author_cache.json")))
+# Route'lar değişiklikleri ve ISBN aramalarını event loop'u bloklamayan
+# async cephe üzerinden yapar
+async_library = AsyncLibrary(library)
+# GET /books sayfalarının JSON baytları (ve sıkıştırılmış hâlleri); kütüphane
+# sürümüyle saklanır, değişiklikten sonraki ilk istekte yeniden üretilir
+listing_cache = QueryCache(max_entries=128, max_bytes=32 * 1024 * 1024)
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    İstemcideki kopya güncelse (If-None-Match) gövdesiz 304 yanıtı döndürür
+    
+    Args:
+        request (Request): Gelen istek
+        etag (str): Güncel ETag değeri (tırnaksız)
+        
+    Returns:
+        Optional[Response]: 304 yanıtı veya None
+    """
+    header = request.headers.get('if-none-match', '')
+    tags = {tag.strip().removeprefix('W/').strip('"') for tag in header.split(',')}
+    if etag in tags or '*' in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': f'"{etag}"'})
+    return None
 
 @app.get("/", response_model=MessageResponse)
 async def root():
@@ -82,40 +152,83 @@ async def root():
         success=True
     )
 
-@app.get("/books", response_model=BookList)
-async def get_books():
-    """Kütüphanedeki tüm kitapları listeler"""
-    books = library.books
-    book_responses = [
-        BookResponse(
-            title=book.title,
-            author=book.author,
-            isbn=book.isbn
-        ) for book in books
-    ]
+@app.get("/books", response_model=BookPage)
+async def get_books(request: Request, cursor: Optional[str] = None,
+                    limit: int = Query(100, ge=1, le=1000)):
+    """
+    Kütüphanedeki kitapları ekleme sırasıyla sayfa sayfa listeler
     
-    return BookList(
-        books=book_responses,
-        total=len(books)
-    )
+    Sonraki sayfa için yanıttaki next_cursor değeri ?cursor= ile gönderilir.
+    Kütüphane değişmediyse If-None-Match isteğine 304 döner. Yanıt gövdesi
+    önceden kodlanmış baytlardan (istemci destekliyorsa gzip/brotli)
+    doğrudan gönderilir; model oluşturma ve JSON kodlama yapılmaz.
+    """
+    encoding = choose_encoding(request.headers.get('accept-encoding', ''))
+    version = library.version
+    etag = await async_library.etag('books', cursor, limit)
+    if encoding != 'identity':
+        # Sıkıştırılmış hâl farklı baytlardır; güçlü ETag'i de farklı olmalı
+        etag = f"{etag}-{encoding}"
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    hit, body = listing_cache.get(('books', cursor, limit), version)
+    if not hit:
+        try:
+            books, next_cursor = await async_library.page_books(cursor, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        
+        # BookPage ile aynı alanlar; FastAPI'nin JSONResponse biçimiyle kodlanır
+        data = {
+            'books': [book.to_dict() for book in books],
+            'total': len(library),
+            'next_cursor': next_cursor
+        }
+        body = EncodedBody(json.dumps(
+            data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        # Sıkıştırılmış hâller için de yer ayrılır
+        listing_cache.put(('books', cursor, limit), version, body, 2 * body.size)
+    
+    headers = {'ETag': f'"{etag}"', 'Vary': 'Accept-Encoding'}
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return Response(content=body.get(encoding), media_type='application/json',
+                    headers=headers)
 
 @app.post("/books", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
 async def create_book(book_data: BookCreate):
     """ISBN ile yeni kitap ekler (Open Library API'den)"""
     try:
         # ISBN kontrolü
-        if library.find_book(book_data.isbn):
+        if await async_library.find_book(book_data.isbn):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Bu ISBN ({book_data.isbn}) zaten kütüphanede mevcut!"
             )
         
-        # API'den kitap ekle
-        success = library.add_book_by_isbn(book_data.isbn)
+        # Kontrol basamağı hatalı ISBN'ler API'ye sorulmaz
+        if not is_valid_isbn(book_data.isbn):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Geçersiz ISBN: {book_data.isbn}"
+            )
+        
+        # API'den kitap ekle; ağ isteği async yapılır, dosya yazımı thread'de
+        # çalışır. Aynı ISBN'i aynı anda ekleyen istekler tek API isteğini paylaşır
+        success = await async_library.add_book_by_isbn(book_data.isbn)
+        
+        if not success and await async_library.find_book(book_data.isbn):
+            # Eşzamanlı başka bir istek aynı kitabı eklemiş
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Bu ISBN ({book_data.isbn}) zaten kütüphanede mevcut!"
+            )
         
         if success:
             # Eklenen kitabı bul
-            added_book = library.find_book(book_data.isbn)
+            added_book = await async_library.find_book(book_data.isbn)
             if added_book:
                 return BookResponse(
                     title=added_book.title,
@@ -145,7 +258,7 @@ async def create_book(book_data: BookCreate):
 async def delete_book(isbn: str):
     """ISBN ile kitap siler"""
     try:
-        success = library.remove_book(isbn)
+        success = await async_library.remove_book(isbn)
         
         if success:
             return MessageResponse(
@@ -166,10 +279,44 @@ async def delete_book(isbn: str):
             detail=f"Kitap silinirken hata oluştu: {str(e)}"
         )
 
+@app.get("/books/export")
+async def export_books(request: Request, export_format: str = Query("ndjson", alias="format")):
+    """
+    Tüm kataloğu NDJSON (satır başına bir kitap) olarak akış halinde gönderir
+    
+    Kitaplar parça parça okunup kodlanır; yanıt chunked olarak gönderildiği
+    için bellek kullanımı katalog boyutundan bağımsızdır. İstemci kabul
+    ediyorsa akış gzip ile sıkıştırılır.
+    """
+    if export_format != "ndjson":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Desteklenmeyen format: {export_format} (sadece ndjson)"
+        )
+    
+    # Senkron üreteç Starlette tarafından thread havuzunda dolaşılır
+    chunks = iter_ndjson(book.to_dict() for book in library.iter_books())
+    headers = {'Vary': 'Accept-Encoding'}
+    if 'gzip' in accepted_encodings(request.headers.get('accept-encoding', '')):
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(chunks, media_type='application/x-ndjson', headers=headers)
+
+@app.get("/books/suggest", response_model=SuggestionList)
+async def suggest_books(q: str = "", limit: int = Query(10, ge=1, le=50)):
+    """Başlık ve yazar adları için otomatik tamamlama önerileri"""
+    prefix = q.strip()
+    suggestions = await async_library.suggest(prefix, limit) if prefix else []
+    
+    return SuggestionList(
+        suggestions=suggestions,
+        query=prefix
+    )
+
 @app.get("/books/{isbn}", response_model=BookResponse)
 async def get_book(isbn: str):
     """ISBN ile belirli bir kitabı getirir"""
-    book = library.find_book(isbn)
+    book = await async_library.find_book(isbn)
     
     if book:
         return BookResponse(
@@ -183,10 +330,19 @@ async def get_book(isbn: str):
             detail=f"ISBN {isbn} ile kitap bulunamadı"
         )
 
-@app.get("/books/search/{keyword}", response_model=BookList)
-async def search_books(keyword: str):
-    """Anahtar kelime ile kitap arar"""
-    found_books = library.search_books(keyword)
+@app.get("/books/search/{keyword}", response_model=SearchResultList)
+async def search_books(keyword: str, fuzzy: bool = False,
+                       max_distance: int = Query(2, ge=0, le=3),
+                       limit: int = Query(50, ge=1, le=200),
+                       offset: int = Query(0, ge=0)):
+    """
+    Anahtar kelime ile kitap arar
+    
+    Sonuçlar BM25 alaka puanına göre sıralanır ve limit/offset ile
+    sayfalanır; ?fuzzy=true yazım hatalarına dayanıklı arama yapar.
+    """
+    found_books, total = await async_library.ranked_search(
+        keyword, limit=limit, offset=offset, fuzzy=fuzzy, max_distance=max_distance)
     
     book_responses = [
         BookResponse(
@@ -196,16 +352,29 @@ async def search_books(keyword: str):
         ) for book in found_books
     ]
     
-    return BookList(
+    return SearchResultList(
         books=book_responses,
-        total=len(found_books)
+        total=total,
+        limit=limit,
+        offset=offset
     )
 
 @app.get("/stats", response_model=StatsResponse)
-async def get_stats():
-    """Kütüphane istatistiklerini döndürür"""
-    stats = library.get_stats()
+async def get_stats(request: Request, response: Response):
+    """
+    Kütüphane istatistiklerini döndürür
+    
+    ETag kütüphane sürümünden üretilir; istemcideki kopya güncelse
+    istatistik hesaplanmadan 304 döner. Her istekte değişen sayaçlar
+    /stats/cache adresindedir.
+    """
+    etag = await async_library.etag('stats')
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
     
+    stats = library.get_catalog_stats()
+    response.headers['ETag'] = f'"{etag}"'
     return StatsResponse(
         total_books=stats['total_books'],
         filename=stats['filename'],
@@ -213,16 +382,35 @@ async def get_stats():
         api_base_url=stats['api_base_url']
     )
 
-@app.get("/health", response_model=MessageResponse)
+@app.get("/stats/cache", response_model=CacheStatsResponse)
+async def get_cache_stats():
+    """Önbellek sayaçlarını ve devre kesici durumunu döndürür (önbelleklenmez)"""
+    stats = library.get_cache_stats()
+    
+    return CacheStatsResponse(
+        cache_hits=stats['cache_hits'],
+        cache_misses=stats['cache_misses'],
+        author_cache_hit_ratio=stats['author_cache_hit_ratio'],
+        circuit_breaker=stats['circuit_breaker']
+    )
+
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
     """API sağlık kontrolü"""
     try:
         # Basit sağlık kontrolü
         stats = library.get_stats()
+        breaker = library.circuit_breaker.get_stats()
         
-        return MessageResponse(
-            message="API çalışıyor ve sağlıklı",
-            success=True
+        # Open Library erişilemese de yerel API çalışmaya devam eder
+        if breaker['state'] == 'closed':
+            message = "API çalışıyor ve sağlıklı"
+        else:
+            message = "API çalışıyor; Open Library geçici olarak erişilemiyor"
+        return HealthResponse(
+            message=message,
+            success=True,
+            circuit_breaker=breaker
         )
     except Exception as e:
         raise HTTPException(
@@ -234,7 +422,8 @@ async def health_check():
 async def test_api_connection():
     """Open Library API bağlantısını test eder"""
     try:
-        if library.test_api_connection():
+        # Senkron istemci (yeniden denemeler ve bekleme süreleri) event loop'u bloklardı
+        if await library.test_api_connection_async():
             return MessageResponse(
                 message="Open Library API'ye bağlantı başarılı",
                 success=True
@@ -9,6 +9,8 @@ import os
 
 # src klasörünü Python path'ine ekle
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Ortak modüller (indeksler, önbellekler, depolama) kök src klasöründe
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from library import Library
 from book import Book
@@ -4,14 +4,19 @@ Kütüphane Yönetim Sistemi - Aşama 2
 API entegrasyonu ile geliştirilmiş terminal uygulaması
 """
 
+import argparse
 import sys
 import os
+from typing import List
 
 # src klasörünü Python path'ine ekle
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Ortak modüller (indeksler, önbellekler, depolama) kök src klasöründe
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from library_api import LibraryAPI
 from book import Book
+from dump_index import DumpIndex
 
 def clear_screen():
     """Ekranı temizler"""
@@ -190,8 +195,123 @@ def test_api_connection(library: LibraryAPI):
         print("🌐 Open Library API'ye erişim yok.")
         print("💡 İnternet bağlantınızı kontrol edin.")
 
+def read_isbns(source: str) -> List[str]:
+    """
+    ISBN listesini dosyadan veya stdin'den okur
+    
+    Her satırda bir veya virgül/boşlukla ayrılmış birden çok ISBN olabilir;
+    boş satırlar ve '#' ile başlayan yorumlar atlanır.
+    
+    Args:
+        source (str): Dosya yolu veya stdin için '-'
+        
+    Returns:
+        List[str]: ISBN'ler
+    """
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as file:
+            lines = file.read().splitlines()
+    
+    isbns = []
+    for line in lines:
+        line = line.split('#', 1)[0]
+        isbns.extend(part for part in line.replace(',', ' ').split() if part)
+    return isbns
+
+def import_isbns(library: LibraryAPI, source: str, concurrency: int) -> int:
+    """
+    ISBN listesini API'den toplu olarak içe aktarır
+    
+    Args:
+        library (LibraryAPI): Kütüphane nesnesi
+        source (str): ISBN dosyası veya stdin için '-'
+        concurrency (int): Aynı anda yapılacak maksimum API isteği
+        
+    Returns:
+        int: Çıkış kodu (bulunamayan ISBN varsa 1)
+    """
+    try:
+        isbns = read_isbns(source)
+    except OSError as e:
+        print(f"❌ ISBN dosyası okunamadı: {e}")
+        return 1
+    
+    if not isbns:
+        print("❌ İçe aktarılacak ISBN bulunamadı!")
+        return 1
+    
+    print(f"⏳ {len(isbns)} ISBN için Open Library API'den bilgiler çekiliyor...")
+    report = library.add_books_by_isbn(isbns, concurrency=concurrency)
+    
+    failed = [isbn for isbn, result in report.items() if result not in ('added', 'exists')]
+    for isbn in failed:
+        print(f"❌ {isbn}: {report[isbn]}")
+    return 1 if failed else 0
+
+def ingest_dumps(paths: List[str], index_file: str) -> int:
+    """
+    Open Library döküm dosyalarını yerel ISBN dizinine aktarır
+    
+    Args:
+        paths (List[str]): Döküm dosyaları (editions, works, authors; .gz olabilir)
+        index_file (str): Dizin veritabanı dosyası
+        
+    Returns:
+        int: Çıkış kodu (okunamayan dosya varsa 1)
+    """
+    index = DumpIndex(index_file)
+    exit_code = 0
+    try:
+        for path in paths:
+            print(f"⏳ {path} dizine aktarılıyor...")
+            try:
+                counts = index.ingest(path)
+            except (OSError, EOFError) as e:
+                print(f"❌ Döküm dosyası okunamadı: {e}")
+                exit_code = 1
+                continue
+            print(f"✅ {counts['isbns']} ISBN, {counts['works']} eser, "
+                  f"{counts['authors']} yazar aktarıldı")
+    finally:
+        index.close()
+    return exit_code
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Komut satırı argümanlarını ayrıştırır; argüman yoksa menü açılır"""
+    parser = argparse.ArgumentParser(description="📚 Kütüphane Yönetim Sistemi")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    import_parser = subparsers.add_parser(
+        'import', help="ISBN listesini dosyadan veya stdin'den toplu ekle")
+    import_parser.add_argument(
+        'source', nargs='?', default='-', help="ISBN dosyası (varsayılan: '-' yani stdin)")
+    import_parser.add_argument(
+        '-c', '--concurrency', type=int, default=8, help="Eşzamanlı API isteği sayısı")
+    import_parser.add_argument(
+        '-f', '--file', default='library.json', help="Kütüphane veri dosyası")
+    
+    ingest_parser = subparsers.add_parser(
+        'ingest-dump', help="Open Library döküm dosyalarından yerel ISBN dizini kur")
+    ingest_parser.add_argument(
+        'dumps', nargs='+', help="Döküm dosyaları (ör. ol_dump_editions_latest.txt.gz)")
+    ingest_parser.add_argument(
+        '-i', '--index', default='openlibrary_index.sqlite', help="Dizin veritabanı dosyası")
+    
+    return parser.parse_args(argv)
+
 def main():
     """Ana uygulama fonksiyonu"""
+    args = parse_args()
+    if args.command == 'ingest-dump':
+        sys.exit(ingest_dumps(args.dumps, args.index))
+    if args.command == 'import':
+        library = LibraryAPI(args.file)
+        exit_code = import_isbns(library, args.source, args.concurrency)
+        library.close()
+        sys.exit(exit_code)
+    
     clear_screen()
     print_header()
     
@@ -239,6 +359,9 @@ def main():
         except Exception as e:
             print(f"\n❌ Beklenmeyen hata: {e}")
             input("Devam etmek için Enter'a basın...")
+    
+    # API bağlantı havuzunu kapat
+    library.close()
 
 if __name__ == "__main__":
     main()
@@ -1,22 +1,118 @@
+import asyncio
+import base64
+import bisect
+import functools
+import hashlib
+import heapq
 import json
 import os
-from typing import List, Optional
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from book import Book
+from journal import Journal
+from query_cache import QueryCache
+from sqlite_storage import SQLiteStorage, is_sqlite_filename
+from search_index import (FuzzyIndex, InvertedIndex, PrefixIndex, RankingIndex,
+                          TrigramIndex, normalize, search_key)
+
+def _synchronized(method):
+    """Kütüphanenin bellekteki durumuna erişen metodları kütüphane kilidi altında çalıştırır"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _in_event_loop() -> bool:
+    """Çalışan bir event loop içinde miyiz? (orada sonucu senkron beklemek loop'u bloklar)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def _encode_cursor(position: int, isbn: str) -> str:
+    """Sayfanın son kitabının sırasını ve ISBN'ini opak bir imlece çevirir"""
+    raw = json.dumps([position, isbn], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    """İmleci (sıra, ISBN) ikilisine çözer; geçersizse ValueError fırlatır"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position, isbn = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Geçersiz imleç: {cursor}") from e
+    if not isinstance(position, int) or not isinstance(isbn, str):
+        raise ValueError(f"Geçersiz imleç: {cursor}")
+    return position, isbn
 
 class Library:
     """Kütüphane sınıfı - tüm kütüphane operasyonlarını yönetir"""
     
-    def __init__(self, filename: str = "library.json"):
+    def __init__(self, filename: str = "library.json", journal: bool = False,
+                 compact_threshold: int = 500):
         """
         Library sınıfının constructor'ı
         
         Args:
-            filename (str): Kitapların saklanacağı JSON dosya adı
+            filename (str): Kitapların saklanacağı dosya adı. '.sqlite',
+                '.sqlite3' veya '.db' uzantılı ise kitaplar bellekte
+                tutulmaz, doğrudan SQLite veritabanında saklanır
+            journal (bool): True ise değişiklikler '<filename>.journal'
+                dosyasına eklenir, JSON dosyası her işlemde yeniden yazılmaz
+                (SQLite deposunda kullanılmaz)
+            compact_threshold (int): Günlük bu kadar kayda ulaşınca JSON
+                dosyasına sıkıştırılır
         """
         self.filename = filename
-        self.books: List[Book] = []
+        # ISBN -> Book; dict ekleme sırasını koruduğu için liste yerine kullanılır
+        self._books: Dict[str, Book] = {}
+        # ISBN -> ekleme sıra numarası; indeks sonuçlarını sıralamak için
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        # Sıralı indeks: artan sıra numaraları ve sıra -> ISBN; sayfalama
+        # ikili arama ile başlangıcı bulur, maliyeti sayfa boyutuna bağlıdır.
+        # Silinen numaralar listeden hemen çıkarılmaz (O(n)); sadece
+        # _seq_isbn'den silinir ve sayıları yarıyı geçince liste toplu temizlenir
+        self._order: List[int] = []
+        self._seq_isbn: Dict[int, str] = {}
+        self._dead_order = 0
+        # ISBN -> normalize edilmiş arama anahtarı (ekleme anında bir kez hesaplanır)
+        self._search_keys: Dict[str, str] = {}
+        self._index = InvertedIndex()
+        self._trigrams = TrigramIndex()
+        self._prefixes = PrefixIndex()
+        self._fuzzy = FuzzyIndex()
+        self._ranking = RankingIndex()
+        self.db: Optional[SQLiteStorage] = None
+        self.journal: Optional[Journal] = None
+        if is_sqlite_filename(filename):
+            self.db = SQLiteStorage(filename)
+        elif journal:
+            self.journal = Journal(filename + '.journal')
+        self.compact_threshold = compact_threshold
+        # Her değişiklikte artan sürüm numarası; önbellek girişlerini geçersiz kılar
+        self.version = 0
+        # Sürüm her açılışta sıfırdan başlar; ETag'ler farklı süreçler veya
+        # yeniden başlatmalar arasında çakışmasın diye rastgele önek alır
+        self._etag_prefix = os.urandom(4).hex()
+        self._cache = QueryCache()
+        # Web sunucuları istekleri farklı thread'lerde işler; değişiklikler
+        # sırayla uygulanır, okumalar da yarım kalmış bir değişikliği veya
+        # dolaşılırken değişen bir indeksi görmesin diye aynı kilidi alır
+        self._lock = threading.RLock()
         self.load_books()
     
+    @property
+    def books(self) -> List[Book]:
+        """Kütüphanedeki tüm kitaplar (ekleme sırasıyla)"""
+        if self.db is not None:
+            return self.db.all_books()
+        with self._lock:
+            return list(self._books.values())
+    
+    @_synchronized
     def add_book(self, book: Book) -> bool:
         """
         Yeni bir kitabı kütüphaneye ekler
@@ -27,16 +123,26 @@ class Library:
         Returns:
             bool: İşlem başarılı mı?
         """
-        # ISBN kontrolü - aynı ISBN varsa ekleme
-        if self.find_book(book.isbn):
+        if self.db is not None:
+            if not self.db.insert(book):
+                print(f"Bu ISBN ({book.isbn}) zaten kütüphanede mevcut!")
+                return False
+            self.version += 1
+            print(f"Kitap başarıyla eklendi: {book}")
+            return True
+        
+        # ISBN kontrolü - aynı ISBN varsa ekleme (O(1) sözlük araması)
+        if book.isbn in self._books:
             print(f"Bu ISBN ({book.isbn}) zaten kütüphanede mevcut!")
             return False
         
-        self.books.append(book)
-        self.save_books()
+        self._insert(book)
+        self.version += 1
+        self._record({'op': 'add', 'book': book.to_dict()})
         print(f"Kitap başarıyla eklendi: {book}")
         return True
     
+    @_synchronized
     def remove_book(self, isbn: str) -> bool:
         """
         ISBN numarasına göre kitabı kütüphaneden siler
@@ -47,25 +153,65 @@ class Library:
         Returns:
             bool: İşlem başarılı mı?
         """
-        book = self.find_book(isbn)
+        if self.db is not None:
+            book = self.db.get(isbn)
+            if book:
+                self.db.delete(isbn)
+        else:
+            # Sözlükten O(1) silme - liste taraması gerekmez
+            book = self._delete(isbn)
+            if book:
+                self._record({'op': 'remove', 'isbn': isbn})
+        
         if book:
-            self.books.remove(book)
-            self.save_books()
+            self.version += 1
             print(f"Kitap başarıyla silindi: {book}")
             return True
         else:
             print(f"ISBN {isbn} ile kitap bulunamadı.")
             return False
     
+    @_synchronized
+    def update_book(self, isbn: str, title: str, author: str) -> Optional[Book]:
+        """
+        ISBN numarasına göre kitabın başlık ve yazar bilgisini günceller
+        
+        Args:
+            isbn (str): Güncellenecek kitabın ISBN'i
+            title (str): Yeni başlık
+            author (str): Yeni yazar adı
+            
+        Returns:
+            Optional[Book]: Güncellenen kitap veya None
+        """
+        book = self.find_book(isbn)
+        if not book:
+            print(f"ISBN {isbn} ile kitap bulunamadı.")
+            return None
+        
+        self.version += 1
+        if self.db is not None:
+            book.title = title
+            book.author = author
+            self.db.update(book)
+            return book
+        
+        self._set_fields(book, title, author)
+        self._record({'op': 'update', 'book': book.to_dict()})
+        return book
+    
+    @_synchronized
     def list_books(self) -> None:
         """Kütüphanedeki tüm kitapları listeler"""
-        if not self.books:
+        total = self._count()
+        if not total:
             print("Kütüphanede hiç kitap bulunmuyor.")
             return
         
-        print(f"\n📚 Kütüphanede {len(self.books)} kitap bulunuyor:")
+        books = self.db.iter_books() if self.db is not None else self._books.values()
+        print(f"\n📚 Kütüphanede {total} kitap bulunuyor:")
         print("-" * 60)
-        for i, book in enumerate(self.books, 1):
+        for i, book in enumerate(books, 1):
             print(f"{i}. {book}")
         print("-" * 60)
     
@@ -79,60 +225,545 @@ class Library:
         Returns:
             Optional[Book]: Bulunan kitap veya None
         """
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        if self.db is not None:
+            return self.db.get(isbn)
+        
+        return self._books.get(isbn)
     
-    def search_books(self, keyword: str) -> List[Book]:
+    @_synchronized
+    def search_books(self, keyword: str, fuzzy: bool = False,
+                     max_distance: int = 2) -> List[Book]:
         """
         Başlık veya yazar adında anahtar kelime arar
         
+        Arama büyük/küçük harf, Türkçe I/ı ve aksan duyarsızdır; terim ve
+        kitaplar aynı normalize işleminden geçer.
+        
         Args:
             keyword (str): Aranacak anahtar kelime
+            fuzzy (bool): True ise yazım hatalı kelimeler de eşleşir
+                ("Rowlling" -> "Rowling")
+            max_distance (int): Bulanık aramada kelime başına izin verilen
+                en büyük düzenleme mesafesi
             
         Returns:
             List[Book]: Bulunan kitaplar listesi
         """
-        keyword = keyword.lower()
-        found_books = []
+        keyword = normalize(keyword)
+        cache_key = ('search', keyword, fuzzy, max_distance)
+        hit, found_books = self._cache.get(cache_key, self.version)
+        if not hit:
+            version = self.version
+            if self.db is not None:
+                # SQLite deposunda bulanık arama yok, tam eşleşme yapılır
+                found_books = self.db.search(keyword)
+            else:
+                found_books = self._in_order(self._matching_isbns(keyword, fuzzy, max_distance))
+            self._cache.put(cache_key, version, found_books, self._result_size(found_books))
+        
+        # Önbellekteki liste çağıranın değişikliklerinden korunur
+        return list(found_books)
+    
+    @_synchronized
+    def ranked_search(self, keyword: str, limit: int = 20, offset: int = 0,
+                      fuzzy: bool = False, max_distance: int = 2) -> Tuple[List[Book], int]:
+        """
+        Arama sonuçlarını BM25 alaka puanına göre sıralayıp bir sayfa döndürür
+        
+        Tüm sonuçlar sıralanmaz; sadece ilk offset + limit sonuç sınırlı bir
+        heap ile seçilir. Eşit puanlı kitaplar ekleme sırasını korur.
+        
+        Args:
+            keyword (str): Aranacak anahtar kelime
+            limit (int): Sayfadaki maksimum kitap sayısı
+            offset (int): Atlanacak sonuç sayısı
+            fuzzy (bool): Yazım hatalarına dayanıklı arama
+            max_distance (int): Bulanık aramada izin verilen mesafe
+            
+        Returns:
+            Tuple[List[Book], int]: (sayfadaki kitaplar, toplam eşleşme sayısı)
+        """
+        keyword = normalize(keyword)
+        cache_key = ('ranked', keyword, limit, offset, fuzzy, max_distance)
+        hit, result = self._cache.get(cache_key, self.version)
+        if hit:
+            return list(result[0]), result[1]
+        
+        version = self.version
+        if self.db is not None:
+            # SQLite deposunda puanlama yok, ekleme sırası kullanılır
+            found_books = self.search_books(keyword)
+            page, total = found_books[offset:offset + limit], len(found_books)
+        else:
+            found = self._matching_isbns(keyword, fuzzy, max_distance)
+            scores = self._ranking.scores(found, keyword)
+            seq = self._seq
+            top = heapq.nsmallest(offset + limit, found,
+                                  key=lambda isbn: (-scores[isbn], seq[isbn]))
+            page, total = [self._books[isbn] for isbn in top[offset:]], len(found)
+        
+        self._cache.put(cache_key, version, (page, total), self._result_size(page))
+        return list(page), total
+    
+    @_synchronized
+    def page_books(self, cursor: Optional[str] = None,
+                   limit: int = 50) -> Tuple[List[Book], Optional[str]]:
+        """
+        Kitapları ekleme sırasıyla, imleç tabanlı sayfalar halinde döndürür
         
-        for book in self.books:
-            if (keyword in book.title.lower() or 
-                keyword in book.author.lower() or
-                keyword in book.isbn):
-                found_books.append(book)
+        İmleç sayfanın son kitabını gösterir; araya ekleme veya silme
+        yapılsa da sonraki sayfa kaymaz. İmlecin gösterdiği kitap silinmişse
+        kaydedilen sıra numarasından devam edilir.
         
-        return found_books
+        Args:
+            cursor (Optional[str]): Önceki sayfadan dönen imleç; None ise baştan
+            limit (int): Sayfadaki maksimum kitap sayısı
+            
+        Returns:
+            Tuple[List[Book], Optional[str]]: (sayfadaki kitaplar, sonraki
+                sayfanın imleci; son sayfada None)
+            
+        Raises:
+            ValueError: İmleç geçersizse
+        """
+        position, isbn = _decode_cursor(cursor) if cursor else (-1, '')
+        limit = max(1, limit)
+        
+        if self.db is not None:
+            rows = self.db.page(position, limit + 1)
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            page = [book for _, book in rows]
+            last = rows[-1] if rows else None
+        else:
+            order = self._order
+            # Dosya yeniden yüklenince sıra numaraları baştan verilir; imlecin
+            # kitabı daha küçük bir numarayla duruyorsa oradan devam edilir.
+            # Silinip yeniden eklenen kitap ise daha büyük numara alır; o
+            # durumda imleçteki numara kullanılır, aradaki kitaplar atlanmaz
+            current = self._seq.get(isbn)
+            if current is not None and current < position:
+                position = current
+            start = bisect.bisect_right(order, position)
+            # Silinmiş numaralar atlanır; sonraki sayfanın varlığını bilmek
+            # için bir kitap fazla okunur
+            rows = []
+            for i in range(start, len(order)):
+                seq = order[i]
+                book = self._books.get(self._seq_isbn.get(seq))
+                if book is not None:
+                    rows.append((seq, book))
+                    if len(rows) > limit:
+                        break
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            page = [book for _, book in rows]
+            last = rows[-1] if rows else None
+        
+        next_cursor = _encode_cursor(last[0], last[1].isbn) if has_more and last else None
+        return page, next_cursor
+    
+    def iter_books(self, batch_size: int = 1000) -> Iterator[Book]:
+        """
+        Tüm kitapları ekleme sırasıyla, parça parça döndürür
+        
+        ``books`` özelliğinin aksine tüm listenin kopyası oluşturulmaz;
+        kitaplar imleçli sayfalarla okunduğu için bellek kullanımı katalog
+        boyutundan bağımsızdır ve dolaşma sırasında yapılan değişiklikler
+        hataya yol açmaz.
+        
+        Args:
+            batch_size (int): Tek seferde okunacak kitap sayısı
+            
+        Returns:
+            Iterator[Book]: Kitaplar
+        """
+        if self.db is not None:
+            yield from self.db.iter_books(batch_size)
+            return
+        
+        cursor = None
+        while True:
+            page, cursor = self.page_books(cursor, batch_size)
+            yield from page
+            if cursor is None:
+                return
+    
+    @_synchronized
+    def etag(self, *parts) -> str:
+        """
+        Güncel sürümden güçlü bir ETag değeri üretir (tırnaksız)
+        
+        Kitaplara dokunmadan ve hiçbir şey serileştirmeden hesaplanır;
+        kütüphane değişene kadar aynı kalır. Aynı sürümdeki farklı yanıtlar
+        (ör. farklı sayfalar) ``parts`` ile ayırt edilir.
+        
+        Args:
+            *parts: Yanıtı belirleyen ek değerler (uç nokta adı, sayfa imleci...)
+            
+        Returns:
+            str: ETag değeri
+        """
+        tag = f"{self._etag_prefix}-{self.version}"
+        if parts:
+            digest = hashlib.blake2s(repr(parts).encode('utf-8'), digest_size=6).hexdigest()
+            tag = f"{tag}-{digest}"
+        return tag
+    
+    def _matching_isbns(self, keyword: str, fuzzy: bool, max_distance: int) -> Set[str]:
+        """
+        Normalize edilmiş terimle eşleşen kitapların ISBN kümesini döndürür
+        
+        Args:
+            keyword (str): Normalize edilmiş arama terimi
+            fuzzy (bool): Bulanık eşleşmeleri de ekle
+            max_distance (int): Bulanık aramada izin verilen mesafe
+            
+        Returns:
+            Set[str]: Eşleşen ISBN'ler
+        """
+        # İndeksler aday kümesini daraltır, eşleşme kuralı değişmez:
+        # 3+ karakterde üçlü indeksi, daha kısa terimlerde kelime indeksi
+        candidates = self._trigrams.candidates(keyword)
+        if candidates is None:
+            candidates = self._index.candidates(keyword)
+        if candidates is None:
+            candidates = self._books.keys()
+        
+        search_keys = self._search_keys
+        found = {isbn for isbn in candidates if keyword in search_keys[isbn]}
+        if fuzzy:
+            found |= self._fuzzy.candidates(keyword, max_distance)
+        return found
+    
+    @_synchronized
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Önekle başlayan başlık ve yazar adlarını önerir (otomatik tamamlama)
+        
+        Args:
+            prefix (str): Kullanıcının yazdığı önek
+            limit (int): Maksimum öneri sayısı
+            
+        Returns:
+            List[str]: Alfabetik sırayla öneriler
+        """
+        if self.db is not None:
+            return self.db.suggest(prefix, limit)
+        return self._prefixes.suggest(prefix, limit)
     
+    @_synchronized
     def load_books(self) -> None:
-        """JSON dosyasından kitapları yükler"""
+        """JSON dosyasından kitapları yükler, varsa günlüğü üzerine uygular"""
+        self.version += 1
+        if self.db is not None:
+            # SQLite deposunda belleğe yükleme yapılmaz
+            print(f"'{self.filename}' veritabanında {self.db.count()} kitap var.")
+            return
+        
+        self._clear()
         if not os.path.exists(self.filename):
             print(f"'{self.filename}' dosyası bulunamadı. Yeni kütüphane oluşturuluyor.")
-            return
+        else:
+            try:
+                with open(self.filename, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                    # Önek indeksi tüm anahtarları aldıktan sonra bir kez sıralanır
+                    with self._prefixes.bulk():
+                        for book_data in data:
+                            book = Book.from_dict(book_data)
+                            # Dosyada tekrar eden ISBN varsa ilk kayıt geçerlidir
+                            if book.isbn not in self._books:
+                                self._insert(book)
+                    print(f"'{self.filename}' dosyasından {len(self._books)} kitap yüklendi.")
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                print(f"Dosya okuma hatası: {e}")
+                self._clear()
         
-        try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.books = [Book.from_dict(book_data) for book_data in data]
-                print(f"'{self.filename}' dosyasından {len(self.books)} kitap yüklendi.")
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"Dosya okuma hatası: {e}")
-            self.books = []
+        if self.journal is not None and self.journal.exists():
+            for entry in self.journal.replay():
+                self._apply_entry(entry)
+            print(f"Günlükten {self.journal.entry_count} değişiklik uygulandı.")
     
+    @_synchronized
     def save_books(self) -> None:
-        """Kitap listesini JSON dosyasına kaydeder"""
+        """
+        Kitap listesini JSON dosyasına kaydeder
+        
+        Dosya önce geçici bir dosyaya yazılır ve ardından yerine taşınır;
+        böylece yarım kalmış bir yazma mevcut verinin üzerine geçmez.
+        Günlük modunda kayıt başarılı olursa günlük sıfırlanır.
+        SQLite deposunda her değişiklik zaten kaydedildiği için bir şey yapmaz.
+        """
+        # Kitaplar dışarıdan değiştirilip kaydedilmiş olabilir
+        self.version += 1
+        if self.db is not None:
+            return
+        
+        temp_filename = self.filename + '.tmp'
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump([book.to_dict() for book in self.books], 
+            with open(temp_filename, 'w', encoding='utf-8') as file:
+                json.dump([book.to_dict() for book in self._books.values()], 
                          file, ensure_ascii=False, indent=2)
+            os.replace(temp_filename, self.filename)
         except Exception as e:
             print(f"Dosya kaydetme hatası: {e}")
+            return
+        
+        if self.journal is not None:
+            self.journal.clear()
+    
+    def compact(self) -> None:
+        """Günlüğü yeni bir JSON anlık görüntüsüne katlar ve sıfırlar"""
+        self.save_books()
+    
+    def _record(self, entry: dict) -> None:
+        """
+        Bir değişikliği kalıcı hale getirir
+        
+        Günlük kapalıysa tüm liste kaydedilir; açıksa sadece küçük bir kayıt
+        eklenir ve günlük eşiği aşınca sıkıştırma yapılır.
+        
+        Args:
+            entry (dict): Değişiklik kaydı
+        """
+        if self.journal is None:
+            self.save_books()
+            return
+        
+        try:
+            self.journal.append(entry)
+        except OSError as e:
+            print(f"Günlük yazma hatası: {e}")
+            self.save_books()
+            return
+        
+        if self.journal.entry_count >= self.compact_threshold:
+            self.compact()
+    
+    def _plan_import(self, isbns: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Toplu içe aktarma için ISBN'leri ayıklar
+        
+        Boş satırlar ve tekrar eden ISBN'ler atlanır; kütüphanede zaten
+        olanlar API'ye sorulmadan 'exists' olarak işaretlenir.
+        
+        Args:
+            isbns (Iterable[str]): Ham ISBN listesi
+            
+        Returns:
+            Tuple[Dict[str, str], List[str]]: (rapor, çekilecek ISBN'ler)
+        """
+        report: Dict[str, str] = {}
+        pending: List[str] = []
+        for isbn in isbns:
+            isbn = isbn.strip()
+            if not isbn or isbn in report:
+                continue
+            if self.find_book(isbn):
+                report[isbn] = 'exists'
+            else:
+                report[isbn] = 'pending'
+                pending.append(isbn)
+        return report, pending
+    
+    def _finish_import(self, report: Dict[str, str], pending: List[str],
+                       books: List[Optional[Book]]) -> None:
+        """
+        Çekilen kitapları toplu ekler ve raporu tamamlar
+        
+        Args:
+            report (Dict[str, str]): Güncellenecek rapor
+            pending (List[str]): Çekilen ISBN'ler
+            books (List[Optional[Book]]): ISBN sırasıyla bulunan kitaplar
+        """
+        added = iter(self._add_batch([book for book in books if book is not None]))
+        for isbn, book in zip(pending, books):
+            if book is None:
+                report[isbn] = 'not_found'
+            else:
+                report[isbn] = 'added' if next(added) else 'exists'
+        
+        counts = {status: list(report.values()).count(status)
+                  for status in ('added', 'exists', 'not_found')}
+        print(f"📦 Toplu ekleme: {counts['added']} eklendi, {counts['exists']} zaten vardı, "
+              f"{counts['not_found']} bulunamadı.")
+    
+    @_synchronized
+    def _add_batch(self, books: List[Book]) -> List[bool]:
+        """
+        Kitapları tek tek kaydetmeden ekler, ardından bir kez kalıcı hale getirir
+        
+        Args:
+            books (List[Book]): Eklenecek kitaplar
+            
+        Returns:
+            List[bool]: Her kitap için eklendi mi? (ISBN zaten varsa False)
+        """
+        if self.db is not None:
+            added = self.db.insert_many(books)
+        else:
+            added = []
+            with self._prefixes.bulk():
+                for book in books:
+                    is_new = book.isbn not in self._books
+                    if is_new:
+                        self._insert(book)
+                    added.append(is_new)
+        
+        if any(added):
+            self.version += 1
+            if self.db is None:
+                # Günlük modunda da tek bir anlık görüntü yazmak yeterlidir
+                self.save_books()
+        return added
+    
+    def _apply_entry(self, entry: dict) -> None:
+        """
+        Tek bir günlük kaydını bellekteki listeye uygular
+        
+        Kayıtlar idempotenttir: sıkıştırma sırasında yarıda kalan bir
+        günlük yeniden oynatılsa bile sonuç değişmez.
+        
+        Args:
+            entry (dict): Günlük kaydı
+        """
+        op = entry.get('op')
+        if op in ('add', 'update'):
+            data = entry['book']
+            book = self._books.get(data['isbn'])
+            if book:
+                self._set_fields(book, data['title'], data['author'])
+            else:
+                self._insert(Book.from_dict(data))
+        elif op == 'remove':
+            self._delete(entry['isbn'])
+    
+    @staticmethod
+    def _result_size(items: List[Book]) -> int:
+        """Önbellek için sonucun yaklaşık bellek boyutunu (bayt) tahmin eder"""
+        size = 64
+        for book in items:
+            size += 200 + len(book.title) + len(book.author) + len(book.isbn)
+        return size
+    
+    def _in_order(self, isbns) -> List[Book]:
+        """ISBN kümesini ekleme sırasına göre kitap listesine çevirir"""
+        return [self._books[isbn] for isbn in sorted(isbns, key=self._seq.__getitem__)]
+    
+    def _insert(self, book: Book) -> None:
+        """Kitabı bellekteki sözlüğe ve arama indekslerine ekler"""
+        self._books[book.isbn] = book
+        self._seq[book.isbn] = self._next_seq
+        # Sıra numaraları hep artar; sona eklemek listeyi sıralı tutar
+        self._order.append(self._next_seq)
+        self._seq_isbn[self._next_seq] = book.isbn
+        self._next_seq += 1
+        self._index_book(book)
+    
+    def _delete(self, isbn: str) -> Optional[Book]:
+        """Kitabı bellekteki sözlükten ve arama indekslerinden çıkarır"""
+        book = self._books.pop(isbn, None)
+        if book:
+            seq = self._seq.pop(isbn)
+            del self._seq_isbn[seq]
+            # Sıralı listeden silme O(n) olurdu; numara ölü olarak kalır
+            self._dead_order += 1
+            if self._dead_order > 64 and self._dead_order * 2 > len(self._order):
+                self._compact_order()
+            self._unindex_book(isbn)
+        return book
+    
+    def _compact_order(self) -> None:
+        """Ölü sıra numaralarını sıralı listeden toplu olarak çıkarır"""
+        self._order = [seq for seq in self._order if seq in self._seq_isbn]
+        self._dead_order = 0
+    
+    def _set_fields(self, book: Book, title: str, author: str) -> None:
+        """Kitabın başlık/yazar bilgisini değiştirir ve indeksleri yeniler"""
+        self._unindex_book(book.isbn)
+        book.title = title
+        book.author = author
+        self._index_book(book)
+    
+    def _clear(self) -> None:
+        """Bellekteki tüm kitapları ve indeksleri temizler"""
+        self._books = {}
+        self._seq = {}
+        self._next_seq = 0
+        self._order = []
+        self._seq_isbn = {}
+        self._dead_order = 0
+        self._search_keys = {}
+        self._index.clear()
+        self._trigrams.clear()
+        self._prefixes.clear()
+        self._fuzzy.clear()
+        self._ranking.clear()
+    
+    def _index_book(self, book: Book) -> None:
+        """Kitabın arama anahtarını hesaplar ve tüm arama indekslerine ekler"""
+        key = search_key(book)
+        self._search_keys[book.isbn] = key
+        self._index.add(book, key)
+        self._trigrams.add(book, key)
+        self._prefixes.add(book, key)
+        self._fuzzy.add(book, key)
+        self._ranking.add(book, key)
+    
+    def _unindex_book(self, isbn: str) -> None:
+        """Kitabı tüm arama indekslerinden çıkarır"""
+        self._search_keys.pop(isbn, None)
+        self._index.remove(isbn)
+        self._trigrams.remove(isbn)
+        self._prefixes.remove(isbn)
+        self._fuzzy.remove(isbn)
+        self._ranking.remove(isbn)
+    
+    def _count(self) -> int:
+        """Kitap sayısını tüm listeyi kopyalamadan döndürür"""
+        if self.db is not None:
+            return self.db.count()
+        return len(self._books)
+    
+    def __len__(self) -> int:
+        """Kütüphanedeki kitap sayısı"""
+        return self._count()
     
     def get_stats(self) -> dict:
-        """Kütüphane istatistiklerini döndürür"""
+        """Kütüphane istatistiklerini döndürür (katalog bilgileri ve sayaçlar)"""
+        stats = self.get_catalog_stats()
+        stats.update(self.get_cache_stats())
+        return stats
+    
+    def get_catalog_stats(self) -> dict:
+        """
+        Sadece kütüphane değişince değişen istatistikleri döndürür
+        
+        Bu değerler ``etag('stats')`` ile önbelleklenebilir; yanıt güncelse
+        hesaplanmaları gerekmez.
+        
+        Returns:
+            dict: Kitap sayısı, dosya ve depolama bilgileri
+        """
         return {
-            'total_books': len(self.books),
+            'total_books': self._count(),
             'filename': self.filename,
-            'file_exists': os.path.exists(self.filename)
+            'file_exists': os.path.exists(self.filename),
+            'journal_entries': self.journal.entry_count if self.journal else 0,
+            'storage': 'sqlite' if self.db is not None else 'json',
+            'version': self.version
+        }
+    
+    def get_cache_stats(self) -> dict:
+        """
+        Her okumada değişebilen önbellek sayaçlarını döndürür
+        
+        Returns:
+            dict: Sorgu önbelleği isabet/ıskalama ve giriş sayıları
+        """
+        return {
+            'cache_hits': self._cache.hits,
+            'cache_misses': self._cache.misses,
+            'cache_entries': len(self._cache)
         }
@@ -1,28 +1,163 @@
-import json
-import os
+import asyncio
+import functools
 import httpx
-from typing import List, Optional, Dict, Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from author_cache import AuthorCache, shared_author_cache
 from book import Book
+from dump_index import DumpIndex
+from http_cache import AsyncCachingTransport, CachingTransport, HTTPCache
+from isbn import NegativeCache, compact_isbn, is_valid_isbn, shared_negative_cache
+from library import Library, _in_event_loop
+from resilience import (AsyncResilientTransport, CircuitBreaker, ResilientTransport, TokenBucket,
+                        shared_circuit_breaker, shared_rate_limiter)
+from single_flight import AsyncSingleFlight, SingleFlight
 
-class LibraryAPI:
+try:
+    import h2  # noqa: F401 - HTTP/2 desteği için httpx[http2] gerekir
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+class LibraryAPI(Library):
     """API entegrasyonlu kütüphane sınıfı - Open Library API kullanır"""
     
-    def __init__(self, filename: str = "library.json"):
+    def __init__(self, filename: str = "library.json", journal: bool = False,
+                 compact_threshold: int = 500, max_connections: int = 20,
+                 max_keepalive_connections: int = 10, keepalive_expiry: float = 30.0,
+                 http2: bool = False, cache_file: Optional[str] = "http_cache.sqlite",
+                 cache_ttl: float = 24 * 3600, author_cache: Optional[AuthorCache] = None,
+                 negative_cache: Optional[NegativeCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 max_retries: int = 3,
+                 index_file: Optional[str] = "openlibrary_index.sqlite"):
         """
         LibraryAPI sınıfının constructor'ı
         
+        Kitap saklama, günlük (journal) ve arama işlemleri Library
+        sınıfından gelir; bu sınıf sadece API entegrasyonunu ekler. Tüm
+        API istekleri tek bir keep-alive bağlantı havuzunu paylaşır ve GET
+        yanıtları kalıcı HTTP önbelleğinde saklanır. Ağa giden istekler hız
+        sınırlayıcı, yeniden deneme ve devre kesiciden geçer. Open Library
+        dökümlerinden kurulmuş yerel dizin varsa ISBN'ler önce orada aranır.
+        
         Args:
             filename (str): Kitapların saklanacağı JSON dosya adı
+            journal (bool): Değişiklikleri günlük dosyasına ekle
+            compact_threshold (int): Günlük sıkıştırma eşiği
+            max_connections (int): Havuzdaki maksimum eşzamanlı bağlantı sayısı
+            max_keepalive_connections (int): Açık tutulacak boştaki bağlantı sayısı
+            keepalive_expiry (float): Boştaki bağlantının kapatılma süresi (saniye)
+            http2 (bool): HTTP/2 kullan (h2 paketi kurulu değilse yok sayılır)
+            cache_file (Optional[str]): HTTP önbellek dosyası; None ise önbellek kapalı
+            cache_ttl (float): Önbellek girişlerinin yeniden doğrulanmadan
+                kullanılacağı süre (saniye)
+            author_cache (Optional[AuthorCache]): Yazar adı önbelleği; verilmezse
+                tüm LibraryAPI nesnelerinin paylaştığı önbellek kullanılır
+            negative_cache (Optional[NegativeCache]): Bulunamayan ISBN önbelleği;
+                verilmezse paylaşılan önbellek kullanılır
+            rate_limiter (Optional[TokenBucket]): İstek hız sınırlayıcı;
+                verilmezse paylaşılan sınırlayıcı kullanılır
+            circuit_breaker (Optional[CircuitBreaker]): Devre kesici; verilmezse
+                paylaşılan devre kesici kullanılır
+            max_retries (int): 429/5xx ve bağlantı hatalarında yeniden deneme sayısı
+            index_file (Optional[str]): Döküm dizini dosyası; None ise dizin kullanılmaz.
+                Göreli cache_file/index_file yolları, günlük dosyası gibi
+                kütüphane dosyasının bulunduğu klasöre göre çözülür
         """
-        self.filename = filename
-        self.books: List[Book] = []
+        data_dir = os.path.dirname(os.path.abspath(filename))
+        if cache_file:
+            cache_file = os.path.join(data_dir, cache_file)
+        if index_file:
+            index_file = os.path.join(data_dir, index_file)
         self.api_base_url = "https://openlibrary.org"
-        self.load_books()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.http_cache = HTTPCache(cache_file, ttl=cache_ttl) if cache_file else None
+        self.author_cache = author_cache if author_cache is not None else shared_author_cache
+        self.negative_cache = negative_cache if negative_cache is not None else shared_negative_cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else shared_rate_limiter
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else shared_circuit_breaker
+        self.max_retries = max_retries
+        self.dump_index = DumpIndex(index_file) if index_file else None
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Aynı ISBN için eşzamanlı aramalar tek API isteğini paylaşır
+        self._lookups = SingleFlight()
+        self._async_lookups = AsyncSingleFlight()
+        super().__init__(filename, journal=journal, compact_threshold=compact_threshold)
+    
+    @property
+    def client(self) -> httpx.Client:
+        """Paylaşılan HTTP istemcisi (ilk kullanımda oluşturulur)"""
+        if self._client is None or self._client.is_closed:
+            transport = ResilientTransport(
+                httpx.HTTPTransport(limits=self.limits, http2=self.http2),
+                self.rate_limiter, self.circuit_breaker, max_retries=self.max_retries)
+            if self.http_cache is not None:
+                transport = CachingTransport(self.http_cache, transport)
+            self._client = httpx.Client(
+                base_url=self.api_base_url, timeout=10.0, transport=transport)
+        return self._client
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Async çağrılar (AsyncLibrary) için paylaşılan HTTP istemcisi
+        
+        İstemci açıldığı event loop'a bağlıdır.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = self._make_async_client()
+        return self._async_client
+    
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Önbellek ve dayanıklılık katmanlı yeni bir async HTTP istemcisi oluşturur"""
+        transport = AsyncResilientTransport(
+            httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2),
+            self.rate_limiter, self.circuit_breaker, max_retries=self.max_retries)
+        if self.http_cache is not None:
+            transport = AsyncCachingTransport(self.http_cache, transport)
+        return httpx.AsyncClient(base_url=self.api_base_url, timeout=10.0, transport=transport)
+    
+    async def aclose(self) -> None:
+        """Async ve senkron bağlantı havuzlarını kapatır"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+    
+    def close(self) -> None:
+        """Bağlantı havuzunu ve önbellek dosyasını kapatır"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.dump_index is not None:
+            self.dump_index.close()
+        self.author_cache.save()
+    
+    def __enter__(self) -> "LibraryAPI":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def add_book_by_isbn(self, isbn: str) -> bool:
         """
         ISBN numarası ile Open Library API'den kitap bilgilerini çeker ve ekler
         
+        Aynı ISBN'i aynı anda ekleyen çağrılar tek bir API isteğini paylaşır;
+        add_book aynı ISBN'i ikinci kez eklemediği için kitap yalnızca bir
+        kez eklenir.
+        
         Args:
             isbn (str): Kitabın ISBN numarası
             
@@ -46,11 +181,9 @@ class LibraryAPI:
                     isbn=isbn
                 )
                 
-                # Kütüphaneye ekle
-                self.books.append(new_book)
-                self.save_books()
-                print(f"✅ Kitap başarıyla eklendi: {new_book}")
-                return True
+                # add_book kilit altında kontrol edip ekler; eşzamanlı
+                # istekler arasında yalnızca biri başarılı olur
+                return self.add_book(new_book)
             else:
                 print(f"❌ ISBN {isbn} ile kitap bulunamadı.")
                 return False
@@ -59,215 +192,307 @@ class LibraryAPI:
             print(f"❌ Kitap eklenirken hata oluştu: {e}")
             return False
     
+    def add_books_by_isbn(self, isbns: Iterable[str], concurrency: int = 8) -> Dict[str, str]:
+        """
+        Birden çok ISBN'i Open Library API'den eşzamanlı çekip toplu ekler
+        
+        İstekler tek bir event loop'ta, semafor ile en fazla ``concurrency``
+        tanesi aynı anda olacak şekilde yapılır. Bulunan kitaplar tek
+        seferde eklenir ve dosyaya bir kez kaydedilir.
+        
+        Args:
+            isbns (Iterable[str]): Eklenecek ISBN'ler
+            concurrency (int): Aynı anda yapılacak maksimum API isteği
+            
+        Returns:
+            Dict[str, str]: ISBN -> sonuç ('added', 'exists', 'not_found',
+                'error')
+        """
+        report, pending = self._plan_import(isbns)
+        if not pending:
+            return report
+        
+        if _in_event_loop():
+            print("❌ Event loop içinde toplu ekleme yapılamaz; AsyncLibrary kullanın!")
+            for isbn in pending:
+                report[isbn] = 'error'
+            return report
+        
+        books = asyncio.run(self._fetch_books(pending, concurrency))
+        self._finish_import(report, pending, books)
+        return report
+    
+    async def _fetch_books(self, isbns: List[str], concurrency: int) -> List[Optional[Book]]:
+        """
+        ISBN'leri sınırlı eşzamanlılıkla async çeker
+        
+        Paylaşılan async istemci başka bir event loop'a (FastAPI) bağlı
+        olabileceği için aktarım kendi istemcisini açar ve sonunda kapatır;
+        önbellekler, hız sınırı ve devre kesici ortaktır.
+        
+        Args:
+            isbns (List[str]): Çekilecek ISBN'ler
+            concurrency (int): Aynı anda yapılacak maksimum istek
+            
+        Returns:
+            List[Optional[Book]]: ISBN sırasıyla bulunan kitaplar (yoksa None)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async with self._make_async_client() as client:
+            async def fetch(isbn: str) -> Optional[Book]:
+                async with semaphore:
+                    book_data = await self._request_book_data_async(isbn, client)
+                if not book_data:
+                    return None
+                return Book(title=book_data['title'], author=book_data['author'], isbn=isbn)
+            
+            return await asyncio.gather(*(fetch(isbn) for isbn in isbns))
+    
     def _fetch_book_from_api(self, isbn: str) -> Optional[Dict[str, Any]]:
         """
         Open Library API'den kitap bilgilerini çeker
         
+        Aynı ISBN için devam eden bir istek varsa yeni istek yapılmaz,
+        onun sonucu beklenir.
+        
         Args:
             isbn (str): Kitabın ISBN numarası
             
         Returns:
             Optional[Dict[str, Any]]: Kitap bilgileri veya None
         """
-        try:
-            # API endpoint'i
-            url = f"{self.api_base_url}/isbn/{isbn}.json"
-            
-            # HTTP isteği gönder
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Kitap bilgilerini çıkar
-                    title = data.get('title', 'Bilinmeyen Başlık')
-                    
-                    # Yazar bilgisini çıkar
-                    authors = data.get('authors', [])
-                    if authors:
-                        # İlk yazarın adını al
-                        author_key = authors[0].get('key')
-                        if author_key:
-                            author_name = self._fetch_author_name(author_key)
-                        else:
-                            author_name = 'Bilinmeyen Yazar'
-                    else:
-                        author_name = 'Bilinmeyen Yazar'
-                    
-                    return {
-                        'title': title,
-                        'author': author_name
-                    }
-                else:
-                    print(f"❌ API hatası: {response.status_code}")
-                    return None
-                    
-        except httpx.TimeoutException:
-            print("❌ API isteği zaman aşımına uğradı.")
-            return None
-        except httpx.RequestError as e:
-            print(f"❌ API isteği hatası: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Beklenmeyen hata: {e}")
-            return None
+        return self._lookups.do(compact_isbn(isbn), lambda: self._request_book_data(isbn))
     
-    def _fetch_author_name(self, author_key: str) -> str:
+    def _resolve_locally(self, isbn: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
-        Yazar anahtarı ile yazar adını çeker
+        ISBN'i ağa gitmeden çözmeye çalışır
+        
+        Hatalı veya yakın zamanda bulunamamış ISBN'ler için ağa gidilmez;
+        yerel döküm dizininde bulunan ISBN'ler oradan okunur.
         
         Args:
-            author_key (str): Yazar anahtarı
+            isbn (str): Kitabın ISBN numarası
             
         Returns:
-            str: Yazar adı
+            Tuple[bool, Optional[Dict[str, Any]]]: (sonuç belli mi, kitap bilgileri)
         """
-        try:
-            url = f"{self.api_base_url}{author_key}.json"
+        if not is_valid_isbn(isbn):
+            print(f"❌ Geçersiz ISBN: {isbn}")
+            return True, None
+        if self.dump_index is not None:
+            entry = self.dump_index.lookup(isbn)
+            if entry:
+                return True, {'title': entry[0], 'author': entry[1]}
+        if isbn in self.negative_cache:
+            return True, None
+        return False, None
+    
+    def _parse_book_response(self, isbn: str,
+                             response: httpx.Response) -> Optional[Tuple[str, List[str]]]:
+        """
+        ISBN yanıtından başlığı ve yazar anahtarlarını çıkarır
+        
+        Senkron ve async yollar aynı ayrıştırmayı kullanır. 404 yanıtında
+        ISBN negatif önbelleğe eklenir.
+        
+        Args:
+            isbn (str): Kitabın ISBN numarası
+            response (httpx.Response): /isbn/{isbn}.json yanıtı
             
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(url)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get('name', 'Bilinmeyen Yazar')
-                else:
-                    return 'Bilinmeyen Yazar'
-                    
-        except Exception:
-            return 'Bilinmeyen Yazar'
+        Returns:
+            Optional[Tuple[str, List[str]]]: (başlık, tekrarsız yazar
+                anahtarları) veya kitap yoksa None
+        """
+        if response.status_code == 200:
+            data = response.json()
+            title = data.get('title', 'Bilinmeyen Başlık')
+            author_keys = [author.get('key') for author in data.get('authors', [])
+                           if isinstance(author, dict) and author.get('key')]
+            return title, list(dict.fromkeys(author_keys))
+        if response.status_code == 404:
+            self.negative_cache.add(isbn)
+            return None
+        print(f"❌ API hatası: {response.status_code}")
+        return None
+    
+    @staticmethod
+    def _book_data(title: str, author_names: List[Optional[str]]) -> Dict[str, Any]:
+        """Başlık ve çözülen yazar adlarından kitap bilgilerini oluşturur"""
+        known = [name for name in author_names if name]
+        return {'title': title, 'author': ', '.join(known) or 'Bilinmeyen Yazar'}
     
-    def add_book(self, book: Book) -> bool:
+    @staticmethod
+    def _report_request_error(error: Exception) -> None:
+        """API isteği sırasında oluşan hatayı kullanıcıya bildirir"""
+        if isinstance(error, httpx.TimeoutException):
+            print("❌ API isteği zaman aşımına uğradı.")
+        elif isinstance(error, httpx.RequestError):
+            print(f"❌ API isteği hatası: {error}")
+        else:
+            print(f"❌ Beklenmeyen hata: {error}")
+    
+    def _request_book_data(self, isbn: str) -> Optional[Dict[str, Any]]:
         """
-        Yeni bir kitabı kütüphaneye ekler (manuel ekleme için)
+        Kitap bilgileri için API isteğini yapar
         
         Args:
-            book (Book): Eklenecek kitap nesnesi
+            isbn (str): Kitabın ISBN numarası
             
         Returns:
-            bool: İşlem başarılı mı?
+            Optional[Dict[str, Any]]: Kitap bilgileri veya None
         """
-        # ISBN kontrolü - aynı ISBN varsa ekleme
-        if self.find_book(book.isbn):
-            print(f"Bu ISBN ({book.isbn}) zaten kütüphanede mevcut!")
-            return False
+        resolved, book_data = self._resolve_locally(isbn)
+        if resolved:
+            return book_data
         
-        self.books.append(book)
-        self.save_books()
-        print(f"✅ Kitap başarıyla eklendi: {book}")
-        return True
+        try:
+            # HTTP isteği gönder (havuzdaki bağlantı yeniden kullanılır)
+            parsed = self._parse_book_response(isbn, self.client.get(f"/isbn/{isbn}.json"))
+            if parsed is None:
+                return None
+            title, author_keys = parsed
+            return self._book_data(title, self._fetch_author_names(author_keys))
+        except Exception as e:
+            self._report_request_error(e)
+            return None
     
-    def remove_book(self, isbn: str) -> bool:
+    def _fetch_author_names(self, author_keys: List[str]) -> List[Optional[str]]:
         """
-        ISBN numarasına göre kitabı kütüphaneden siler
+        Yazar adlarını eşzamanlı çeker (önce yazar önbelleğine bakılır)
+        
+        Birden çok yazar varsa istekler paylaşılan istemci üzerinden ayrı
+        thread'lerde aynı anda yapılır.
         
         Args:
-            isbn (str): Silinecek kitabın ISBN'i
+            author_keys (List[str]): Yazar anahtarları
             
         Returns:
-            bool: İşlem başarılı mı?
+            List[Optional[str]]: Anahtar sırasıyla yazar adları (bulunamayan None)
         """
-        book = self.find_book(isbn)
-        if book:
-            self.books.remove(book)
-            self.save_books()
-            print(f"✅ Kitap başarıyla silindi: {book}")
-            return True
-        else:
-            print(f"❌ ISBN {isbn} ile kitap bulunamadı.")
-            return False
+        def lookup(author_key: str) -> Optional[str]:
+            return self.author_cache.lookup(author_key, self._request_author_name)
+        
+        if len(author_keys) <= 1:
+            return [lookup(author_key) for author_key in author_keys]
+        with ThreadPoolExecutor(max_workers=min(len(author_keys), 8)) as executor:
+            return list(executor.map(lookup, author_keys))
     
-    def list_books(self) -> None:
-        """Kütüphanedeki tüm kitapları listeler"""
-        if not self.books:
-            print("📚 Kütüphanede hiç kitap bulunmuyor.")
-            return
+    def _request_author_name(self, author_key: str) -> Optional[str]:
+        """
+        Yazar adını API'den çeker
         
-        print(f"\n📚 Kütüphanede {len(self.books)} kitap bulunuyor:")
-        print("-" * 60)
-        for i, book in enumerate(self.books, 1):
-            print(f"{i}. {book}")
-        print("-" * 60)
+        Args:
+            author_key (str): Yazar anahtarı
+            
+        Returns:
+            Optional[str]: Yazar adı veya None
+        """
+        try:
+            response = self.client.get(f"{author_key}.json", timeout=5.0)
+            if response.status_code == 200:
+                return response.json().get('name')
+            return None
+        except Exception:
+            return None
     
-    def find_book(self, isbn: str) -> Optional[Book]:
+    async def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
         """
-        ISBN ile belirli bir kitabı bulur
+        Kitap bilgilerini event loop'u bloklamadan çeker (eklemez)
+        
+        AsyncLibrary bu metodu kullanır; önbellekler ve döküm dizini
+        senkron yol ile ortaktır.
         
         Args:
-            isbn (str): Aranacak kitabın ISBN'i
+            isbn (str): Kitabın ISBN numarası
             
         Returns:
             Optional[Book]: Bulunan kitap veya None
         """
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        book_data = await self._async_lookups.do(
+            compact_isbn(isbn), lambda: self._request_book_data_async(isbn))
+        if not book_data:
+            return None
+        return Book(title=book_data['title'], author=book_data['author'], isbn=isbn)
     
-    def search_books(self, keyword: str) -> List[Book]:
+    async def _request_book_data_async(self, isbn: str,
+                                       client: Optional[httpx.AsyncClient] = None
+                                       ) -> Optional[Dict[str, Any]]:
         """
-        Başlık veya yazar adında anahtar kelime arar
+        _request_book_data() metodunun async karşılığı
         
         Args:
-            keyword (str): Aranacak anahtar kelime
+            isbn (str): Kitabın ISBN numarası
+            client (Optional[httpx.AsyncClient]): Kullanılacak istemci;
+                verilmezse paylaşılan async istemci kullanılır
             
         Returns:
-            List[Book]: Bulunan kitaplar listesi
+            Optional[Dict[str, Any]]: Kitap bilgileri veya None
         """
-        keyword = keyword.lower()
-        found_books = []
-        
-        for book in self.books:
-            if (keyword in book.title.lower() or 
-                keyword in book.author.lower() or
-                keyword in book.isbn):
-                found_books.append(book)
-        
-        return found_books
-    
-    def load_books(self) -> None:
-        """JSON dosyasından kitapları yükler"""
-        if not os.path.exists(self.filename):
-            print(f"📁 '{self.filename}' dosyası bulunamadı. Yeni kütüphane oluşturuluyor.")
-            return
+        resolved, book_data = self._resolve_locally(isbn)
+        if resolved:
+            return book_data
         
+        client = client if client is not None else self.async_client
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.books = [Book.from_dict(book_data) for book_data in data]
-                print(f"📚 '{self.filename}' dosyasından {len(self.books)} kitap yüklendi.")
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"❌ Dosya okuma hatası: {e}")
-            self.books = []
+            response = await client.get(f"/isbn/{isbn}.json")
+            parsed = self._parse_book_response(isbn, response)
+            if parsed is None:
+                return None
+            title, author_keys = parsed
+            # Tüm yazarlar aynı anda çözülür
+            names = await asyncio.gather(*(
+                self.author_cache.async_lookup(
+                    author_key, functools.partial(self._request_author_name_async, client=client))
+                for author_key in author_keys))
+            return self._book_data(title, names)
+        except Exception as e:
+            self._report_request_error(e)
+            return None
     
-    def save_books(self) -> None:
-        """Kitap listesini JSON dosyasına kaydeder"""
+    async def _request_author_name_async(self, author_key: str,
+                                         client: Optional[httpx.AsyncClient] = None
+                                         ) -> Optional[str]:
+        """Yazar adını API'den async çeker (istemci verilmezse paylaşılan kullanılır)"""
+        client = client if client is not None else self.async_client
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump([book.to_dict() for book in self.books], 
-                         file, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"❌ Dosya kaydetme hatası: {e}")
+            response = await client.get(f"{author_key}.json", timeout=5.0)
+            if response.status_code == 200:
+                return response.json().get('name')
+            return None
+        except Exception:
+            return None
+    
+    def get_catalog_stats(self) -> dict:
+        """Kütüphane değişince değişen istatistikleri API adresiyle birlikte döndürür"""
+        stats = super().get_catalog_stats()
+        stats['api_base_url'] = self.api_base_url
+        return stats
     
-    def get_stats(self) -> dict:
-        """Kütüphane istatistiklerini döndürür"""
-        return {
-            'total_books': len(self.books),
-            'filename': self.filename,
-            'file_exists': os.path.exists(self.filename),
-            'api_base_url': self.api_base_url
-        }
+    def get_cache_stats(self) -> dict:
+        """Önbellek sayaçlarını yazar önbelleği ve devre kesici durumuyla döndürür"""
+        stats = super().get_cache_stats()
+        author_stats = self.author_cache.get_stats()
+        stats['author_cache_entries'] = author_stats['entries']
+        stats['author_cache_hit_ratio'] = author_stats['hit_ratio']
+        stats['circuit_breaker'] = self.circuit_breaker.state
+        return stats
     
     def test_api_connection(self) -> bool:
         """API bağlantısını test eder"""
         try:
             test_isbn = "978-0134685991"  # Python Crash Course ISBN
-            url = f"{self.api_base_url}/isbn/{test_isbn}.json"
-            
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(url)
-                return response.status_code == 200
+            response = self.client.get(f"/isbn/{test_isbn}.json", timeout=5.0)
+            return response.status_code == 200
                 
         except Exception:
             return False
+    
+    async def test_api_connection_async(self) -> bool:
+        """API bağlantısını event loop'u bloklamadan, async istemciyle test eder"""
+        try:
+            test_isbn = "978-0134685991"  # Python Crash Course ISBN
+            response = await self.async_client.get(f"/isbn/{test_isbn}.json", timeout=5.0)
+            return response.status_code == 200
+        except Exception:
+            return False
@@ -0,0 +1,169 @@
+"""
+library_project LibraryAPI(Library) sınıfı için test dosyası
+
+Open Library yerine kök conftest.py'deki sahte aktarım kullanılır; ağa
+istek yapılmaz ve kütüphane dosyaları geçici klasörde tutulur.
+"""
+
+import pytest
+import asyncio
+import os
+import httpx
+
+from book import Book
+
+
+class TestLibraryAPISubclass:
+    """library_project LibraryAPI test sınıfı"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, library_project, library_api, open_library, tmp_path):
+        """Her test sahte Open Library'ye bağlı, boş bir kütüphaneyle çalışır"""
+        self.modules = library_project
+        self.library = library_api
+        self.open_library = open_library
+        self.tmp_path = tmp_path
+
+    def reload(self):
+        """Kütüphaneyi dosyadan yeniden yükler"""
+        return self.modules.library.Library(self.library.filename)
+
+    def test_is_library(self):
+        """LibraryAPI, Library'nin saklama ve arama işlemlerini devralmalı"""
+        assert isinstance(self.library, self.modules.library.Library)
+        assert self.library.add_book(Book("Sefiller", "Victor Hugo", "111"))
+        assert [book.isbn for book in self.library.search_books("hugo")] == ["111"]
+        assert self.reload().find_book("111").title == "Sefiller"
+
+    def test_add_book_by_isbn(self):
+        """ISBN ile ekleme başlığı ve yazarı API'den çekip dosyaya kaydetmeli"""
+        assert self.library.add_book_by_isbn("978-0-7475-3269-9")
+
+        book = self.reload().find_book("978-0-7475-3269-9")
+        assert book.title == "Harry Potter and the Philosopher's Stone"
+        assert book.author == "J. K. Rowling"
+        assert self.open_library.requests == [
+            "/isbn/978-0-7475-3269-9.json", "/authors/OL23919A.json"]
+
+        # Kütüphanedeki ISBN API'ye tekrar sorulmaz
+        assert self.library.add_book_by_isbn("978-0-7475-3269-9") is False
+        assert len(self.open_library.requests) == 2
+
+    def test_multiple_authors(self):
+        """Birden çok yazar sırasıyla birleştirilmeli"""
+        assert self.library.add_book_by_isbn("9780060853983")
+        assert self.library.find_book("9780060853983").author == "Terry Pratchett, Neil Gaiman"
+
+    def test_not_found_isbn_cached(self):
+        """404 dönen ISBN negatif önbelleğe girmeli ve tekrar sorulmamalı"""
+        assert self.library.add_book_by_isbn("9780306406157") is False
+        assert "9780306406157" in self.library.negative_cache
+        assert self.library.add_book_by_isbn("9780306406157") is False
+        assert self.open_library.requests == ["/isbn/9780306406157.json"]
+
+    def test_invalid_isbn_not_requested(self):
+        """Kontrol basamağı hatalı ISBN API'ye sorulmamalı"""
+        assert self.library.add_book_by_isbn("9780306406158") is False
+        assert self.open_library.requests == []
+
+    def test_get_book_by_isbn_async(self):
+        """Async arama kitabı döndürmeli ama eklememeli; eşzamanlı aramalar tek istek yapmalı"""
+        async def run():
+            books = await asyncio.gather(*(self.library.get_book_by_isbn("9780747532699")
+                                           for _ in range(3)))
+            await self.library.aclose()
+            return books
+
+        books = asyncio.run(run())
+
+        assert {book.author for book in books} == {"J. K. Rowling"}
+        assert len(self.library) == 0
+        assert self.open_library.requests.count("/isbn/9780747532699.json") == 1
+
+    def test_add_books_by_isbn(self):
+        """Toplu ekleme raporu her ISBN'in sonucunu içermeli"""
+        self.library.add_book(Book("Mevcut", "Yazar", "9780134685991"))
+
+        report = self.library.add_books_by_isbn(
+            ["9780747532699", "9780060853983", "9780306406157", "9780134685991",
+             "9780747532699", ""], concurrency=2)
+
+        assert report == {
+            "9780747532699": "added",
+            "9780060853983": "added",
+            "9780306406157": "not_found",
+            "9780134685991": "exists",
+        }
+        assert "/isbn/9780134685991.json" not in self.open_library.requests
+        assert len(self.reload()) == 3
+
+    def test_fetch_books_bounded_concurrency(self):
+        """Toplu çekmede aynı anda en fazla concurrency kadar ISBN çözülmeli"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            # Bir kitabın yazarları kendi sırası içinde eşzamanlı çözülür
+            if not request.url.path.startswith("/isbn/"):
+                return self.open_library.handler(request)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.open_library.handler(request)
+
+        self.library._make_async_client = lambda: httpx.AsyncClient(
+            base_url=self.library.api_base_url, transport=httpx.MockTransport(handler))
+        isbns = ["9780747532699", "9780060853983", "9780306406157",
+                 "9780140449136", "9789754700008", "9780134685991"]
+
+        books = asyncio.run(self.library._fetch_books(isbns, 2))
+
+        assert max_in_flight == 2
+        assert [book.isbn if book else None for book in books] == [
+            "9780747532699", "9780060853983", None, None, None, "9780134685991"]
+
+    def test_stats(self):
+        """İstatistikler katalog ve önbellek bilgilerini API bilgileriyle birlikte içermeli"""
+        self.library.add_book_by_isbn("9780747532699")
+
+        catalog = self.library.get_catalog_stats()
+        assert catalog["total_books"] == 1
+        assert catalog["api_base_url"] == "https://openlibrary.org"
+        assert catalog["file_exists"] is True
+
+        cache = self.library.get_cache_stats()
+        assert cache["author_cache_entries"] == 1
+        assert cache["circuit_breaker"] == "closed"
+        assert "total_books" not in cache
+
+        assert self.library.get_stats() == {**catalog, **cache}
+
+    def test_api_connection(self):
+        """API testi senkron ve async istemciyle yapılabilmeli"""
+        assert self.library.test_api_connection()
+        assert asyncio.run(self.library.test_api_connection_async())
+
+        def failing(request):
+            raise httpx.ConnectError("bağlantı yok", request=request)
+
+        self.library._client = httpx.Client(
+            base_url=self.library.api_base_url, transport=httpx.MockTransport(failing))
+        assert self.library.test_api_connection() is False
+
+    def test_data_files_next_to_library(self):
+        """Göreli önbellek ve dizin dosyaları kütüphane dosyasının yanında olmalı"""
+        data_dir = self.tmp_path / "veri"
+        data_dir.mkdir()
+        library = self.modules.library_api.LibraryAPI(str(data_dir / "library.json"))
+
+        assert library.http_cache.filename == str(data_dir / "http_cache.sqlite")
+        assert library.dump_index.filename == str(data_dir / "openlibrary_index.sqlite")
+        # Dosyalar ilk kullanımda oluşturulur
+        assert not os.path.exists(library.http_cache.filename)
+        library.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
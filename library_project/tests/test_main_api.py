@@ -0,0 +1,111 @@
+"""
+library_project/main_api.py toplu içe aktarma ve döküm aktarma komutları için test dosyası
+"""
+
+import pytest
+import gzip
+import json
+
+from author_cache import AuthorCache
+from isbn import NegativeCache
+from resilience import CircuitBreaker
+
+
+def dump_line(record_type, key, record):
+    """Open Library döküm formatında tek satır üretir"""
+    return f"{record_type}\t{key}\t1\t2024-01-01T00:00:00\t{json.dumps(record)}\n"
+
+
+class TestMainAPI:
+    """main_api komut satırı test sınıfı"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, library_project, library_api, open_library, tmp_path):
+        """Her test sahte Open Library'ye bağlı, boş bir kütüphaneyle çalışır"""
+        self.modules = library_project
+        self.main_api = library_project.main_api
+        self.library = library_api
+        self.open_library = open_library
+        self.tmp_path = tmp_path
+
+    def write_isbns(self, text):
+        """ISBN listesini geçici dosyaya yazar"""
+        path = self.tmp_path / "isbns.txt"
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_parse_args(self):
+        """Alt komutlar ve varsayılanlar ayrıştırılmalı"""
+        args = self.main_api.parse_args(["import", "isbns.txt", "-c", "3", "-f", "veri.json"])
+        assert (args.command, args.source, args.concurrency, args.file) == \
+            ("import", "isbns.txt", 3, "veri.json")
+
+        args = self.main_api.parse_args(["ingest-dump", "a.txt.gz", "b.txt.gz"])
+        assert (args.dumps, args.index) == (["a.txt.gz", "b.txt.gz"], "openlibrary_index.sqlite")
+
+        assert self.main_api.parse_args([]).command is None
+
+    def test_read_isbns(self):
+        """Satır başına birden çok ISBN olabilmeli; yorumlar ve boş satırlar atlanmalı"""
+        source = self.write_isbns("# liste\n9780747532699, 9780060853983\n\n9780306406157 # yok\n")
+
+        assert self.main_api.read_isbns(source) == [
+            "9780747532699", "9780060853983", "9780306406157"]
+
+    def test_import_isbns(self, capsys):
+        """Toplu içe aktarma bulunan kitapları eklemeli; hepsi bulunursa 0 dönmeli"""
+        source = self.write_isbns("9780747532699\n9780060853983\n")
+
+        assert self.main_api.import_isbns(self.library, source, concurrency=2) == 0
+
+        library = self.modules.library.Library(self.library.filename)
+        assert library.find_book("9780060853983").author == "Terry Pratchett, Neil Gaiman"
+        assert "2 eklendi" in capsys.readouterr().out
+
+        # Tekrar içe aktarmada kitaplar API'ye sorulmaz
+        requests = len(self.open_library.requests)
+        assert self.main_api.import_isbns(self.library, source, concurrency=2) == 0
+        assert len(self.open_library.requests) == requests
+
+    def test_import_isbns_failures(self, capsys):
+        """Bulunamayan ISBN, okunamayan veya boş dosya 1 döndürmeli"""
+        source = self.write_isbns("9780747532699\n9780306406157\n")
+        assert self.main_api.import_isbns(self.library, source, concurrency=2) == 1
+        assert "9780306406157: not_found" in capsys.readouterr().out
+        assert len(self.library) == 1
+
+        missing = str(self.tmp_path / "yok.txt")
+        assert self.main_api.import_isbns(self.library, missing, concurrency=2) == 1
+        assert self.main_api.import_isbns(self.library, self.write_isbns("# boş\n"), 2) == 1
+
+    def test_ingest_dumps(self):
+        """Aktarılan döküm dizini ISBN'leri API'ye gitmeden çözmeli"""
+        dump_file = self.tmp_path / "editions.txt.gz"
+        with gzip.open(dump_file, "wt", encoding="utf-8") as file:
+            file.writelines([
+                dump_line('/type/author', '/authors/OL1A', {'name': 'Orhan Pamuk'}),
+                dump_line('/type/edition', '/books/OL1M', {
+                    'title': 'Kar', 'isbn_13': ['978-975-470-000-8'],
+                    'authors': [{'key': '/authors/OL1A'}]}),
+            ])
+        index_file = str(self.tmp_path / "openlibrary_index.sqlite")
+
+        assert self.main_api.ingest_dumps(
+            [str(dump_file), str(self.tmp_path / "yok.txt.gz")], index_file) == 1
+
+        # Varsayılan dizin dosyası kütüphane dosyasının yanında aranır
+        library = self.modules.library_api.LibraryAPI(
+            str(self.tmp_path / "library.json"), cache_file=None,
+            author_cache=AuthorCache(), negative_cache=NegativeCache(),
+            circuit_breaker=CircuitBreaker())
+        library._client = self.library._client
+        try:
+            assert library.add_book_by_isbn("9789754700008")
+            assert library.find_book("9789754700008").author == "Orhan Pamuk"
+            assert self.open_library.requests == []
+        finally:
+            library.dump_index.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,228 @@
+"""
+Library sınıfı için async cephe (facade)
+
+Library metotları senkrondur ve kütüphane kilidini alır: ekleme/silme
+dosyaya yazar, ISBN ile ekleme ise API isteğini arka plan event loop
+thread'inde çalıştırıp sonucunu bekler, bu yüzden çalışan bir event loop
+içinden çağrılamaz. AsyncLibrary aynı kütüphaneyi async uygulamalara
+(FastAPI) açar:
+
+- Değişiklikler ve disk yazımları tek thread'lik bir executor'da sırayla
+  çalışır; event loop dosya yazımını beklemez.
+- ISBN ile eklemede Open Library isteği doğrudan async yapılır.
+- Okumalar (bul, ara, sayfala, öner) varsayılan thread havuzunda çalışır.
+  Kilit altında oldukları için yarım kalmış bir değişikliği görmezler;
+  bir yazım kilidi tutarken bekleyen de event loop değil o thread olur.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+from book import Book
+from library import Library
+
+
+class AsyncLibrary:
+    """Library nesnesini awaitable metotlarla saran cephe"""
+
+    def __init__(self, library: Optional[Library] = None, api: Any = None):
+        """
+        AsyncLibrary sınıfının constructor'ı
+
+        Args:
+            library (Optional[Library]): Sarılacak kütüphane; verilmezse
+                varsayılan Library oluşturulur
+            api (Any): ``async get_book_by_isbn(isbn)`` ve ``async aclose()``
+                metotları olan kitap kaynağı; verilmezse kütüphanenin kendisi
+                (bu metotlara sahipse) ya da yeni bir LibraryAPI kullanılır
+        """
+        self.library = library if library is not None else Library()
+        if api is None:
+            if asyncio.iscoroutinefunction(getattr(self.library, 'get_book_by_isbn', None)):
+                api = self.library
+            else:
+                from library_api import LibraryAPI
+                api = LibraryAPI(
+                    data_dir=os.path.dirname(os.path.abspath(self.library.filename)))
+        self.api = api
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Senkron kütüphane metodunu executor'da çalıştırır"""
+        if self._executor is None:
+            # Tek thread: değişiklikler çağrı sırasıyla dosyaya yazılır
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='library-io')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _read(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Okuma yapan kütüphane metodunu varsayılan thread havuzunda çalıştırır"""
+        # Okumalar yazım sırasını beklemez; tutarlılığı kütüphane kilidi sağlar
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    @property
+    def books(self) -> List[Book]:
+        """Kütüphanedeki tüm kitaplar"""
+        return self.library.books
+
+    async def add_book(self, book: Book) -> bool:
+        """
+        Yeni bir kitabı kütüphaneye ekler
+
+        Args:
+            book (Book): Eklenecek kitap nesnesi
+
+        Returns:
+            bool: İşlem başarılı mı?
+        """
+        return await self._run(self.library.add_book, book)
+
+    async def add_book_by_isbn(self, isbn: str) -> bool:
+        """
+        ISBN ile Open Library'den kitap bilgilerini async çekip ekler
+
+        Args:
+            isbn (str): Kitap ISBN numarası
+
+        Returns:
+            bool: Ekleme başarılı ise True
+        """
+        if await self.find_book(isbn):
+            print(f"Bu ISBN ({isbn}) zaten kütüphanede mevcut!")
+            return False
+
+        book = await self.api.get_book_by_isbn(isbn)
+        if not book:
+            print(f"❌ ISBN {isbn} ile kitap bulunamadı!")
+            return False
+        # Library.add_book aynı ISBN'i ikinci kez eklemez; eşzamanlı
+        # isteklerden yalnızca biri başarılı olur
+        return await self.add_book(book)
+
+    async def remove_book(self, isbn: str) -> bool:
+        """
+        ISBN ile kitabı siler
+
+        Args:
+            isbn (str): Silinecek kitabın ISBN'i
+
+        Returns:
+            bool: İşlem başarılı mı?
+        """
+        return await self._run(self.library.remove_book, isbn)
+
+    async def update_book(self, isbn: str, title: str, author: str) -> Optional[Book]:
+        """
+        Kitabın başlık ve yazarını günceller
+
+        Args:
+            isbn (str): Güncellenecek kitabın ISBN'i
+            title (str): Yeni başlık
+            author (str): Yeni yazar
+
+        Returns:
+            Optional[Book]: Güncellenen kitap veya None
+        """
+        return await self._run(self.library.update_book, isbn, title, author)
+
+    async def find_book(self, isbn: str) -> Optional[Book]:
+        """
+        ISBN ile kitap bulur
+
+        Args:
+            isbn (str): Aranacak ISBN
+
+        Returns:
+            Optional[Book]: Bulunan kitap veya None
+        """
+        return await self._read(self.library.find_book, isbn)
+
+    async def page_books(self, cursor: Optional[str] = None,
+                         limit: int = 50) -> Tuple[List[Book], Optional[str]]:
+        """
+        Kitapları imleç tabanlı sayfalar halinde döndürür
+
+        Args:
+            cursor (Optional[str]): Önceki sayfadan dönen imleç; None ise baştan
+            limit (int): Sayfadaki maksimum kitap sayısı
+
+        Returns:
+            Tuple[List[Book], Optional[str]]: (sayfadaki kitaplar, sonraki imleç)
+        """
+        return await self._read(self.library.page_books, cursor, limit)
+
+    async def search_books(self, keyword: str, fuzzy: bool = False,
+                           max_distance: int = 2) -> List[Book]:
+        """
+        Başlık veya yazar adında anahtar kelime arar
+
+        Args:
+            keyword (str): Aranacak anahtar kelime
+            fuzzy (bool): Yazım hatalarına dayanıklı arama
+            max_distance (int): Bulanık aramada izin verilen mesafe
+
+        Returns:
+            List[Book]: Bulunan kitaplar
+        """
+        return await self._read(self.library.search_books, keyword,
+                                fuzzy=fuzzy, max_distance=max_distance)
+
+    async def ranked_search(self, keyword: str, limit: int = 20, offset: int = 0,
+                            fuzzy: bool = False, max_distance: int = 2) -> Tuple[List[Book], int]:
+        """
+        Alaka puanına göre sıralı arama sonucundan bir sayfa döndürür
+
+        Args:
+            keyword (str): Aranacak anahtar kelime
+            limit (int): Sayfadaki maksimum kitap sayısı
+            offset (int): Atlanacak sonuç sayısı
+            fuzzy (bool): Yazım hatalarına dayanıklı arama
+            max_distance (int): Bulanık aramada izin verilen mesafe
+
+        Returns:
+            Tuple[List[Book], int]: (sayfadaki kitaplar, toplam eşleşme sayısı)
+        """
+        return await self._read(self.library.ranked_search, keyword, limit=limit,
+                                offset=offset, fuzzy=fuzzy, max_distance=max_distance)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Önekle başlayan başlık ve yazar adlarını önerir
+
+        Args:
+            prefix (str): Kullanıcının yazdığı önek
+            limit (int): Maksimum öneri sayısı
+
+        Returns:
+            List[str]: Alfabetik sırayla öneriler
+        """
+        return await self._read(self.library.suggest, prefix, limit)
+
+    async def etag(self, *parts: Any) -> str:
+        """
+        Güncel sürümden ETag değeri üretir (tırnaksız)
+
+        Args:
+            *parts: Yanıtı belirleyen ek değerler
+
+        Returns:
+            str: ETag değeri
+        """
+        return await self._read(self.library.etag, *parts)
+
+    async def aclose(self) -> None:
+        """Bekleyen yazımları bitirir, API bağlantılarını kapatır"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(executor.shutdown, wait=True))
+        await self.api.aclose()
+
+    async def __aenter__(self) -> "AsyncLibrary":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -0,0 +1,216 @@
+"""
+Yazar adı önbelleği
+
+Birçok kitap aynı yazara aittir; yazar anahtarı -> ad eşlemesi bellekte
+LRU sırasıyla tutulur ve istenirse JSON dosyasına kaydedilerek sonraki
+çalıştırmalarda da kullanılır. Her iki LibraryAPI sınıfı da aynı önbelleği
+kullanır.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class AuthorCache:
+    """Yazar anahtarı -> yazar adı LRU önbelleği"""
+
+    def __init__(self, max_entries: int = 4096, filename: Optional[str] = None):
+        """
+        AuthorCache sınıfının constructor'ı
+
+        Args:
+            max_entries (int): Maksimum giriş sayısı
+            filename (Optional[str]): Kalıcı saklama için JSON dosyası; None
+                ise önbellek sadece bellekte tutulur
+        """
+        self.max_entries = max_entries
+        self.filename = filename
+        self._names: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Aynı yazarın eşzamanlı aramalarında sadece bir istek yapılır
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._pending: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if filename:
+            self.load()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Yazar adını önbellekten okur
+
+        Args:
+            key (str): Yazar anahtarı (ör. '/authors/OL23919A')
+
+        Returns:
+            Optional[str]: Yazar adı veya None
+        """
+        with self._lock:
+            name = self._cached(key)
+            if name is None:
+                self.misses += 1
+            return name
+
+    def put(self, key: str, name: str) -> None:
+        """
+        Yazar adını önbelleğe yazar
+
+        Args:
+            key (str): Yazar anahtarı
+            name (str): Yazar adı
+        """
+        with self._lock:
+            self._names[key] = name
+            self._names.move_to_end(key)
+            while len(self._names) > self.max_entries:
+                self._names.popitem(last=False)
+            self._dirty = True
+
+    def lookup(self, key: str, fetch: Callable[[str], Optional[str]]) -> Optional[str]:
+        """
+        Yazar adını önbellekten okur, yoksa ``fetch`` ile çekip saklar
+
+        Aynı anahtar için eşzamanlı çağrılar beklenir; böylece thread
+        havuzundaki toplu aktarımlarda da yazar başına tek istek yapılır.
+        Bulunamayan (None) adlar önbelleğe alınmaz.
+
+        Args:
+            key (str): Yazar anahtarı
+            fetch (Callable[[str], Optional[str]]): Adı API'den çeken fonksiyon
+
+        Returns:
+            Optional[str]: Yazar adı veya None
+        """
+        with self._lock:
+            name = self._cached(key)
+            if name is not None:
+                return name
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Beklerken başka bir thread adı çekmiş olabilir
+            with self._lock:
+                name = self._cached(key)
+                if name is None:
+                    self.misses += 1
+            if name is None:
+                name = fetch(key)
+                if name is not None:
+                    self.put(key, name)
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return name
+
+    async def async_lookup(self, key: str,
+                           fetch: Callable[[str], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        lookup() metodunun async karşılığı
+
+        Aynı event loop içinde aynı anahtar için devam eden bir istek varsa
+        yeni istek yapılmaz, onun sonucu beklenir.
+
+        Args:
+            key (str): Yazar anahtarı
+            fetch (Callable[[str], Awaitable[Optional[str]]]): Adı API'den çeken coroutine
+
+        Returns:
+            Optional[str]: Yazar adı veya None
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            name = self._cached(key)
+            if name is not None:
+                return name
+            pending = self._pending.get(key)
+            if pending is not None and pending[0] is loop:
+                self.hits += 1
+                future = pending[1]
+                owner = False
+            else:
+                self.misses += 1
+                future = loop.create_future()
+                self._pending[key] = (loop, future)
+                owner = True
+
+        if not owner:
+            return await asyncio.shield(future)
+
+        name = None
+        try:
+            name = await fetch(key)
+            if name is not None:
+                self.put(key, name)
+        finally:
+            with self._lock:
+                if self._pending.get(key, (None, None))[1] is future:
+                    del self._pending[key]
+            future.set_result(name)
+        return name
+
+    def _cached(self, key: str) -> Optional[str]:
+        """Kilit altında çağrılır; varsa adı döndürür ve isabet sayar"""
+        name = self._names.get(key)
+        if name is not None:
+            self._names.move_to_end(key)
+            self.hits += 1
+        return name
+
+    @property
+    def hit_ratio(self) -> float:
+        """İsabet oranı (0.0 - 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def load(self) -> None:
+        """Kayıtlı yazar adlarını dosyadan yükler"""
+        if not self.filename or not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Yazar önbelleği okunamadı: {e}")
+            return
+        with self._lock:
+            for key, name in data.items():
+                self._names[key] = name
+            while len(self._names) > self.max_entries:
+                self._names.popitem(last=False)
+
+    def save(self) -> None:
+        """Değişiklik varsa yazar adlarını dosyaya kaydeder"""
+        if not self.filename or not self._dirty:
+            return
+        with self._lock:
+            data = dict(self._names)
+            self._dirty = False
+        temp_filename = self.filename + '.tmp'
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(temp_filename, self.filename)
+        except OSError as e:
+            print(f"Yazar önbelleği kaydedilemedi: {e}")
+
+    def get_stats(self) -> dict:
+        """Önbellek sayaçlarını döndürür"""
+        return {
+            'entries': len(self._names),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hit_ratio, 4)
+        }
+
+    def __len__(self) -> int:
+        """Önbellekteki yazar sayısı"""
+        return len(self._names)
+
+
+# Varsayılan olarak tüm LibraryAPI nesneleri bu önbelleği paylaşır
+shared_author_cache = AuthorCache()
@@ -0,0 +1,249 @@
+"""
+Open Library veri dökümlerinden yerel ISBN dizini
+
+Open Library, tüm kayıtlarını her ay sekmeyle ayrılmış (TSV) ve gzip ile
+sıkıştırılmış döküm dosyaları olarak yayımlar. Her satır şu sütunlardan
+oluşur::
+
+    tür    anahtar    revizyon    son_değişiklik    JSON
+
+Bu modül editions, works ve authors dökümlerini satır satır okuyarak
+sabit bellekle bir SQLite dosyasına ISBN -> (başlık, yazar) dizini kurar.
+Dökümler herhangi bir sırayla (veya tek bir "all" dökümü olarak) içe
+aktarılabilir; yazar adları aramada birleştirilir. LibraryAPI, ISBN
+aramalarında önce bu dizine bakar ve yalnızca bulamazsa API'ye gider.
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+from isbn import compact_isbn
+
+
+EDITION_TYPE = '/type/edition'
+WORK_TYPE = '/type/work'
+AUTHOR_TYPE = '/type/author'
+
+
+def open_dump(path: str) -> TextIO:
+    """
+    Döküm dosyasını metin olarak açar (.gz uzantılıysa gzip ile)
+
+    Args:
+        path (str): Döküm dosyası
+
+    Returns:
+        TextIO: Satır satır okunabilen dosya nesnesi
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_records(lines: Iterator[str]) -> Iterator[Tuple[str, str, dict]]:
+    """
+    Döküm satırlarını (tür, anahtar, kayıt) üçlülerine çevirir
+
+    Bozuk satırlar atlanır. JSON içindeki sekmeler kaçışlı yazıldığı için
+    satır ilk dört sekmeden bölünebilir.
+
+    Args:
+        lines (Iterator[str]): Döküm satırları
+
+    Returns:
+        Iterator[Tuple[str, str, dict]]: Kayıt türü, anahtarı ve JSON verisi
+    """
+    for line in lines:
+        parts = line.rstrip('\n').split('\t', 4)
+        if len(parts) != 5 or parts[0] not in (EDITION_TYPE, WORK_TYPE, AUTHOR_TYPE):
+            continue
+        try:
+            record = json.loads(parts[4])
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield parts[0], parts[1], record
+
+
+def _author_keys(record: dict) -> str:
+    """Edition ({'key'}) veya work ({'author': {'key'}}) yazar listesini 'k1,k2' yapar"""
+    keys = []
+    for author in record.get('authors') or []:
+        if not isinstance(author, dict):
+            continue
+        if isinstance(author.get('author'), dict):
+            author = author['author']
+        key = author.get('key')
+        if isinstance(key, str) and key not in keys:
+            keys.append(key)
+    return ','.join(keys)
+
+
+class DumpIndex:
+    """Döküm dosyalarından kurulan, SQLite tabanlı ISBN dizini"""
+
+    def __init__(self, filename: str = "openlibrary_index.sqlite"):
+        """
+        DumpIndex sınıfının constructor'ı
+
+        Dosya ilk kullanımda açılır; arama yapılırken dosya yoksa
+        oluşturulmaz, dizin boş sayılır.
+
+        Args:
+            filename (str): Dizin veritabanı dosyası
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Veritabanını açar ve tabloları oluşturur (kilit altında çağrılır)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.filename, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS editions (
+                        isbn TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        author_keys TEXT NOT NULL,
+                        work_key TEXT
+                    ) WITHOUT ROWID
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS works (
+                        key TEXT PRIMARY KEY,
+                        author_keys TEXT NOT NULL
+                    ) WITHOUT ROWID
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS authors (
+                        key TEXT PRIMARY KEY,
+                        name TEXT NOT NULL
+                    ) WITHOUT ROWID
+                """)
+            self._conn = conn
+        return self._conn
+
+    def ingest(self, path: str, batch_size: int = 10000) -> Dict[str, int]:
+        """
+        Döküm dosyasını dizine aktarır
+
+        Dosya akış halinde okunur ve kayıtlar ``batch_size`` büyüklüğünde
+        gruplar halinde yazılır; bellek kullanımı dosya boyutundan bağımsızdır.
+        Aynı anahtar tekrar gelirse eski kayıt güncellenir.
+
+        Args:
+            path (str): Döküm dosyası (.txt veya .txt.gz)
+            batch_size (int): Tek işlemde yazılacak kayıt sayısı
+
+        Returns:
+            Dict[str, int]: Aktarılan edition ISBN, work ve author sayıları
+        """
+        counts = {'isbns': 0, 'works': 0, 'authors': 0}
+        editions: List[Tuple[str, str, str, Optional[str]]] = []
+        works: List[Tuple[str, str]] = []
+        authors: List[Tuple[str, str]] = []
+
+        # Dosya açılamazsa boş dizin oluşturulmasın
+        file = open_dump(path)
+        with self._lock:
+            conn = self._connect()
+            # Dizin her zaman dökümden yeniden kurulabilir; hız için fsync yapılmaz
+            conn.execute("PRAGMA synchronous=OFF")
+
+        def flush() -> None:
+            with self._lock, conn:
+                conn.executemany("INSERT OR REPLACE INTO editions VALUES (?, ?, ?, ?)", editions)
+                conn.executemany("INSERT OR REPLACE INTO works VALUES (?, ?)", works)
+                conn.executemany("INSERT OR REPLACE INTO authors VALUES (?, ?)", authors)
+            editions.clear()
+            works.clear()
+            authors.clear()
+
+        with file:
+            for record_type, key, record in iter_records(file):
+                if record_type == EDITION_TYPE:
+                    title = record.get('title')
+                    if not isinstance(title, str):
+                        continue
+                    work_keys = [work.get('key') for work in record.get('works') or []
+                                 if isinstance(work, dict)]
+                    work_key = work_keys[0] if work_keys else None
+                    author_keys = _author_keys(record)
+                    isbns = (record.get('isbn_13') or []) + (record.get('isbn_10') or [])
+                    for isbn in dict.fromkeys(compact_isbn(str(isbn)) for isbn in isbns):
+                        if isbn:
+                            editions.append((isbn, title, author_keys, work_key))
+                            counts['isbns'] += 1
+                elif record_type == WORK_TYPE:
+                    author_keys = _author_keys(record)
+                    if author_keys:
+                        works.append((key, author_keys))
+                        counts['works'] += 1
+                elif isinstance(record.get('name'), str):
+                    authors.append((key, record['name']))
+                    counts['authors'] += 1
+
+                if len(editions) + len(works) + len(authors) >= batch_size:
+                    flush()
+        flush()
+
+        with self._lock:
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return counts
+
+    def lookup(self, isbn: str) -> Optional[Tuple[str, str]]:
+        """
+        ISBN için başlık ve yazar adını dizinden okur
+
+        Edition kaydında yazar yoksa bağlı work kaydının yazarları
+        kullanılır. Adı dizinde olmayan yazarlar atlanır.
+
+        Args:
+            isbn (str): ISBN (tire içerebilir)
+
+        Returns:
+            Optional[Tuple[str, str]]: (başlık, yazar) veya bulunamazsa None
+        """
+        with self._lock:
+            if self._conn is None and not os.path.exists(self.filename):
+                return None
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT e.title, e.author_keys, w.author_keys FROM editions e "
+                "LEFT JOIN works w ON w.key = e.work_key WHERE e.isbn = ?",
+                (compact_isbn(isbn),)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+            keys = [key for key in (row[1] or row[2] or '').split(',') if key]
+            names = []
+            for key in keys:
+                name = conn.execute("SELECT name FROM authors WHERE key = ?", (key,)).fetchone()
+                if name:
+                    names.append(name[0])
+        return row[0], ', '.join(names) or 'Bilinmeyen Yazar'
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> dict:
+        """Dizin sayaçlarını döndürür"""
+        return {
+            'filename': self.filename,
+            'available': os.path.exists(self.filename),
+            'hits': self.hits,
+            'misses': self.misses
+        }
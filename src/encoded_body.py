@@ -0,0 +1,165 @@
+"""
+Önceden kodlanmış yanıt gövdeleri
+
+Sık okunan liste yanıtları bir kez JSON'a çevrilip bayt olarak saklanır;
+gzip ve brotli sıkıştırılmış hâlleri de ilk istendiklerinde üretilip
+saklanır. Böylece aynı yanıtın sonraki istekleri için model oluşturma,
+doğrulama, JSON kodlama ve sıkıştırma yapılmaz. Brotli için ``brotli``
+paketi gerekir; kurulu değilse sadece gzip kullanılır.
+
+Tüm kataloğu dışa aktarma gibi büyük yanıtlar ise saklanmaz; satır satır
+NDJSON olarak üretilip (istenirse gzip ile) akış halinde gönderilir.
+"""
+
+import gzip
+import json
+import threading
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def accepted_encodings(header: str) -> List[str]:
+    """
+    Accept-Encoding başlığındaki kabul edilen kodlamaları döndürür
+
+    Args:
+        header (str): Accept-Encoding başlığı (ör. 'gzip, br;q=0.8')
+
+    Returns:
+        List[str]: q=0 olmayan kodlama adları (küçük harfle)
+    """
+    encodings = []
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = params.strip().lower()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.append(name)
+    return encodings
+
+
+def choose_encoding(header: str) -> str:
+    """
+    İstemcinin kabul ettiği en iyi kodlamayı seçer
+
+    Args:
+        header (str): Accept-Encoding başlığı
+
+    Returns:
+        str: 'br', 'gzip' veya 'identity'
+    """
+    encodings = accepted_encodings(header)
+    if BROTLI_AVAILABLE and ('br' in encodings or '*' in encodings):
+        return 'br'
+    if 'gzip' in encodings or '*' in encodings:
+        return 'gzip'
+    return 'identity'
+
+
+class EncodedBody:
+    """Kodlanmış yanıt gövdesi ve sıkıştırılmış hâlleri"""
+
+    def __init__(self, body: bytes):
+        """
+        EncodedBody sınıfının constructor'ı
+
+        Args:
+            body (bytes): Sıkıştırılmamış gövde
+        """
+        self._variants: Dict[str, bytes] = {'identity': body}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Saklanan tüm hâllerin toplam boyutu (bayt)"""
+        return sum(len(variant) for variant in self._variants.values())
+
+    def get(self, encoding: str = 'identity') -> bytes:
+        """
+        Gövdeyi istenen kodlamayla döndürür; sıkıştırma ilk istekte yapılır
+
+        Args:
+            encoding (str): 'identity', 'gzip' veya 'br'
+
+        Returns:
+            bytes: Gövde baytları
+        """
+        variant = self._variants.get(encoding)
+        if variant is not None:
+            return variant
+
+        with self._lock:
+            variant = self._variants.get(encoding)
+            if variant is None:
+                body = self._variants['identity']
+                if encoding == 'gzip':
+                    # mtime=0: aynı gövde her zaman aynı baytları üretir
+                    variant = gzip.compress(body, compresslevel=6, mtime=0)
+                elif encoding == 'br' and BROTLI_AVAILABLE:
+                    variant = brotli.compress(body, quality=6)
+                else:
+                    raise ValueError(f"Desteklenmeyen kodlama: {encoding}")
+                self._variants[encoding] = variant
+        return variant
+
+
+def iter_ndjson(items: Iterable[Dict[str, Any]], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Kayıtları NDJSON (satır başına bir JSON nesnesi) baytlarına çevirir
+
+    Kayıtlar tek tek kodlanır; çok sayıda küçük yazma yapılmasın diye
+    satırlar ``chunk_size`` baytlık parçalarda birleştirilir. Bellekte en
+    fazla bir parça tutulur.
+
+    Args:
+        items (Iterable[Dict[str, Any]]): JSON'a çevrilecek kayıtlar
+        chunk_size (int): Parça boyutu sınırı (bayt)
+
+    Returns:
+        Iterator[bytes]: NDJSON parçaları
+    """
+    buffer: List[bytes] = []
+    size = 0
+    for item in items:
+        line = json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b''.join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Bayt parçalarını akış halinde gzip ile sıkıştırır
+
+    Args:
+        chunks (Iterable[bytes]): Sıkıştırılacak parçalar
+        level (int): Sıkıştırma seviyesi (1-9)
+
+    Returns:
+        Iterator[bytes]: gzip biçiminde sıkıştırılmış parçalar
+    """
+    # wbits=31: zlib yerine gzip başlığı ve sağlama toplamı yazılır
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
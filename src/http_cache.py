@@ -0,0 +1,382 @@
+"""
+Kalıcı HTTP yanıt önbelleği
+
+Open Library yanıtları URL'ye göre bir SQLite dosyasında saklanır. Her
+girişin bir son kullanma zamanı (TTL) vardır; süresi dolan girişler
+ETag / Last-Modified bilgisiyle sunucuya yeniden doğrulatılır
+(If-None-Match / If-Modified-Since). Sunucuya ulaşılamazsa veya sunucu
+hata verirse eski yanıt kullanılır. Giriş sayısı ya da toplam boyut sınırı
+aşılınca en uzun süredir kullanılmayan girişler silinir. Son kullanım zamanı
+her okumada değil, en fazla ``touch_interval`` saniyede bir yazılır; okumalar
+diske yazma (ve fsync) maliyeti taşımaz, LRU sırası bu kadar yaklaşıktır.
+
+Önbellek, httpx istemcisine bir transport olarak takılır; böylece
+LibraryAPI içindeki tüm GET istekleri kod değişmeden önbellekten geçer.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+import httpx
+
+
+# Önbellekte saklanan yanıt başlıkları; gövde zaten çözülmüş (gzip'siz) saklanır
+CACHED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+
+class CachedResponse:
+    """Önbellekten okunan yanıt"""
+
+    def __init__(self, status: int, body: bytes, headers: Dict[str, str], expires_at: float):
+        """
+        CachedResponse sınıfının constructor'ı
+
+        Args:
+            status (int): HTTP durum kodu
+            body (bytes): Yanıt gövdesi
+            headers (Dict[str, str]): Saklanan yanıt başlıkları
+            expires_at (float): Girişin tazeliğini yitirdiği zaman (epoch)
+        """
+        self.status = status
+        self.body = body
+        self.headers = headers
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        """Giriş sunucuya sormadan kullanılabilir mi?"""
+        return time.time() < self.expires_at
+
+
+class HTTPCache:
+    """SQLite tabanlı, TTL ve LRU sınırlı HTTP yanıt önbelleği"""
+
+    def __init__(self, filename: str = "http_cache.sqlite", ttl: float = 24 * 3600,
+                 max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024,
+                 touch_interval: float = 60.0):
+        """
+        HTTPCache sınıfının constructor'ı
+
+        Veritabanı ilk kullanımda açılır.
+
+        Args:
+            filename (str): Önbellek veritabanı dosyası
+            ttl (float): Varsayılan giriş ömrü (saniye)
+            max_entries (int): Maksimum giriş sayısı
+            max_bytes (int): Yanıt gövdelerinin toplam boyut sınırı
+            touch_interval (float): Okunan girişin son kullanım zamanı en
+                az bu kadar eskiyse güncellenir (saniye)
+        """
+        self.filename = filename
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        # Async istemci ve thread havuzu aynı bağlantıyı paylaşır
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Veritabanını açar ve tabloyu oluşturur (kilit altında çağrılır)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.filename, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS responses (
+                        url TEXT PRIMARY KEY,
+                        status INTEGER NOT NULL,
+                        headers TEXT NOT NULL,
+                        body BLOB NOT NULL,
+                        expires_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+            self._count, self._bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length(body)), 0) FROM responses").fetchone()
+            self._conn = conn
+        return self._conn
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        URL için saklanan yanıtı getirir (tazeliği kontrol edilmez)
+
+        Args:
+            url (str): İstek URL'i
+
+        Returns:
+            Optional[CachedResponse]: Saklanan yanıt veya None
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT status, headers, body, expires_at, accessed_at FROM responses "
+                "WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[4] >= self.touch_interval:
+                with conn:
+                    conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?",
+                                 (now, url))
+        return CachedResponse(row[0], row[2], json.loads(row[1]), row[3])
+
+    def put(self, url: str, status: int, body: bytes, headers: Dict[str, str],
+            ttl: Optional[float] = None) -> None:
+        """
+        Yanıtı saklar, sınırlar aşılırsa en eski girişleri siler
+
+        Args:
+            url (str): İstek URL'i
+            status (int): HTTP durum kodu
+            body (bytes): Yanıt gövdesi
+            headers (Dict[str, str]): Saklanacak yanıt başlıkları
+            ttl (Optional[float]): Giriş ömrü; verilmezse varsayılan kullanılır
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                old = conn.execute(
+                    "SELECT length(body) FROM responses WHERE url = ?", (url,)).fetchone()
+                if old is not None:
+                    self._count -= 1
+                    self._bytes -= old[0]
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, status, headers, body, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, status, json.dumps(headers), body, expires_at, now))
+                self._count += 1
+                self._bytes += len(body)
+                self._evict(conn)
+
+    def refresh(self, url: str, headers: Dict[str, str], ttl: Optional[float] = None) -> None:
+        """
+        304 yanıtından sonra girişin ömrünü ve doğrulayıcılarını yeniler
+
+        Args:
+            url (str): İstek URL'i
+            headers (Dict[str, str]): 304 yanıtındaki yeni başlıklar
+            ttl (Optional[float]): Giriş ömrü; verilmezse varsayılan kullanılır
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT headers FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            stored = json.loads(row[0])
+            stored.update(headers)
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET headers = ?, expires_at = ?, accessed_at = ? "
+                    "WHERE url = ?", (json.dumps(stored), expires_at, now, url))
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """En uzun süredir kullanılmayan girişleri sınırlar sağlanana kadar siler"""
+        while self._count > self.max_entries or self._bytes > self.max_bytes:
+            row = conn.execute(
+                "SELECT url, length(body) FROM responses ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._count -= 1
+            self._bytes -= row[1]
+
+    def clear(self) -> None:
+        """Tüm girişleri siler"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+            self._count = 0
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapatır (sonraki kullanımda yeniden açılır)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        """Önbellekteki giriş sayısı"""
+        with self._lock:
+            self._connect()
+            return self._count
+
+    def get_stats(self) -> dict:
+        """Önbellek sayaçlarını döndürür"""
+        return {
+            'entries': len(self),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'stale_served': self.stale_served
+        }
+
+    def lookup(self, request: httpx.Request) -> Optional[CachedResponse]:
+        """
+        İsteğe ait girişi bulur; giriş bayatsa doğrulama başlıklarını ekler
+
+        Args:
+            request (httpx.Request): Gönderilecek istek
+
+        Returns:
+            Optional[CachedResponse]: Saklanan yanıt veya None
+        """
+        cached = self.get(str(request.url))
+        if cached is None:
+            self.misses += 1
+        elif not cached.fresh:
+            if 'etag' in cached.headers:
+                request.headers['If-None-Match'] = cached.headers['etag']
+            if 'last-modified' in cached.headers:
+                request.headers['If-Modified-Since'] = cached.headers['last-modified']
+        return cached
+
+    def serve(self, cached: CachedResponse, request: httpx.Request, source: str) -> httpx.Response:
+        """
+        Saklanan yanıttan httpx yanıtı oluşturur
+
+        Args:
+            cached (CachedResponse): Saklanan yanıt
+            request (httpx.Request): Asıl istek
+            source (str): X-Cache başlığına yazılacak kaynak (HIT, REVALIDATED, STALE)
+
+        Returns:
+            httpx.Response: Yanıt
+        """
+        if source == 'HIT':
+            self.hits += 1
+        elif source == 'REVALIDATED':
+            self.revalidated += 1
+        else:
+            self.stale_served += 1
+        headers = dict(cached.headers, **{'X-Cache': source})
+        return httpx.Response(cached.status, headers=headers, content=cached.body,
+                              request=request)
+
+    def update(self, cached: Optional[CachedResponse], request: httpx.Request,
+               response: httpx.Response) -> httpx.Response:
+        """
+        Sunucu yanıtını (gövdesi okunmuş) önbelleğe işler
+
+        Args:
+            cached (Optional[CachedResponse]): Önceden saklanan yanıt
+            request (httpx.Request): Asıl istek
+            response (httpx.Response): Sunucu yanıtı
+
+        Returns:
+            httpx.Response: İstemciye dönecek yanıt
+        """
+        url = str(request.url)
+        headers = {name: response.headers[name] for name in CACHED_HEADERS
+                   if name in response.headers}
+
+        if response.status_code == 304 and cached is not None:
+            self.refresh(url, headers)
+            return self.serve(cached, request, 'REVALIDATED')
+
+        if response.status_code >= 500 and cached is not None:
+            return self.serve(cached, request, 'STALE')
+
+        if response.status_code == 200:
+            if 'no-store' not in response.headers.get('cache-control', '').lower():
+                self.put(url, 200, response.content, headers)
+            return httpx.Response(200, headers=dict(headers, **{'X-Cache': 'MISS'}),
+                                  content=response.content, request=request)
+
+        return response
+
+
+class CachingTransport(httpx.BaseTransport):
+    """Senkron httpx istemcisi için önbellekli transport"""
+
+    def __init__(self, cache: HTTPCache, transport: Optional[httpx.BaseTransport] = None):
+        """
+        CachingTransport sınıfının constructor'ı
+
+        Args:
+            cache (HTTPCache): Kullanılacak önbellek
+            transport (Optional[httpx.BaseTransport]): Asıl ağ transport'u
+        """
+        self.cache = cache
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != 'GET':
+            return self.transport.handle_request(request)
+
+        cached = self.cache.lookup(request)
+        if cached is not None and cached.fresh:
+            return self.cache.serve(cached, request, 'HIT')
+
+        try:
+            response = self.transport.handle_request(request)
+            response.read()
+        except httpx.TransportError:
+            # Çevrimdışı: eski yanıt varsa onu kullan
+            if cached is None:
+                raise
+            return self.cache.serve(cached, request, 'STALE')
+        return self.cache.update(cached, request, response)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async httpx istemcisi için önbellekli transport"""
+
+    def __init__(self, cache: HTTPCache, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        AsyncCachingTransport sınıfının constructor'ı
+
+        Args:
+            cache (HTTPCache): Kullanılacak önbellek
+            transport (Optional[httpx.AsyncBaseTransport]): Asıl ağ transport'u
+        """
+        self.cache = cache
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != 'GET':
+            return await self.transport.handle_async_request(request)
+
+        # SQLite sorguları ve yazımları event loop'u bloklamasın diye thread'de çalışır
+        cached = await asyncio.to_thread(self.cache.lookup, request)
+        if cached is not None and cached.fresh:
+            return self.cache.serve(cached, request, 'HIT')
+
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+        except httpx.TransportError:
+            # Çevrimdışı: eski yanıt varsa onu kullan
+            if cached is None:
+                raise
+            return self.cache.serve(cached, request, 'STALE')
+        return await asyncio.to_thread(self.cache.update, cached, request, response)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,114 @@
+"""
+ISBN doğrulama ve bilinmeyen ISBN önbelleği
+
+ISBN-10 ve ISBN-13 kontrol basamakları ağ isteği yapılmadan yerelde
+doğrulanır. Open Library'de bulunamayan (404) ISBN'ler kısa ömürlü bir
+negatif önbellekte tutulur; barkod okuyucuların tekrar tekrar gönderdiği
+hatalı ISBN'ler böylece API'ye gitmeden anında reddedilir.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+def compact_isbn(isbn: str) -> str:
+    """
+    ISBN'den tire ve boşlukları kaldırır, 'x' kontrol basamağını büyütür
+
+    Args:
+        isbn (str): Ham ISBN
+
+    Returns:
+        str: Sadece rakam (ve ISBN-10 için son karakterde 'X') içeren ISBN
+    """
+    return ''.join(c for c in isbn if c.isdigit() or c in 'xX').upper()
+
+
+def is_valid_isbn(isbn: str) -> bool:
+    """
+    ISBN-10 veya ISBN-13 kontrol basamağını doğrular
+
+    Args:
+        isbn (str): Doğrulanacak ISBN (tire ve boşluk içerebilir)
+
+    Returns:
+        bool: Geçerli bir ISBN mi?
+    """
+    if any(not (c.isdigit() or c in 'xX- ') for c in isbn):
+        return False
+
+    digits = compact_isbn(isbn)
+    if len(digits) == 10:
+        if not digits[:9].isdigit() or not (digits[9].isdigit() or digits[9] == 'X'):
+            return False
+        values = [int(c) for c in digits[:9]] + [10 if digits[9] == 'X' else int(digits[9])]
+        return sum((10 - i) * value for i, value in enumerate(values)) % 11 == 0
+
+    if len(digits) == 13 and digits.isdigit():
+        return sum(int(c) * (3 if i % 2 else 1) for i, c in enumerate(digits)) % 10 == 0
+
+    return False
+
+
+class NegativeCache:
+    """Bulunamayan ISBN'ler için TTL ve boyut sınırlı önbellek"""
+
+    def __init__(self, ttl: float = 6 * 3600, max_entries: int = 10000):
+        """
+        NegativeCache sınıfının constructor'ı
+
+        Args:
+            ttl (float): Bir ISBN'in 'bulunamadı' sayılacağı süre (saniye)
+            max_entries (int): Maksimum giriş sayısı
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def add(self, isbn: str) -> None:
+        """
+        ISBN'i bulunamadı olarak işaretler
+
+        Args:
+            isbn (str): ISBN
+        """
+        key = compact_isbn(isbn)
+        with self._lock:
+            self._expires[key] = time.time() + self.ttl
+            self._expires.move_to_end(key)
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+
+    def __contains__(self, isbn: str) -> bool:
+        """ISBN yakın zamanda bulunamadı olarak işaretlendi mi?"""
+        key = compact_isbn(isbn)
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._expires[key]
+                return False
+            self.hits += 1
+            return True
+
+    def discard(self, isbn: str) -> None:
+        """ISBN'i önbellekten çıkarır"""
+        with self._lock:
+            self._expires.pop(compact_isbn(isbn), None)
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._expires.clear()
+
+    def __len__(self) -> int:
+        """Önbellekteki ISBN sayısı"""
+        return len(self._expires)
+
+
+# Varsayılan olarak tüm LibraryAPI nesneleri bu önbelleği paylaşır
+shared_negative_cache = NegativeCache()
@@ -0,0 +1,74 @@
+"""
+Kütüphane değişiklik günlüğü (write-ahead journal)
+
+Her ekleme/silme/güncelleme işlemi, tüm kitap listesini yeniden yazmak
+yerine günlük dosyasının sonuna tek satırlık bir JSON kaydı olarak eklenir.
+"""
+
+import json
+import os
+from typing import Iterator
+
+
+class Journal:
+    """Append-only değişiklik günlüğü - her satır bir JSON kaydıdır"""
+
+    def __init__(self, filename: str):
+        """
+        Journal sınıfının constructor'ı
+
+        Args:
+            filename (str): Günlük dosyasının adı
+        """
+        self.filename = filename
+        self.entry_count = 0
+
+    def append(self, entry: dict) -> None:
+        """
+        Günlüğün sonuna yeni bir kayıt ekler
+
+        Args:
+            entry (dict): Kayıt ({'op': 'add' | 'remove' | 'update', ...})
+        """
+        line = json.dumps(entry, ensure_ascii=False)
+        with open(self.filename, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+            file.flush()
+        self.entry_count += 1
+
+    def replay(self) -> Iterator[dict]:
+        """
+        Günlükteki kayıtları yazılma sırasıyla döndürür
+
+        Yarım yazılmış (bozuk) satırlar atlanır; bu genellikle bir çökme
+        sırasında kesilmiş son kayıttır.
+
+        Returns:
+            Iterator[dict]: Günlük kayıtları
+        """
+        self.entry_count = 0
+        if not os.path.exists(self.filename):
+            return
+
+        with open(self.filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Bozuk günlük kaydı atlandı: {line[:40]}")
+                    continue
+                self.entry_count += 1
+                yield entry
+
+    def clear(self) -> None:
+        """Günlüğü sıfırlar (sıkıştırma sonrası çağrılır)"""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+        self.entry_count = 0
+
+    def exists(self) -> bool:
+        """Günlük dosyası mevcut mu?"""
+        return os.path.exists(self.filename)
@@ -3,18 +3,157 @@ Open Library API entegrasyonu için LibraryAPI sınıfı
 Aşama 2: Harici API entegrasyonu
 """
 
+import asyncio
 import httpx
 import json
-from typing import Optional, Dict, Any
+import os
+from typing import Optional, Dict, Any, List
+from author_cache import AuthorCache, shared_author_cache
 from book import Book
+from dump_index import DumpIndex
+from http_cache import AsyncCachingTransport, CachingTransport, HTTPCache
+from isbn import NegativeCache, compact_isbn, is_valid_isbn, shared_negative_cache
+from resilience import (AsyncResilientTransport, CircuitBreaker, ResilientTransport, TokenBucket,
+                        shared_circuit_breaker, shared_rate_limiter)
+from single_flight import AsyncSingleFlight
+
+try:
+    import h2  # noqa: F401 - HTTP/2 desteği için httpx[http2] gerekir
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Göreli önbellek/dizin dosyalarının varsayılan klasörü: proje kökü
+DEFAULT_DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class LibraryAPI:
-    """Open Library Books API ile entegrasyon"""
+    """
+    Open Library Books API ile entegrasyon
+    
+    Tüm istekler, nesneye ait tek bir keep-alive bağlantı havuzu üzerinden
+    yapılır; böylece her aramada yeniden TCP+TLS el sıkışması yapılmaz.
+    Havuz ilk istekte açılır ve aclose() ya da ``async with`` bloğunun
+    sonunda kapatılır. Async istemci açıldığı event loop'a bağlıdır; nesne
+    farklı asyncio.run() çağrıları arasında paylaşılmamalıdır.
+    
+    GET yanıtları varsayılan olarak kalıcı HTTP önbelleğinde (http_cache.py)
+    saklanır; tekrarlanan aramalar ağa gitmeden yerel dosyadan okunur.
+    Ağa giden istekler hız sınırlayıcıdan geçer, 429/5xx yanıtlarında
+    yeniden denenir ve Open Library çöktüğünde devre kesici hemen hata verir
+    (resilience.py). Open Library dökümlerinden kurulmuş yerel bir dizin
+    (dump_index.py) varsa ISBN aramaları önce oradan yanıtlanır.
+    """
     
-    def __init__(self):
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, http2: bool = False,
+                 cache_file: Optional[str] = "http_cache.sqlite",
+                 cache_ttl: float = 24 * 3600,
+                 author_cache: Optional[AuthorCache] = None,
+                 negative_cache: Optional[NegativeCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 max_retries: int = 3,
+                 index_file: Optional[str] = "openlibrary_index.sqlite",
+                 data_dir: Optional[str] = None):
+        """
+        LibraryAPI sınıfının constructor'ı
+        
+        Args:
+            max_connections (int): Havuzdaki maksimum eşzamanlı bağlantı sayısı
+            max_keepalive_connections (int): Açık tutulacak boştaki bağlantı sayısı
+            keepalive_expiry (float): Boştaki bağlantının kapatılma süresi (saniye)
+            http2 (bool): HTTP/2 kullan (h2 paketi kurulu değilse yok sayılır)
+            cache_file (Optional[str]): HTTP önbellek dosyası; None ise önbellek kapalı
+            cache_ttl (float): Önbellek girişlerinin yeniden doğrulanmadan
+                kullanılacağı süre (saniye)
+            author_cache (Optional[AuthorCache]): Yazar adı önbelleği; verilmezse
+                tüm LibraryAPI nesnelerinin paylaştığı önbellek kullanılır
+            negative_cache (Optional[NegativeCache]): Bulunamayan ISBN önbelleği;
+                verilmezse paylaşılan önbellek kullanılır
+            rate_limiter (Optional[TokenBucket]): İstek hız sınırlayıcı;
+                verilmezse paylaşılan sınırlayıcı kullanılır
+            circuit_breaker (Optional[CircuitBreaker]): Devre kesici; verilmezse
+                paylaşılan devre kesici kullanılır
+            max_retries (int): 429/5xx ve bağlantı hatalarında yeniden deneme sayısı
+            index_file (Optional[str]): Döküm dizini dosyası; None ise dizin kullanılmaz
+            data_dir (Optional[str]): Göreli cache_file/index_file yollarının
+                çözüleceği klasör; verilmezse proje kökü (çalışma dizini değil)
+        """
+        data_dir = data_dir if data_dir is not None else DEFAULT_DATA_DIR
+        if cache_file:
+            cache_file = os.path.join(data_dir, cache_file)
+        if index_file:
+            index_file = os.path.join(data_dir, index_file)
         self.base_url = "https://openlibrary.org"
         self.timeout = 10.0  # 10 saniye timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.http_cache = HTTPCache(cache_file, ttl=cache_ttl) if cache_file else None
+        self.author_cache = author_cache if author_cache is not None else shared_author_cache
+        self.negative_cache = negative_cache if negative_cache is not None else shared_negative_cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else shared_rate_limiter
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else shared_circuit_breaker
+        self.max_retries = max_retries
+        self.dump_index = DumpIndex(index_file) if index_file else None
+        # Aynı ISBN için eşzamanlı aramalar tek API isteğini paylaşır
+        self._lookups = AsyncSingleFlight()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Paylaşılan async HTTP istemcisi (ilk kullanımda oluşturulur)"""
+        if self._client is None or self._client.is_closed:
+            transport = AsyncResilientTransport(
+                httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2),
+                self.rate_limiter, self.circuit_breaker, max_retries=self.max_retries)
+            if self.http_cache is not None:
+                transport = AsyncCachingTransport(self.http_cache, transport)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url, timeout=self.timeout, transport=transport)
+        return self._client
+    
+    @property
+    def sync_client(self) -> httpx.Client:
+        """Senkron çağrılar için paylaşılan HTTP istemcisi"""
+        if self._sync_client is None or self._sync_client.is_closed:
+            transport = ResilientTransport(
+                httpx.HTTPTransport(limits=self.limits, http2=self.http2),
+                self.rate_limiter, self.circuit_breaker, max_retries=self.max_retries)
+            if self.http_cache is not None:
+                transport = CachingTransport(self.http_cache, transport)
+            self._sync_client = httpx.Client(
+                base_url=self.base_url, timeout=self.timeout, transport=transport)
+        return self._sync_client
+    
+    async def aclose(self) -> None:
+        """Bağlantı havuzlarını kapatır"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
+    
+    def close(self) -> None:
+        """Senkron bağlantı havuzunu ve önbellek dosyasını kapatır"""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.dump_index is not None:
+            self.dump_index.close()
+        self.author_cache.save()
+    
+    async def __aenter__(self) -> "LibraryAPI":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
     
     async def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
         """
@@ -26,27 +165,53 @@ class LibraryAPI:
         Returns:
             Optional[Book]: Kitap nesnesi veya None
         """
-        try:
-            # ISBN formatını temizle (sadece rakam ve tire)
-            clean_isbn = ''.join(c for c in isbn if c.isdigit() or c == '-')
+        # ISBN formatını temizle (sadece rakam, tire ve 'X')
+        clean_isbn = self._clean_isbn(isbn)
+        
+        # Hatalı veya yakın zamanda bulunamamış ISBN'ler için ağa gidilmez
+        if not is_valid_isbn(clean_isbn):
+            print(f"❌ Geçersiz ISBN: {isbn}")
+            return None
+        book = self._lookup_index(clean_isbn)
+        if book:
+            print(f"✅ Kitap bulundu: {book.title} by {book.author} (yerel dizin)")
+            return book
+        if clean_isbn in self.negative_cache:
+            print(f"❌ ISBN {isbn} ile kitap bulunamadı! (önbellekten)")
+            return None
+        
+        # Aynı ISBN için devam eden istek varsa onun sonucu beklenir; her
+        # çağıran kendi Book nesnesini alır
+        book = await self._lookups.do(
+            compact_isbn(clean_isbn), lambda: self._request_book(isbn, clean_isbn))
+        return Book(book.title, book.author, clean_isbn) if book else None
+    
+    async def _request_book(self, isbn: str, clean_isbn: str) -> Optional[Book]:
+        """
+        Kitap bilgileri için API isteğini yapar
+        
+        Args:
+            isbn (str): Kullanıcının verdiği ISBN
+            clean_isbn (str): Temizlenmiş ISBN
             
-            # API endpoint
-            url = f"{self.base_url}/isbn/{clean_isbn}.json"
+        Returns:
+            Optional[Book]: Kitap nesnesi veya None
+        """
+        try:
+            # HTTP isteği gönder (havuzdaki bağlantı yeniden kullanılır)
+            response = await self.client.get(f"/isbn/{clean_isbn}.json")
             
-            # HTTP isteği gönder
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                
-                if response.status_code == 200:
-                    # JSON yanıtını parse et
-                    book_data = response.json()
-                    return self._parse_book_data(book_data, clean_isbn)
-                elif response.status_code == 404:
-                    print(f"❌ ISBN {isbn} ile kitap bulunamadı!")
-                    return None
-                else:
-                    print(f"❌ API hatası: {response.status_code}")
-                    return None
+            if response.status_code == 200:
+                # JSON yanıtını parse et
+                book_data = response.json()
+                return await self._parse_book_data(book_data, clean_isbn)
+            elif response.status_code == 404:
+                self.negative_cache.add(clean_isbn)
+                print(f"❌ ISBN {isbn} ile kitap bulunamadı!")
+                return None
+            else:
+                print(f"❌ API hatası: {response.status_code}")
+                return None
                     
         except httpx.TimeoutException:
             print("❌ API isteği zaman aşımına uğradı!")
@@ -58,7 +223,135 @@ class LibraryAPI:
             print(f"❌ Beklenmeyen hata: {e}")
             return None
     
-    def _parse_book_data(self, data: Dict[str, Any], isbn: str) -> Book:
+    def _lookup_index(self, isbn: str) -> Optional[Book]:
+        """
+        Kitabı yerel döküm dizininde arar
+        
+        Args:
+            isbn (str): Temizlenmiş ISBN
+            
+        Returns:
+            Optional[Book]: Dizinde bulunan kitap veya None
+        """
+        if self.dump_index is None:
+            return None
+        entry = self.dump_index.lookup(isbn)
+        return Book(title=entry[0], author=entry[1], isbn=isbn) if entry else None
+    
+    async def get_books_by_isbns(self, isbns: List[str], batch_size: int = 50,
+                                 concurrency: int = 4) -> List[Optional[Book]]:
+        """
+        Birden çok ISBN'i Open Library Books API ile toplu olarak çeker
+        
+        ISBN'ler ``batch_size`` büyüklüğünde gruplara ayrılır ve her grup
+        tek bir ``/api/books?bibkeys=ISBN:a,ISBN:b,...&jscmd=data`` isteğiyle
+        çekilir. Bu yanıtta yazar adları da bulunduğu için ayrıca yazar
+        isteği yapılmaz. Yerel döküm dizininde bulunan, geçersiz ve yakın
+        zamanda bulunamamış ISBN'ler istenmez; yanıtta olmayan ISBN'ler
+        negatif önbelleğe eklenir.
+        
+        Args:
+            isbns (List[str]): Çekilecek ISBN'ler
+            batch_size (int): Bir istekteki maksimum ISBN sayısı
+            concurrency (int): Aynı anda yapılacak maksimum toplu istek
+            
+        Returns:
+            List[Optional[Book]]: Girdi sırasıyla bulunan kitaplar (yoksa None)
+        """
+        clean_isbns = [self._clean_isbn(isbn) for isbn in isbns]
+        found: Dict[str, Book] = {}
+        unique = []
+        for isbn in dict.fromkeys(clean_isbns):
+            if not is_valid_isbn(isbn):
+                continue
+            book = self._lookup_index(isbn)
+            if book:
+                found[isbn] = book
+            elif isbn not in self.negative_cache:
+                unique.append(isbn)
+        batch_size = max(1, batch_size)
+        batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(batch: List[str]) -> None:
+            async with semaphore:
+                result = await self._fetch_batch(batch)
+            if result is None:
+                return
+            found.update(result)
+            for isbn in batch:
+                if isbn not in result:
+                    self.negative_cache.add(isbn)
+        
+        await asyncio.gather(*(fetch(batch) for batch in batches))
+        return [found.get(isbn) for isbn in clean_isbns]
+    
+    async def _fetch_batch(self, isbns: List[str]) -> Optional[Dict[str, Book]]:
+        """
+        Tek bir toplu Books API isteği yapar
+        
+        Args:
+            isbns (List[str]): Temizlenmiş ISBN'ler
+            
+        Returns:
+            Optional[Dict[str, Book]]: ISBN -> bulunan kitap; istek başarısızsa None
+        """
+        # Tireli ve tiresiz yazılışlar aynı bibkey'e düşebilir
+        bibkeys: Dict[str, List[str]] = {}
+        for isbn in isbns:
+            bibkeys.setdefault(f"ISBN:{isbn.replace('-', '')}", []).append(isbn)
+        
+        params = {'bibkeys': ','.join(bibkeys), 'jscmd': 'data', 'format': 'json'}
+        try:
+            response = await self.client.get("/api/books", params=params)
+            if response.status_code != 200:
+                print(f"❌ API hatası: {response.status_code}")
+                return None
+            data = response.json()
+        except httpx.TimeoutException:
+            print("❌ API isteği zaman aşımına uğradı!")
+            return None
+        except httpx.RequestError as e:
+            print(f"❌ Ağ hatası: {e}")
+            return None
+        except ValueError as e:
+            print(f"❌ Geçersiz API yanıtı: {e}")
+            return None
+        
+        found: Dict[str, Book] = {}
+        if not isinstance(data, dict):
+            return None
+        for bibkey, entry in data.items():
+            if bibkey not in bibkeys or not isinstance(entry, dict):
+                continue
+            for isbn in bibkeys[bibkey]:
+                found[isbn] = self._parse_books_api_entry(entry, isbn)
+        return found
+    
+    def _parse_books_api_entry(self, entry: Dict[str, Any], isbn: str) -> Book:
+        """
+        Books API (jscmd=data) yanıtındaki bir kaydı Book nesnesine çevirir
+        
+        Args:
+            entry (Dict): Tek kitabın yanıt verisi
+            isbn (str): Kitap ISBN'i
+            
+        Returns:
+            Book: Oluşturulan kitap nesnesi
+        """
+        title = entry.get('title') or 'Bilinmeyen Başlık'
+        names = [author.get('name') for author in entry.get('authors', [])
+                 if isinstance(author, dict) and author.get('name')]
+        author_name = ', '.join(dict.fromkeys(names)) or 'Bilinmeyen Yazar'
+        return Book(title=title, author=author_name, isbn=isbn)
+    
+    @staticmethod
+    def _clean_isbn(isbn: str) -> str:
+        """ISBN'den rakam, tire ve ISBN-10 kontrol basamağı 'X' dışındaki karakterleri temizler"""
+        return ''.join(c for c in isbn if c.isdigit() or c == '-' or c in 'xX').upper()
+    
+    async def _parse_book_data(self, data: Dict[str, Any], isbn: str) -> Book:
         """
         API yanıtından Book nesnesi oluşturur
         
@@ -72,18 +365,10 @@ class LibraryAPI:
         # Kitap başlığı
         title = data.get('title', 'Bilinmeyen Başlık')
         
-        # Yazar bilgisi
-        authors = data.get('authors', [])
-        if authors and len(authors) > 0:
-            # İlk yazarın adını al
-            author_key = authors[0].get('key', '')
-            if author_key:
-                # Yazar detaylarını çek
-                author_name = self._get_author_name(author_key)
-            else:
-                author_name = 'Bilinmeyen Yazar'
-        else:
-            author_name = 'Bilinmeyen Yazar'
+        # Yazar bilgisi - tüm yazarlar aynı anda çözülür
+        author_keys = [author.get('key') for author in data.get('authors', [])
+                       if isinstance(author, dict) and author.get('key')]
+        author_name = await self._get_author_names(author_keys)
         
         # Yeni Book nesnesi oluştur
         book = Book(title=title, author=author_name, isbn=isbn)
@@ -91,9 +376,28 @@ class LibraryAPI:
         print(f"✅ Kitap bulundu: {title} by {author_name}")
         return book
     
-    def _get_author_name(self, author_key: str) -> str:
+    async def _get_author_names(self, author_keys: List[str]) -> str:
         """
-        Yazar anahtarından yazar adını çeker
+        Yazar anahtarlarını eşzamanlı olarak çözer ve adları birleştirir
+        
+        Args:
+            author_keys (List[str]): Yazar anahtarları
+            
+        Returns:
+            str: Virgülle ayrılmış yazar adları
+        """
+        # Tekrarlanan anahtarlar bir kez istenir, sıra korunur
+        author_keys = list(dict.fromkeys(author_keys))
+        if not author_keys:
+            return 'Bilinmeyen Yazar'
+        
+        names = await asyncio.gather(*(self._get_author_name(key) for key in author_keys))
+        known = [name for name in names if name != 'Bilinmeyen Yazar']
+        return ', '.join(known) if known else 'Bilinmeyen Yazar'
+    
+    async def _get_author_name(self, author_key: str) -> str:
+        """
+        Yazar anahtarından yazar adını çeker (önce yazar önbelleğine bakılır)
         
         Args:
             author_key (str): Yazar anahtarı
@@ -101,20 +405,38 @@ class LibraryAPI:
         Returns:
             str: Yazar adı
         """
-        try:
-            # Senkron HTTP isteği (basitlik için)
-            url = f"{self.base_url}{author_key}.json"
+        name = await self.author_cache.async_lookup(author_key, self._request_author_name)
+        return name or 'Bilinmeyen Yazar'
+    
+    async def _request_author_name(self, author_key: str) -> Optional[str]:
+        """
+        Yazar adını API'den çeker
+        
+        Args:
+            author_key (str): Yazar anahtarı
             
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
-                if response.status_code == 200:
-                    author_data = response.json()
-                    return author_data.get('name', 'Bilinmeyen Yazar')
-                else:
-                    return 'Bilinmeyen Yazar'
-                    
+        Returns:
+            Optional[str]: Yazar adı veya None
+        """
+        try:
+            response = await self.client.get(f"{author_key}.json")
+            if response.status_code == 200:
+                return response.json().get('name')
+            return None
         except Exception:
-            return 'Bilinmeyen Yazar'
+            return None
+    
+    def get_stats(self) -> dict:
+        """API önbelleklerinin istatistiklerini döndürür"""
+        stats = {
+            'author_cache': self.author_cache.get_stats(),
+            'circuit_breaker': self.circuit_breaker.get_stats()
+        }
+        if self.http_cache is not None:
+            stats['http_cache'] = self.http_cache.get_stats()
+        if self.dump_index is not None:
+            stats['dump_index'] = self.dump_index.get_stats()
+        return stats
     
     def search_books(self, query: str, limit: int = 10) -> list:
         """
@@ -128,30 +450,28 @@ class LibraryAPI:
             list: Kitap listesi
         """
         try:
-            url = f"{self.base_url}/search.json"
             params = {
                 'q': query,
                 'limit': limit
             }
             
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
+            response = self.sync_client.get("/search.json", params=params)
+            
+            if response.status_code == 200:
+                search_data = response.json()
+                books = []
                 
-                if response.status_code == 200:
-                    search_data = response.json()
-                    books = []
-                    
-                    for doc in search_data.get('docs', [])[:limit]:
-                        title = doc.get('title', 'Bilinmeyen Başlık')
-                        author = doc.get('author_name', ['Bilinmeyen Yazar'])[0] if doc.get('author_name') else 'Bilinmeyen Yazar'
-                        isbn = doc.get('isbn', [''])[0] if doc.get('isbn') else f"search-{len(books)}"
-                        
-                        book = Book(title=title, author=author, isbn=isbn)
-                        books.append(book)
+                for doc in search_data.get('docs', [])[:limit]:
+                    title = doc.get('title', 'Bilinmeyen Başlık')
+                    author = doc.get('author_name', ['Bilinmeyen Yazar'])[0] if doc.get('author_name') else 'Bilinmeyen Yazar'
+                    isbn = doc.get('isbn', [''])[0] if doc.get('isbn') else f"search-{len(books)}"
                     
-                    return books
-                else:
-                    return []
+                    book = Book(title=title, author=author, isbn=isbn)
+                    books.append(book)
+                
+                return books
+            else:
+                return []
                     
         except Exception as e:
             print(f"❌ Arama hatası: {e}")
@@ -164,8 +484,10 @@ def test_library_api():
     import asyncio
     
     async def test():
-        api = LibraryAPI()
-        
+        async with LibraryAPI() as api:
+            await run_tests(api)
+    
+    async def run_tests(api):
         # Test ISBN'ler
         test_isbns = [
             "978-0-7475-3269-9",  # Harry Potter
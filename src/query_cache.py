@@ -0,0 +1,87 @@
+"""
+Sorgu sonucu önbelleği
+
+Arama ve listeleme sonuçları, kütüphanenin sürüm numarasıyla birlikte
+saklanır. Kütüphane değiştiğinde sürüm artar; eski sürüme ait girişler
+silinmeye gerek kalmadan geçersiz sayılır ve LRU sırasıyla dışarı itilir.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class QueryCache:
+    """Giriş sayısı ve yaklaşık bayt boyutuyla sınırlı LRU önbellek"""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        """
+        QueryCache sınıfının constructor'ı
+
+        Args:
+            max_entries (int): Maksimum giriş sayısı
+            max_bytes (int): Girişlerin toplam tahmini boyut sınırı
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any, int]]" = OrderedDict()
+        # Flask istekleri farklı thread'lerden gelebilir
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int) -> Tuple[bool, Any]:
+        """
+        Önbellekten sonuç okur
+
+        Args:
+            key (Hashable): Sorgu anahtarı
+            version (int): Kütüphanenin güncel sürümü
+
+        Returns:
+            Tuple[bool, Any]: (bulundu mu, değer)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Hashable, version: int, value: Any, size: int) -> None:
+        """
+        Sonucu önbelleğe yazar, sınır aşılırsa en eski girişleri çıkarır
+
+        Args:
+            key (Hashable): Sorgu anahtarı
+            version (int): Sonucun hesaplandığı kütüphane sürümü
+            value (Any): Saklanacak sonuç
+            size (int): Sonucun tahmini boyutu (bayt)
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[2]
+
+            self._entries[key] = (version, value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        """Önbellekteki giriş sayısı"""
+        return len(self._entries)
@@ -0,0 +1,358 @@
+"""
+Open Library istekleri için dayanıklılık katmanı
+
+- TokenBucket: istemci tarafında saniye başına istek sınırı
+- Yeniden deneme: 429 ve 5xx yanıtlarında (ve bağlantı hatalarında)
+  rastgele gecikmeli (jitter) üstel geri çekilme
+- CircuitBreaker: art arda hatalardan sonra Open Library'ye bir süre hiç
+  istek göndermeden hemen hata verir; süre dolunca tek bir deneme isteği
+  geçirir ve başarılı olursa normale döner. Deneme isteği 429 alırsa ya
+  da iptal edilirse sonuç sayılmaz; deneme hakkı bir sonraki isteğe geçer
+
+Katman httpx istemcisine transport olarak takılır; HTTP önbelleğinin
+altında çalıştığı için önbellekten dönen yanıtlar sınıra takılmaz, devre
+açıkken de önbellekteki eski yanıtlar kullanılabilir.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional, Tuple
+import httpx
+
+
+# Yeniden denenecek durum kodları
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Devre açıkken yapılan istek için fırlatılır"""
+
+
+class TokenBucket:
+    """Token bucket hız sınırlayıcı (thread ve coroutine güvenli)"""
+
+    def __init__(self, rate: float = 10.0, capacity: int = 20):
+        """
+        TokenBucket sınıfının constructor'ı
+
+        Args:
+            rate (float): Saniyede eklenen token (istek) sayısı
+            capacity (int): Biriktirilebilecek maksimum token (ani yük payı)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Bir token ayırır ve beklenmesi gereken süreyi döndürür
+
+        Token yoksa bakiye eksiye düşer; sonraki çağrılar sırayla daha uzun
+        bekler ve böylece hız sınırı istek kuyruğunda da korunur.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Token alınana kadar bekler (senkron)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Token alınana kadar event loop'u bloklamadan bekler"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """Kapalı / açık / yarı açık durumlu devre kesici"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        CircuitBreaker sınıfının constructor'ı
+
+        Args:
+            failure_threshold (int): Devreyi açan art arda hata sayısı
+            reset_timeout (float): Devrenin açık kalacağı süre (saniye)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Güncel durum; açık devrenin süresi dolduysa yarı açık sayılır"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def admit(self) -> Tuple[bool, bool]:
+        """
+        İsteğe izin verir ve deneme isteği olup olmadığını söyler
+
+        Yarı açık durumda aynı anda yalnızca bir deneme isteğine izin verilir.
+        Deneme isteği alan çağıran, sonuç ne olursa olsun ``release_trial``
+        çağırmalıdır.
+
+        Returns:
+            Tuple[bool, bool]: (istek gönderilebilir mi, deneme isteği mi)
+        """
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True, False
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True, True
+            self.rejected += 1
+            return False, False
+
+    def allow_request(self) -> bool:
+        """
+        İsteğin gönderilip gönderilemeyeceğini söyler
+
+        Returns:
+            bool: İstek gönderilebilir mi?
+        """
+        return self.admit()[0]
+
+    def release_trial(self) -> None:
+        """
+        Deneme hakkını sonucu kaydetmeden bırakır
+
+        429 yanıtı (sunucu ayakta ama yavaşlatıyor) veya iptal edilen istek
+        devrenin durumunu değiştirmez; devre yarı açık kalır ve sonraki istek
+        yeniden deneme yapabilir.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Başarılı yanıt: devreyi kapatır"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Başarısız yanıt: eşik aşılırsa veya deneme başarısızsa devreyi açar"""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def get_stats(self) -> dict:
+        """Devre durumunu döndürür"""
+        state = self.state
+        retry_in = 0.0
+        if state == self.OPEN:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        return {
+            'state': state,
+            'failures': self._failures,
+            'rejected': self.rejected,
+            'retry_in': round(retry_in, 1)
+        }
+
+
+class _ResilienceMixin:
+    """Senkron ve async transport'ların ortak ayarları ve hesapları"""
+
+    def _setup(self, rate_limiter: Optional[TokenBucket], circuit_breaker: Optional[CircuitBreaker],
+               max_retries: int, base_delay: float, max_delay: float) -> None:
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def _check_circuit(self, request: httpx.Request) -> bool:
+        """
+        Devre açıksa isteği göndermeden hata fırlatır
+
+        Returns:
+            bool: İstek yarı açık devrenin deneme isteği mi?
+        """
+        if self.circuit_breaker is None:
+            return False
+        allowed, trial = self.circuit_breaker.admit()
+        if not allowed:
+            raise CircuitOpenError("Open Library geçici olarak devre dışı (devre açık)",
+                                   request=request)
+        return trial
+
+    def _release(self, trial: bool) -> None:
+        """Sonucu kaydedilmemiş deneme hakkını bırakır (finally içinde çağrılır)"""
+        if trial:
+            self.circuit_breaker.release_trial()
+
+    def _record(self, success: bool) -> None:
+        if self.circuit_breaker is None:
+            return
+        if success:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Yeniden deneme öncesi beklenecek süre
+
+        Sunucu Retry-After gönderdiyse ona uyulur; yoksa üstel sınır içinde
+        rastgele bir süre seçilir (full jitter).
+        """
+        if response is not None:
+            retry_after = response.headers.get('retry-after', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class ResilientTransport(_ResilienceMixin, httpx.BaseTransport):
+    """Senkron istemci için hız sınırı, yeniden deneme ve devre kesici"""
+
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        ResilientTransport sınıfının constructor'ı
+
+        Args:
+            transport (Optional[httpx.BaseTransport]): Asıl ağ transport'u
+            rate_limiter (Optional[TokenBucket]): Hız sınırlayıcı
+            circuit_breaker (Optional[CircuitBreaker]): Devre kesici
+            max_retries (int): Maksimum yeniden deneme sayısı
+            base_delay (float): İlk yeniden deneme için üst gecikme sınırı (saniye)
+            max_delay (float): Maksimum gecikme (saniye)
+        """
+        self.transport = transport or httpx.HTTPTransport()
+        self._setup(rate_limiter, circuit_breaker, max_retries, base_delay, max_delay)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            trial = self._check_circuit(request)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+
+                try:
+                    response = self.transport.handle_request(request)
+                except httpx.ConnectError:
+                    self._record(False)
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._delay(attempt)
+                except httpx.TransportError:
+                    # Zaman aşımları yeniden denenmez; zaten uzun sürmüştür
+                    self._record(False)
+                    raise
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        self._record(True)
+                        return response
+
+                    if response.status_code >= 500:
+                        self._record(False)
+                    if attempt >= self.max_retries:
+                        return response
+                    delay = self._delay(attempt, response)
+                    response.close()
+            finally:
+                # 429 ve iptal (ör. KeyboardInterrupt) deneme hakkını kilitlemesin
+                self._release(trial)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncResilientTransport(_ResilienceMixin, httpx.AsyncBaseTransport):
+    """Async istemci için hız sınırı, yeniden deneme ve devre kesici"""
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        AsyncResilientTransport sınıfının constructor'ı
+
+        Args:
+            transport (Optional[httpx.AsyncBaseTransport]): Asıl ağ transport'u
+            rate_limiter (Optional[TokenBucket]): Hız sınırlayıcı
+            circuit_breaker (Optional[CircuitBreaker]): Devre kesici
+            max_retries (int): Maksimum yeniden deneme sayısı
+            base_delay (float): İlk yeniden deneme için üst gecikme sınırı (saniye)
+            max_delay (float): Maksimum gecikme (saniye)
+        """
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self._setup(rate_limiter, circuit_breaker, max_retries, base_delay, max_delay)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            trial = self._check_circuit(request)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+
+                try:
+                    response = await self.transport.handle_async_request(request)
+                except httpx.ConnectError:
+                    self._record(False)
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._delay(attempt)
+                except httpx.TransportError:
+                    # Zaman aşımları yeniden denenmez; zaten uzun sürmüştür
+                    self._record(False)
+                    raise
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        self._record(True)
+                        return response
+
+                    if response.status_code >= 500:
+                        self._record(False)
+                    if attempt >= self.max_retries:
+                        return response
+                    delay = self._delay(attempt, response)
+                    await response.aclose()
+            finally:
+                # 429 ve iptal (CancelledError) deneme hakkını kilitlemesin
+                self._release(trial)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+# Varsayılan olarak tüm LibraryAPI nesneleri aynı sınırı ve devreyi paylaşır
+shared_rate_limiter = TokenBucket()
+shared_circuit_breaker = CircuitBreaker()
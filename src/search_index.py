@@ -0,0 +1,745 @@
+"""
+Arama indeksleri
+
+Library.search_books her aramada tüm kitapları taramak yerine bu
+indekslerden aday kitap kümesini alır; sonuçlar ardından asıl eşleşme
+kuralıyla doğrulanır.
+"""
+
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from book import Book
+
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Türkçe büyük I/İ harflerinin doğru küçük karşılıkları
+TURKISH_UPPER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+# Arama anahtarında alanları ayırır; normalize edilmiş terimde bulunamaz
+FIELD_SEPARATOR = '\n'
+
+
+def normalize(text: str) -> str:
+    """
+    Metni arama için normalize eder
+
+    Türkçe kurallarına göre küçük harfe çevirir (I -> ı, İ -> i), aksanları
+    kaldırır (ş -> s, ü -> u, ı -> i) ve boşlukları tek boşluğa indirir.
+    Böylece "IŞIK", "ışık" ve "isik" aynı anahtarı verir.
+
+    Args:
+        text (str): Normalize edilecek metin
+
+    Returns:
+        str: Normalize edilmiş metin
+    """
+    text = text.translate(TURKISH_UPPER).casefold()
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.replace('ı', 'i').split())
+
+
+def search_key(book: Book) -> str:
+    """
+    Kitabın başlık, yazar ve ISBN'inden tek bir arama anahtarı üretir
+
+    Library bu anahtarı kitap eklenirken bir kez hesaplar; aramalar sadece
+    normalize edilmiş terimin bu anahtarda geçip geçmediğine bakar.
+
+    Args:
+        book (Book): Kitap
+
+    Returns:
+        str: Alanları FIELD_SEPARATOR ile ayrılmış normalize edilmiş metin
+    """
+    return FIELD_SEPARATOR.join([normalize(book.title), normalize(book.author),
+                                 normalize(book.isbn)])
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    İki kelime arasındaki düzenleme (Levenshtein) mesafesini hesaplar
+
+    Args:
+        a (str): Birinci kelime
+        b (str): İkinci kelime
+
+    Returns:
+        int: Ekleme/silme/değiştirme sayısı
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def matches_keyword(book: Book, keyword: str) -> bool:
+    """
+    Kitabın başlık, yazar veya ISBN'i arama terimini içeriyor mu?
+
+    Anahtarı her seferinde yeniden hesapladığı için sadece indeks dışı
+    yollarda kullanılır.
+
+    Args:
+        book (Book): Kontrol edilecek kitap
+        keyword (str): Normalize edilmiş arama terimi
+
+    Returns:
+        bool: Eşleşme var mı?
+    """
+    return keyword in search_key(book)
+
+
+def _intersect(groups: List[Set[str]]) -> Set[str]:
+    """Kümelerin kesişimini en küçük kümeden başlayarak hesaplar"""
+    groups = sorted(groups, key=len)
+    result = set(groups[0])
+    for group in groups[1:]:
+        result &= group
+        if not result:
+            break
+    return result
+
+
+class InvertedIndex:
+    """
+    Kelime (token) -> ISBN kümesi eşlemesi tutan ters indeks
+
+    Kelimeler sadece boşluklardan bölünür. Böylece boşluk içermeyen her
+    arama terimi tek bir kelimenin içinde kalır ve alt dize araması da
+    indeks üzerinden yapılabilir: terimi içeren kelimeler, kelime
+    dağarcığının 1-3 karakterlik parçalarından oluşan ikinci bir indeksten
+    bulunur; tüm kelimeler taranmaz.
+    """
+
+    def __init__(self):
+        """InvertedIndex sınıfının constructor'ı"""
+        self.postings: Dict[str, Set[str]] = {}
+        self._book_tokens: Dict[str, Set[str]] = {}
+        # Kelime parçası (1-3 karakter) -> o parçayı içeren kelimeler
+        self._token_grams: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """
+        Metni kelimelere ayırır
+
+        Args:
+            text (str): Normalize edilmiş metin
+
+        Returns:
+            List[str]: Kelimeler
+        """
+        return text.split()
+
+    @staticmethod
+    def grams(token: str) -> Set[str]:
+        """
+        Kelimenin 1, 2 ve 3 karakterlik tüm parçalarını döndürür
+
+        Args:
+            token (str): Kelime
+
+        Returns:
+            Set[str]: Parçalar
+        """
+        return {token[i:i + size] for size in (1, 2, 3) for i in range(len(token) - size + 1)}
+
+    def add(self, book: Book, key: Optional[str] = None) -> None:
+        """
+        Kitabın kelimelerini indekse ekler
+
+        Args:
+            book (Book): İndekslenecek kitap
+            key (Optional[str]): Önceden hesaplanmış arama anahtarı
+        """
+        tokens = set(self.tokenize(key if key is not None else search_key(book)))
+
+        self._book_tokens[book.isbn] = tokens
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = set()
+                for gram in self.grams(token):
+                    self._token_grams.setdefault(gram, set()).add(token)
+            postings.add(book.isbn)
+
+    def remove(self, isbn: str) -> None:
+        """
+        Kitabı indeksten çıkarır
+
+        Args:
+            isbn (str): Çıkarılacak kitabın ISBN'i
+        """
+        for token in self._book_tokens.pop(isbn, ()):
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(isbn)
+            if not postings:
+                del self.postings[token]
+                for gram in self.grams(token):
+                    tokens = self._token_grams[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._token_grams[gram]
+
+    def clear(self) -> None:
+        """İndeksi boşaltır"""
+        self.postings.clear()
+        self._book_tokens.clear()
+        self._token_grams.clear()
+
+    def _tokens_containing(self, part: str) -> Iterable[str]:
+        """Parçayı içeren kelimeleri parça indeksinden bulur"""
+        if len(part) <= 3:
+            return self._token_grams.get(part, ())
+        groups = []
+        for gram in TrigramIndex.trigrams(part):
+            tokens = self._token_grams.get(gram)
+            if not tokens:
+                return ()
+            groups.append(tokens)
+        # Üçlülerin hepsini içermek yetmez; sıralı geçiş doğrulanır
+        return [token for token in _intersect(groups) if part in token]
+
+    def _union(self, tokens: Iterable[str]) -> Set[str]:
+        """Verilen kelimelerin ISBN kümelerinin birleşimini döndürür"""
+        result: Set[str] = set()
+        for token in tokens:
+            result |= self.postings[token]
+        return result
+
+    def candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        Arama terimiyle eşleşebilecek kitapların ISBN kümesini döndürür
+
+        Tek kelimelik terimler için terimi içeren kelimelerin kümeleri
+        birleştirilir. Çok kelimeli terimlerde ilk kelime bir kelimenin
+        sonu, son kelime bir kelimenin başı, aradakiler tam kelime olmalıdır;
+        bu kümelerin kesişimi alınır. Tam kelimeler doğrudan, parçalar parça
+        indeksi üzerinden bulunur.
+
+        Args:
+            keyword (str): Normalize edilmiş arama terimi
+
+        Returns:
+            Optional[Set[str]]: Aday ISBN'ler; None ise indeks kullanılamaz
+        """
+        words = self.tokenize(keyword)
+        if not words:
+            return None
+
+        if len(words) == 1:
+            return self._union(self._tokens_containing(words[0]))
+
+        first, middle, last = words[0], words[1:-1], words[-1]
+        groups: List[Set[str]] = []
+        for word in middle:
+            postings = self.postings.get(word)
+            if not postings:
+                return set()
+            groups.append(postings)
+        groups.append(self._union(t for t in self._tokens_containing(first) if t.endswith(first)))
+        groups.append(self._union(t for t in self._tokens_containing(last) if t.startswith(last)))
+        return _intersect(groups)
+
+
+class TrigramIndex:
+    """
+    Üçlü karakter (trigram) -> ISBN kümesi eşlemesi tutan indeks
+
+    Her alan ayrı ayrı üçlülere bölünür. Bir terim bir alanın alt dizesi
+    ise terimin bütün üçlüleri o alanda da bulunur; bu yüzden üçlü
+    kümelerinin kesişimi, üç ve daha uzun terimler için eksiksiz bir aday
+    kümesi verir.
+    """
+
+    def __init__(self):
+        """TrigramIndex sınıfının constructor'ı"""
+        self.postings: Dict[str, Set[str]] = {}
+        self._book_trigrams: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """
+        Metnin tüm üçlü karakter dizilerini döndürür
+
+        Args:
+            text (str): Normalize edilmiş metin
+
+        Returns:
+            Set[str]: Üçlüler
+        """
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, book: Book, key: Optional[str] = None) -> None:
+        """
+        Kitabın üçlülerini indekse ekler
+
+        Args:
+            book (Book): İndekslenecek kitap
+            key (Optional[str]): Önceden hesaplanmış arama anahtarı
+        """
+        if key is None:
+            key = search_key(book)
+        grams: Set[str] = set()
+        for field in key.split(FIELD_SEPARATOR):
+            grams |= self.trigrams(field)
+
+        self._book_trigrams[book.isbn] = grams
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(book.isbn)
+
+    def remove(self, isbn: str) -> None:
+        """
+        Kitabı indeksten çıkarır
+
+        Args:
+            isbn (str): Çıkarılacak kitabın ISBN'i
+        """
+        for gram in self._book_trigrams.pop(isbn, ()):
+            postings = self.postings.get(gram)
+            if postings is None:
+                continue
+            postings.discard(isbn)
+            if not postings:
+                del self.postings[gram]
+
+    def clear(self) -> None:
+        """İndeksi boşaltır"""
+        self.postings.clear()
+        self._book_trigrams.clear()
+
+    def candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        Arama terimiyle eşleşebilecek kitapların ISBN kümesini döndürür
+
+        Args:
+            keyword (str): Normalize edilmiş arama terimi
+
+        Returns:
+            Optional[Set[str]]: Aday ISBN'ler; terim üç karakterden kısaysa None
+        """
+        grams = self.trigrams(keyword)
+        if not grams:
+            return None
+
+        groups = []
+        for gram in grams:
+            postings = self.postings.get(gram)
+            if not postings:
+                return set()
+            groups.append(postings)
+        return _intersect(groups)
+
+
+class PrefixIndex:
+    """
+    Başlık ve yazar adları için sıralı dizi tabanlı önek indeksi
+
+    Normalize edilmiş metinler sıralı bir listede tutulur; bir önekle
+    başlayan girişler ikili arama (bisect) ile bulunan aralıktadır. Tek
+    eklemeler listeyi insort ile sıralı tutar; toplu yüklemede (``bulk``)
+    anahtarlar sona eklenip liste bir kez sıralanır.
+    """
+
+    def __init__(self):
+        """PrefixIndex sınıfının constructor'ı"""
+        self._keys: List[str] = []
+        # Aynı başlık/yazar birden fazla kitapta geçebilir
+        self._counts: Dict[str, int] = {}
+        self._display: Dict[str, str] = {}
+        self._book_keys: Dict[str, List[str]] = {}
+        self._bulk = False
+
+    @contextmanager
+    def bulk(self) -> Iterator["PrefixIndex"]:
+        """
+        Toplu ekleme bağlamı; anahtar listesi çıkışta bir kez sıralanır
+
+        Her anahtar için insort listeyi kaydırır (n kitapta O(n²)). Bağlam
+        içinde sadece ekleme yapılmalıdır; öneri ve silme çıkıştan sonra.
+
+        Returns:
+            Iterator[PrefixIndex]: İndeksin kendisi
+        """
+        self._bulk = True
+        try:
+            yield self
+        finally:
+            self._bulk = False
+            self._keys.sort()
+
+    def _add_key(self, text: str) -> Optional[str]:
+        """Metni indekse ekler, eklenen anahtarı döndürür"""
+        key = normalize(text)
+        if not key:
+            return None
+        if key in self._counts:
+            self._counts[key] += 1
+        else:
+            self._counts[key] = 1
+            self._display[key] = text.strip()
+            if self._bulk:
+                self._keys.append(key)
+            else:
+                insort(self._keys, key)
+        return key
+
+    def _remove_key(self, key: str) -> None:
+        """Anahtarın sayacını azaltır, sıfırlanınca listeden siler"""
+        count = self._counts.get(key, 0) - 1
+        if count > 0:
+            self._counts[key] = count
+            return
+        self._counts.pop(key, None)
+        self._display.pop(key, None)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def add(self, book: Book, key: Optional[str] = None) -> None:
+        """
+        Kitabın başlık ve yazarını indekse ekler
+
+        Args:
+            book (Book): İndekslenecek kitap
+            key (Optional[str]): Kullanılmaz (diğer indekslerle aynı arayüz)
+        """
+        keys = [self._add_key(book.title), self._add_key(book.author)]
+        self._book_keys[book.isbn] = [key for key in keys if key]
+
+    def remove(self, isbn: str) -> None:
+        """
+        Kitabı indeksten çıkarır
+
+        Args:
+            isbn (str): Çıkarılacak kitabın ISBN'i
+        """
+        for key in self._book_keys.pop(isbn, ()):
+            self._remove_key(key)
+
+    def clear(self) -> None:
+        """İndeksi boşaltır"""
+        self._keys.clear()
+        self._counts.clear()
+        self._display.clear()
+        self._book_keys.clear()
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Önekle başlayan başlık ve yazar adlarını alfabetik sırayla döndürür
+
+        Args:
+            prefix (str): Aranan önek
+            limit (int): Maksimum öneri sayısı
+
+        Returns:
+            List[str]: Öneriler (orijinal yazılışlarıyla)
+        """
+        prefix = normalize(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        suggestions = []
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and len(suggestions) < limit:
+            key = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            suggestions.append(self._display[key])
+            position += 1
+        return suggestions
+
+
+class BKTree:
+    """
+    Levenshtein mesafesi için BK-ağacı
+
+    Her düğümün çocukları, düğüm kelimesine olan mesafeye göre tutulur.
+    Üçgen eşitsizliği sayesinde arama sırasında çoğu dal hiç gezilmez.
+    """
+
+    def __init__(self):
+        """BKTree sınıfının constructor'ı"""
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self.size = 0
+
+    def add(self, word: str) -> None:
+        """
+        Kelimeyi ağaca ekler (zaten varsa bir şey yapmaz)
+
+        Args:
+            word (str): Eklenecek kelime
+        """
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def find(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Verilen mesafe içindeki kelimeleri bulur
+
+        Args:
+            word (str): Aranan kelime
+            max_distance (int): İzin verilen en büyük mesafe
+
+        Returns:
+            List[Tuple[int, str]]: (mesafe, kelime) çiftleri
+        """
+        if self.root is None:
+            return []
+
+        found = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        return found
+
+
+class FuzzyIndex:
+    """
+    Yazım hatalarına dayanıklı arama için kelime indeksi
+
+    Başlık ve yazar kelimeleri (noktalama hariç) bir BK-ağacında tutulur.
+    BK-ağacından silme yapılamadığı için silinen kelimeler ağaçta kalır,
+    sonuçlardan elenir ve ölü kelimeler çoğalınca ağaç yeniden kurulur.
+    """
+
+    def __init__(self):
+        """FuzzyIndex sınıfının constructor'ı"""
+        self.postings: Dict[str, Set[str]] = {}
+        self._book_words: Dict[str, Set[str]] = {}
+        self._tree = BKTree()
+
+    @staticmethod
+    def words(text: str) -> List[str]:
+        """Metindeki kelimeleri normalize edilmiş olarak döndürür"""
+        return WORD_PATTERN.findall(normalize(text))
+
+    def add(self, book: Book, key: Optional[str] = None) -> None:
+        """
+        Kitabın başlık ve yazar kelimelerini indekse ekler
+
+        Args:
+            book (Book): İndekslenecek kitap
+            key (Optional[str]): Önceden hesaplanmış arama anahtarı
+        """
+        if key is None:
+            key = search_key(book)
+        title, author = key.split(FIELD_SEPARATOR)[:2]
+        words = set(WORD_PATTERN.findall(title)) | set(WORD_PATTERN.findall(author))
+        self._book_words[book.isbn] = words
+        for word in words:
+            if word not in self.postings:
+                self.postings[word] = set()
+                self._tree.add(word)
+            self.postings[word].add(book.isbn)
+
+    def remove(self, isbn: str) -> None:
+        """
+        Kitabı indeksten çıkarır
+
+        Args:
+            isbn (str): Çıkarılacak kitabın ISBN'i
+        """
+        for word in self._book_words.pop(isbn, ()):
+            postings = self.postings.get(word)
+            if postings is None:
+                continue
+            postings.discard(isbn)
+            if not postings:
+                del self.postings[word]
+
+        if self._tree.size > 2 * len(self.postings) + 100:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """BK-ağacını sadece canlı kelimelerle yeniden kurar"""
+        self._tree = BKTree()
+        for word in self.postings:
+            self._tree.add(word)
+
+    def clear(self) -> None:
+        """İndeksi boşaltır"""
+        self.postings.clear()
+        self._book_words.clear()
+        self._tree = BKTree()
+
+    def candidates(self, keyword: str, max_distance: int) -> Set[str]:
+        """
+        Her kelimesi yaklaşık olarak eşleşen kitapların ISBN kümesini döndürür
+
+        Kısa kelimelerde her şeyin eşleşmemesi için kullanılan mesafe
+        kelime uzunluğunun yarısıyla sınırlanır.
+
+        Args:
+            keyword (str): Arama terimi
+            max_distance (int): Kelime başına izin verilen en büyük mesafe
+
+        Returns:
+            Set[str]: Eşleşen kitapların ISBN'leri
+        """
+        words = self.words(keyword)
+        if not words:
+            return set()
+
+        result: Optional[Set[str]] = None
+        for word in words:
+            limit = min(max_distance, len(word) // 2)
+            matches: Set[str] = set()
+            for _, token in self._tree.find(word, limit):
+                matches |= self.postings.get(token, set())
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+
+class RankingIndex:
+    """
+    Başlık ve yazar alanları üzerinde BM25 puanlaması için istatistikler
+
+    Başlıkta geçen terimler title_boost katsayısıyla ağırlıklandırılır.
+    Aramalar alt dize eşleşmesi kullandığı için bir terim, onu içeren tüm
+    kelimelerle eşleşmiş sayılır ("pyth" -> "python").
+    """
+
+    def __init__(self, title_boost: float = 2.0, k1: float = 1.2, b: float = 0.75):
+        """
+        RankingIndex sınıfının constructor'ı
+
+        Args:
+            title_boost (float): Başlık alanının ağırlığı (yazar alanı 1.0)
+            k1 (float): BM25 terim sıklığı doygunluk parametresi
+            b (float): BM25 alan uzunluğu normalizasyon parametresi
+        """
+        self.title_boost = title_boost
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Set[str]] = {}
+        self._fields: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._title_length = 0
+        self._author_length = 0
+
+    def add(self, book: Book, key: Optional[str] = None) -> None:
+        """
+        Kitabın başlık ve yazar kelimelerini indekse ekler
+
+        Args:
+            book (Book): İndekslenecek kitap
+            key (Optional[str]): Önceden hesaplanmış arama anahtarı
+        """
+        if key is None:
+            key = search_key(book)
+        title, author = key.split(FIELD_SEPARATOR)[:2]
+        title_words = WORD_PATTERN.findall(title)
+        author_words = WORD_PATTERN.findall(author)
+
+        self._fields[book.isbn] = (title_words, author_words)
+        self._title_length += len(title_words)
+        self._author_length += len(author_words)
+        for word in set(title_words) | set(author_words):
+            self.postings.setdefault(word, set()).add(book.isbn)
+
+    def remove(self, isbn: str) -> None:
+        """
+        Kitabı indeksten çıkarır
+
+        Args:
+            isbn (str): Çıkarılacak kitabın ISBN'i
+        """
+        fields = self._fields.pop(isbn, None)
+        if fields is None:
+            return
+        title_words, author_words = fields
+        self._title_length -= len(title_words)
+        self._author_length -= len(author_words)
+        for word in set(title_words) | set(author_words):
+            postings = self.postings.get(word)
+            if postings is None:
+                continue
+            postings.discard(isbn)
+            if not postings:
+                del self.postings[word]
+
+    def clear(self) -> None:
+        """İndeksi boşaltır"""
+        self.postings.clear()
+        self._fields.clear()
+        self._title_length = 0
+        self._author_length = 0
+
+    def _field_score(self, words: List[str], matched: Set[str], idf: float,
+                     average_length: float) -> float:
+        """Tek bir alan için BM25 terim puanını hesaplar"""
+        tf = sum(1 for word in words if word in matched)
+        if not tf:
+            return 0.0
+        norm = 1 - self.b + self.b * len(words) / (average_length or 1)
+        return idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+    def scores(self, isbns: Iterable[str], keyword: str) -> Dict[str, float]:
+        """
+        Verilen kitapların arama terimine göre BM25 puanlarını hesaplar
+
+        Args:
+            isbns (Iterable[str]): Puanlanacak kitapların ISBN'leri
+            keyword (str): Normalize edilmiş arama terimi
+
+        Returns:
+            Dict[str, float]: ISBN -> puan
+        """
+        scores = {isbn: 0.0 for isbn in isbns}
+        total = len(self._fields)
+        if not total or not scores:
+            return scores
+
+        average_title = self._title_length / total
+        average_author = self._author_length / total
+        for term in set(WORD_PATTERN.findall(keyword)):
+            matched = {word for word in self.postings if term in word}
+            if not matched:
+                continue
+            df = len(set().union(*(self.postings[word] for word in matched)))
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+            for isbn in scores:
+                title_words, author_words = self._fields[isbn]
+                scores[isbn] += (
+                    self.title_boost * self._field_score(title_words, matched, idf, average_title) +
+                    self._field_score(author_words, matched, idf, average_author))
+        return scores
@@ -0,0 +1,107 @@
+"""
+Eşzamanlı özdeş istekleri birleştirme (single-flight)
+
+Aynı anahtar için aynı anda gelen çağrılardan yalnızca ilki işi yapar;
+diğerleri onun sonucunu bekler ve paylaşır. Böylece aynı ISBN'i aynı anda
+ekleyen istemciler Open Library'ye tek bir istek gönderir.
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """Devam eden bir çağrının sonucu"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Thread'ler arası single-flight"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        ``fn`` fonksiyonunu anahtar başına aynı anda en fazla bir kez çalıştırır
+
+        Args:
+            key (Hashable): İstek anahtarı
+            fn (Callable[[], Any]): Çalıştırılacak fonksiyon
+
+        Returns:
+            Any: Fonksiyonun (veya devam eden çağrının) sonucu
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                owner = False
+            else:
+                call = self._calls[key] = _Call()
+                owner = True
+
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Tek event loop içinde coroutine'ler arası single-flight"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        ``fn`` coroutine'ini anahtar başına aynı anda en fazla bir kez çalıştırır
+
+        Ortak çağrı kendi görevinde (task) çalışır; çağıranlardan biri (işi
+        başlatan dahil) iptal edilirse diğerleri sonucu beklemeye devam eder.
+
+        Args:
+            key (Hashable): İstek anahtarı
+            fn (Callable[[], Awaitable[Any]]): Coroutine döndüren fonksiyon
+
+        Returns:
+            Any: Coroutine'in (veya devam eden çağrının) sonucu
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        # shield: bir çağıranın iptali ortak görevi iptal etmez
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Biten görevi kaydından siler"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Bekleyen kalmadıysa "exception was never retrieved" uyarısını önle
+            task.exception()
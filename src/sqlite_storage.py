@@ -0,0 +1,303 @@
+"""
+SQLite depolama katmanı
+
+Kitaplar bellekte bir listede tutulmak yerine doğrudan SQLite veritabanında
+saklanır. Her satır hiç yeniden kullanılmayan artan bir sıra numarası (id)
+alır; sayfalama imleçleri bu numarayı kullanır. ISBN benzersiz anahtardır;
+öneriler için başlık ve yazarın normalize edilmiş hâlleri indekslidir ve
+alt dize araması için normalize edilmiş arama anahtarı üzerinde FTS5
+trigram indeksi kullanılır. Normalize işlemi bellek içi indekslerle aynı
+olduğundan iki depo da aynı sonucu verir.
+"""
+
+import sqlite3
+import threading
+from typing import Iterator, List, Optional, Tuple
+from book import Book
+from search_index import normalize, search_key
+
+
+SQLITE_EXTENSIONS = ('.sqlite', '.sqlite3', '.db')
+
+INSERT_BOOK = ("INSERT OR IGNORE INTO books "
+               "(isbn, title, author, search_key, title_key, author_key) "
+               "VALUES (?, ?, ?, ?, ?, ?)")
+
+
+def is_sqlite_filename(filename: str) -> bool:
+    """Dosya adı SQLite veritabanına mı işaret ediyor?"""
+    return filename.lower().endswith(SQLITE_EXTENSIONS)
+
+
+class SQLiteStorage:
+    """SQLite tabanlı kitap deposu"""
+
+    def __init__(self, filename: str):
+        """
+        SQLiteStorage sınıfının constructor'ı
+
+        Args:
+            filename (str): Veritabanı dosyasının adı
+        """
+        self.filename = filename
+        # Flask çoklu thread ile çalıştığı için bağlantı paylaşılır ve kilitlenir
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.fts_enabled = False
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Tabloları, indeksleri ve FTS tetikleyicilerini oluşturur"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS books (
+                    -- AUTOINCREMENT: en büyük satır silinse bile numarası yeniden
+                    -- verilmez; açık imleçler kitap atlamaz veya tekrarlamaz
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    isbn TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    author TEXT NOT NULL,
+                    search_key TEXT NOT NULL,
+                    title_key TEXT NOT NULL,
+                    author_key TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_books_title_key ON books(title_key)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_books_author_key ON books(author_key)")
+
+            try:
+                self._conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+                        search_key,
+                        content='books', content_rowid='id', tokenize='trigram'
+                    )
+                """)
+            except sqlite3.OperationalError:
+                # FTS5 veya trigram tokenizer yoksa tam taramaya düşülür
+                return
+
+            self._conn.executescript("""
+                CREATE TRIGGER IF NOT EXISTS books_ai AFTER INSERT ON books BEGIN
+                    INSERT INTO books_fts(rowid, search_key)
+                    VALUES (new.id, new.search_key);
+                END;
+                CREATE TRIGGER IF NOT EXISTS books_ad AFTER DELETE ON books BEGIN
+                    INSERT INTO books_fts(books_fts, rowid, search_key)
+                    VALUES ('delete', old.id, old.search_key);
+                END;
+                CREATE TRIGGER IF NOT EXISTS books_au AFTER UPDATE ON books BEGIN
+                    INSERT INTO books_fts(books_fts, rowid, search_key)
+                    VALUES ('delete', old.id, old.search_key);
+                    INSERT INTO books_fts(rowid, search_key)
+                    VALUES (new.id, new.search_key);
+                END;
+            """)
+            self.fts_enabled = True
+
+    @staticmethod
+    def _row_values(book: Book) -> Tuple[str, str, str, str, str, str]:
+        """Kitabın sütun değerlerini (isbn, başlık, yazar ve anahtarlar) döndürür"""
+        return (book.isbn, book.title, book.author, search_key(book),
+                normalize(book.title), normalize(book.author))
+
+    def count(self) -> int:
+        """Kitap sayısını döndürür"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def get(self, isbn: str) -> Optional[Book]:
+        """
+        ISBN ile kitap getirir (birincil anahtar araması)
+
+        Args:
+            isbn (str): Kitabın ISBN'i
+
+        Returns:
+            Optional[Book]: Bulunan kitap veya None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, author, isbn FROM books WHERE isbn = ?", (isbn,)).fetchone()
+        return Book(*row) if row else None
+
+    def insert(self, book: Book) -> bool:
+        """
+        Yeni kitap ekler
+
+        Args:
+            book (Book): Eklenecek kitap
+
+        Returns:
+            bool: Eklendi mi? (ISBN zaten varsa False)
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(INSERT_BOOK, self._row_values(book))
+            return cursor.rowcount == 1
+
+    def insert_many(self, books: List[Book]) -> List[bool]:
+        """
+        Kitapları tek bir işlem (transaction) içinde ekler
+        
+        Args:
+            books (List[Book]): Eklenecek kitaplar
+            
+        Returns:
+            List[bool]: Her kitap için eklendi mi? (ISBN zaten varsa False)
+        """
+        added = []
+        with self._lock, self._conn:
+            for book in books:
+                cursor = self._conn.execute(INSERT_BOOK, self._row_values(book))
+                added.append(cursor.rowcount == 1)
+        return added
+    
+    def update(self, book: Book) -> bool:
+        """
+        Kitabın başlık ve yazar bilgisini günceller
+
+        Args:
+            book (Book): Güncel kitap bilgisi
+
+        Returns:
+            bool: Güncellendi mi?
+        """
+        with self._lock, self._conn:
+            isbn, title, author, key, title_key, author_key = self._row_values(book)
+            cursor = self._conn.execute(
+                "UPDATE books SET title = ?, author = ?, search_key = ?, title_key = ?, "
+                "author_key = ? WHERE isbn = ?",
+                (title, author, key, title_key, author_key, isbn))
+            return cursor.rowcount == 1
+
+    def delete(self, isbn: str) -> bool:
+        """
+        ISBN ile kitap siler
+
+        Args:
+            isbn (str): Silinecek kitabın ISBN'i
+
+        Returns:
+            bool: Silindi mi?
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM books WHERE isbn = ?", (isbn,))
+            return cursor.rowcount == 1
+
+    def iter_books(self, batch_size: int = 1000) -> Iterator[Book]:
+        """
+        Kitapları ekleme sırasıyla, parça parça okuyarak döndürür
+
+        Args:
+            batch_size (int): Tek seferde okunacak satır sayısı
+
+        Returns:
+            Iterator[Book]: Kitaplar
+        """
+        last_id = 0
+        while True:
+            rows = self.page(last_id, batch_size)
+            if not rows:
+                return
+            for _, book in rows:
+                yield book
+            last_id = rows[-1][0]
+
+    def page(self, after_id: int, limit: int) -> List[Tuple[int, Book]]:
+        """
+        Verilen satırdan sonraki kitapları ekleme sırasıyla döndürür
+
+        Birincil anahtar üzerinden arama yapıldığı için maliyet sayfa
+        boyutuna bağlıdır.
+
+        Args:
+            after_id (int): Bu sıra numarasından sonrası okunur
+            limit (int): Maksimum kitap sayısı
+
+        Returns:
+            List[Tuple[int, Book]]: (sıra numarası, kitap) ikilileri
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, title, author, isbn FROM books "
+                "WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, limit)).fetchall()
+        return [(row[0], Book(row[1], row[2], row[3])) for row in rows]
+
+    def all_books(self) -> List[Book]:
+        """Tüm kitapları ekleme sırasıyla döndürür"""
+        return list(self.iter_books())
+
+    def search(self, keyword: str) -> List[Book]:
+        """
+        Başlık, yazar veya ISBN içinde alt dize araması yapar
+
+        Üç ve daha uzun aramalarda FTS5 trigram indeksi aday kümesini
+        daraltır; sonuçlar saklanan arama anahtarı üzerinde
+        Library.search_books ile aynı kurala göre doğrulanır.
+
+        Args:
+            keyword (str): Normalize edilmiş arama terimi
+
+        Returns:
+            List[Book]: Bulunan kitaplar
+        """
+        if self.fts_enabled and len(keyword) >= 3:
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT title, author, isbn, search_key FROM books WHERE id IN "
+                    "(SELECT rowid FROM books_fts WHERE books_fts MATCH ?) ORDER BY id",
+                    (phrase,)).fetchall()
+        else:
+            # Kısa terimler için tam tarama; instr() satırları SQLite içinde eler
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT title, author, isbn, search_key FROM books "
+                    "WHERE instr(search_key, ?) > 0 ORDER BY id",
+                    (keyword,)).fetchall()
+
+        return [Book(row[0], row[1], row[2]) for row in rows if keyword in row[3]]
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Önekle başlayan başlık ve yazar adlarını döndürür
+
+        Normalize edilmiş başlık ve yazar sütunlarının indeksleri üzerinde
+        aralık sorgusu yapılır; eşleşme ve sıralama bellek içi PrefixIndex
+        ile aynıdır (Türkçe I/ı, aksanlar). Aynı anahtarı veren adlardan ilk
+        eklenen gösterilir.
+
+        Args:
+            prefix (str): Aranan önek
+            limit (int): Maksimum öneri sayısı
+
+        Returns:
+            List[str]: Öneriler
+        """
+        prefix = normalize(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        upper = prefix + '\U0010ffff'
+        with self._lock:
+            # MIN(seq) ile gruptaki ilk eklenen satırın adı seçilir
+            rows = self._conn.execute("""
+                SELECT value, MIN(seq) FROM (
+                    SELECT title_key AS key, title AS value, id * 2 AS seq FROM books
+                    WHERE title_key >= ? AND title_key < ?
+                    UNION ALL
+                    SELECT author_key AS key, author AS value, id * 2 + 1 AS seq FROM books
+                    WHERE author_key >= ? AND author_key < ?
+                )
+                GROUP BY key ORDER BY key LIMIT ?
+            """, (prefix, upper, prefix, upper, limit)).fetchall()
+        return [row[0].strip() for row in rows]
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            self._conn.close()
@@ -4,11 +4,22 @@
 let socket;
 let currentBooks = [];
 let isSearchMode = false;
+let nextCursor = null;
+let isLoadingPage = false;
+let scrollObserver = null;
+// Search results are paged with offset/limit like the book list
+let searchKeyword = null;
+let searchOffset = 0;
+let searchTotal = 0;
+const PAGE_SIZE = 50;
+// url -> { etag, data }; unchanged responses are answered with 304
+const etagCache = new Map();
 
 // Initialize the application
 document.addEventListener('DOMContentLoaded', function() {
     initializeSocket();
     initializeEventListeners();
+    initializeInfiniteScroll();
     loadBooks();
     loadStats();
     updateCurrentTime();
@@ -44,18 +55,46 @@ function initializeEventListeners() {
     });
 }
 
-// Load all books
+// GET JSON with If-None-Match; a 304 reuses the previously downloaded data
+async function fetchJSONCached(url) {
+    const cached = etagCache.get(url);
+    const headers = cached ? { 'If-None-Match': cached.etag } : {};
+    const response = await fetch(url, { headers, cache: 'no-store' });
+    
+    if (response.status === 304 && cached) {
+        return cached.data;
+    }
+    
+    const data = await response.json();
+    const etag = response.headers.get('ETag');
+    if (response.ok && etag) {
+        etagCache.set(url, { etag, data });
+    }
+    return data;
+}
+
+// Fetch one page of books; cursor is null for the first page
+async function fetchBooksPage(cursor) {
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    return fetchJSONCached(`/api/books?${params}`);
+}
+
+// Load the first page of books (further pages are loaded on scroll)
 async function loadBooks() {
     try {
         showLoading(true);
         
-        const response = await fetch('/api/books');
-        const data = await response.json();
+        const data = await fetchBooksPage(null);
         
         if (data.success) {
             currentBooks = data.books;
+            nextCursor = data.next_cursor || null;
             displayBooks(data.books);
             updateBookCount(data.total);
+            watchScrollSentinel();
         } else {
             showToast('Kitaplar yüklenirken hata oluştu', 'error');
         }
@@ -67,6 +106,76 @@ async function loadBooks() {
     }
 }
 
+// Load the next page and append it to the list
+async function loadMoreBooks() {
+    if (isSearchMode) {
+        return loadMoreSearchResults();
+    }
+    if (!nextCursor || isLoadingPage) {
+        return;
+    }
+    
+    const cursor = nextCursor;
+    isLoadingPage = true;
+    try {
+        const data = await fetchBooksPage(cursor);
+        
+        // The list was reloaded while this page was in flight
+        if (cursor !== nextCursor || isSearchMode) {
+            return;
+        }
+        
+        if (data.success) {
+            nextCursor = data.next_cursor || null;
+            appendBooks(data.books, currentBooks.length);
+            currentBooks = currentBooks.concat(data.books);
+            updateBookCount(data.total);
+        }
+    } catch (error) {
+        console.error('Error loading more books:', error);
+    } finally {
+        isLoadingPage = false;
+        watchScrollSentinel();
+    }
+}
+
+// Load more books when the end of the list comes into view
+function initializeInfiniteScroll() {
+    if (!('IntersectionObserver' in window)) {
+        return;
+    }
+    scrollObserver = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadMoreBooks();
+        }
+    }, { rootMargin: '300px' });
+}
+
+// Re-observe the sentinel so a still-visible end of list triggers another page
+function watchScrollSentinel() {
+    const sentinel = document.getElementById('booksSentinel');
+    if (!scrollObserver || !sentinel) {
+        return;
+    }
+    scrollObserver.unobserve(sentinel);
+    if (hasMorePages()) {
+        scrollObserver.observe(sentinel);
+    }
+}
+
+// Is there another page of books or search results to load?
+function hasMorePages() {
+    return isSearchMode ? searchOffset < searchTotal : Boolean(nextCursor);
+}
+
+// Append books to the current list
+function appendBooks(books, startIndex) {
+    const booksList = document.getElementById('booksList');
+    books.forEach((book, index) => {
+        booksList.appendChild(createBookCard(book, startIndex + index));
+    });
+}
+
 // Display books in the UI
 function displayBooks(books) {
     const booksList = document.getElementById('booksList');
@@ -192,14 +301,8 @@ async function handleSearch(event) {
     try {
         showLoading(true);
         
-        const response = await fetch(`/api/books/search?q=${encodeURIComponent(keyword)}`);
-        const data = await response.json();
-        
-        if (data.success) {
-            isSearchMode = true;
-            displayBooks(data.books);
-            showSearchResults(data.total, keyword);
-        } else {
+        const data = await performSearch(keyword);
+        if (data && !data.success) {
             showToast(data.message, 'error');
         }
     } catch (error) {
@@ -212,10 +315,18 @@ async function handleSearch(event) {
 
 // Handle search input (real-time search)
 let searchTimeout;
+let suggestTimeout;
 function handleSearchInput(event) {
     const keyword = event.target.value.trim();
     
     clearTimeout(searchTimeout);
+    clearTimeout(suggestTimeout);
+    
+    if (keyword.length >= 1) {
+        suggestTimeout = setTimeout(() => {
+            loadSuggestions(keyword);
+        }, 150);
+    }
     
     if (keyword.length >= 2) {
         searchTimeout = setTimeout(() => {
@@ -226,34 +337,114 @@ function handleSearchInput(event) {
     }
 }
 
-// Perform search
-async function performSearch(keyword) {
+// Load autocomplete suggestions
+async function loadSuggestions(prefix) {
     try {
-        const response = await fetch(`/api/books/search?q=${encodeURIComponent(keyword)}`);
+        const response = await fetch(`/api/books/suggest?q=${encodeURIComponent(prefix)}`);
         const data = await response.json();
         
+        if (data.success) {
+            const datalist = document.getElementById('searchSuggestions');
+            datalist.replaceChildren(...data.suggestions.map(suggestion => {
+                const option = document.createElement('option');
+                option.value = suggestion;
+                return option;
+            }));
+        }
+    } catch (error) {
+        console.error('Error loading suggestions:', error);
+    }
+}
+
+// Fetch one page of search results
+async function fetchSearchPage(keyword, offset) {
+    const params = new URLSearchParams({ q: keyword, limit: PAGE_SIZE, offset });
+    const response = await fetch(`/api/books/search?${params}`);
+    return response.json();
+}
+
+// Perform search and show the first page of results (more load on scroll)
+async function performSearch(keyword) {
+    try {
+        searchKeyword = keyword;
+        const data = await fetchSearchPage(keyword, 0);
+        
+        // A newer search started while this one was in flight
+        if (keyword !== searchKeyword) {
+            return null;
+        }
+        
         if (data.success) {
             isSearchMode = true;
+            currentBooks = data.books;
+            searchOffset = data.books.length;
+            searchTotal = data.total;
             displayBooks(data.books);
-            showSearchResults(data.total, keyword);
+            showSearchResults();
+            watchScrollSentinel();
         }
+        return data;
     } catch (error) {
         console.error('Error performing search:', error);
+        return null;
+    }
+}
+
+// Load the next page of search results and append it to the list
+async function loadMoreSearchResults() {
+    if (searchOffset >= searchTotal || isLoadingPage) {
+        return;
+    }
+    
+    const keyword = searchKeyword;
+    const offset = searchOffset;
+    isLoadingPage = true;
+    try {
+        const data = await fetchSearchPage(keyword, offset);
+        
+        // The search changed or was cleared while this page was in flight
+        if (!isSearchMode || keyword !== searchKeyword || offset !== searchOffset) {
+            return;
+        }
+        
+        if (data.success) {
+            appendBooks(data.books, currentBooks.length);
+            currentBooks = currentBooks.concat(data.books);
+            searchTotal = data.total;
+            // An empty page means the results shrank; stop paging
+            searchOffset = data.books.length ? offset + data.books.length : searchTotal;
+            showSearchResults();
+        }
+    } catch (error) {
+        console.error('Error loading more search results:', error);
+    } finally {
+        isLoadingPage = false;
+        watchScrollSentinel();
     }
 }
 
-// Show search results
-function showSearchResults(count, keyword) {
+// Show search results count; note when only part of them is listed
+function showSearchResults() {
     const searchResults = document.getElementById('searchResults');
     const searchCount = document.getElementById('searchCount');
+    const searchShown = document.getElementById('searchShown');
     
-    searchCount.textContent = count;
+    searchCount.textContent = searchTotal;
+    if (currentBooks.length < searchTotal) {
+        document.getElementById('searchShownCount').textContent = currentBooks.length;
+        searchShown.classList.remove('d-none');
+    } else {
+        searchShown.classList.add('d-none');
+    }
     searchResults.classList.remove('d-none');
 }
 
 // Clear search
 function clearSearch() {
     isSearchMode = false;
+    searchKeyword = null;
+    searchOffset = 0;
+    searchTotal = 0;
     document.getElementById('searchKeyword').value = '';
     document.getElementById('searchResults').classList.add('d-none');
     loadBooks();
@@ -309,8 +500,7 @@ async function handleConfirmDelete() {
 // Load statistics
 async function loadStats() {
     try {
-        const response = await fetch('/api/stats');
-        const data = await response.json();
+        const data = await fetchJSONCached('/api/stats');
         
         if (data.success) {
             const stats = data.stats;
@@ -0,0 +1,141 @@
+"""
+AsyncLibrary cephesi için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import asyncio
+import threading
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_library import AsyncLibrary
+from library import Library
+from book import Book
+
+class FakeAPI:
+    """Open Library yerine sabit kitap döndüren async kaynak"""
+
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    async def get_book_by_isbn(self, isbn):
+        self.calls.append(isbn)
+        await asyncio.sleep(0.01)
+        if isbn == "9780306406157":
+            return None
+        return Book("Kar", "Orhan Pamuk", isbn)
+
+    async def aclose(self):
+        self.closed = True
+
+class TestAsyncLibrary:
+    """AsyncLibrary test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
+        self.temp_filename = self.temp_file.name
+        self.temp_file.close()
+        self.library = Library(self.temp_filename)
+        self.api = FakeAPI()
+
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def test_crud_operations(self):
+        """Ekleme, bulma, arama, güncelleme ve silme awaitable olmalı"""
+        async def run():
+            async with AsyncLibrary(self.library, api=self.api) as library:
+                assert await library.add_book(Book("Sefiller", "Victor Hugo", "111"))
+                assert (await library.find_book("111")).title == "Sefiller"
+                assert [b.isbn for b in await library.search_books("hugo")] == ["111"]
+                assert (await library.update_book("111", "Les Misérables", "Victor Hugo")).title \
+                    == "Les Misérables"
+                assert await library.remove_book("111")
+                assert await library.find_book("111") is None
+
+        asyncio.run(run())
+        assert self.api.closed
+
+    def test_writes_run_off_event_loop(self):
+        """Disk yazımı event loop thread'inde yapılmamalı"""
+        threads = []
+        save_books = self.library.save_books
+
+        def recording_save():
+            threads.append(threading.current_thread())
+            save_books()
+
+        self.library.save_books = recording_save
+
+        async def run():
+            async with AsyncLibrary(self.library, api=self.api) as library:
+                await library.add_book(Book("Sefiller", "Victor Hugo", "111"))
+                return threading.current_thread()
+
+        loop_thread = asyncio.run(run())
+        assert threads and loop_thread not in threads
+        # Kitap dosyaya yazılmış olmalı
+        assert Library(self.temp_filename).find_book("111") is not None
+
+    def test_reads_run_off_event_loop(self):
+        """Okumalar event loop thread'inde değil, kilidi alabilecekleri thread'de yapılmalı"""
+        threads = []
+        search_books = self.library.search_books
+
+        def recording_search(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return search_books(*args, **kwargs)
+
+        self.library.search_books = recording_search
+
+        async def run():
+            async with AsyncLibrary(self.library, api=self.api) as library:
+                await library.add_book(Book("Sefiller", "Victor Hugo", "111"))
+                # Kilit başka bir thread'de tutulurken event loop çalışmaya devam etmeli
+                with self.library._lock:
+                    search = asyncio.ensure_future(library.search_books("hugo"))
+                    await asyncio.sleep(0.01)
+                    assert not search.done()
+                found = await search
+                suggestions = await library.suggest("sef")
+                etag = await library.etag('books')
+                return found, suggestions, etag, threading.current_thread()
+
+        found, suggestions, etag, loop_thread = asyncio.run(run())
+        assert [b.isbn for b in found] == ["111"]
+        assert suggestions == ["Sefiller"]
+        assert etag == self.library.etag('books')
+        assert threads and loop_thread not in threads
+
+    def test_add_book_by_isbn(self):
+        """ISBN ile ekleme async kaynaktan çekmeli; eşzamanlı eklemede tek kayıt olmalı"""
+        async def run():
+            async with AsyncLibrary(self.library, api=self.api) as library:
+                results = await asyncio.gather(*(library.add_book_by_isbn("9789754700008")
+                                                 for _ in range(3)))
+                missing = await library.add_book_by_isbn("9780306406157")
+                return results, missing
+
+        results, missing = asyncio.run(run())
+        assert sorted(results) == [False, False, True]
+        assert missing is False
+        assert len(self.library.books) == 1
+        assert self.library.find_book("9789754700008").author == "Orhan Pamuk"
+
+    def test_sync_add_by_isbn_inside_loop(self):
+        """Senkron ISBN ile ekleme event loop içinde hata vermeden False döndürmeli"""
+        async def run():
+            return self.library.add_book_by_isbn("9789754700008")
+
+        assert asyncio.run(run()) is False
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,113 @@
+"""
+AuthorCache sınıfı için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import asyncio
+import threading
+import time
+import httpx
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from author_cache import AuthorCache
+from library_api import LibraryAPI
+
+class TestAuthorCache:
+    """AuthorCache sınıfı test sınıfı"""
+    
+    def test_hit_ratio(self):
+        """İsabet oranı doğru hesaplanmalı"""
+        cache = AuthorCache()
+        
+        assert cache.get("/authors/A") is None
+        cache.put("/authors/A", "Orhan Pamuk")
+        assert cache.get("/authors/A") == "Orhan Pamuk"
+        assert cache.get("/authors/A") == "Orhan Pamuk"
+        
+        assert cache.get_stats() == {'entries': 1, 'hits': 2, 'misses': 1, 'hit_ratio': 0.6667}
+    
+    def test_lru_eviction(self):
+        """Sınır aşılınca en az kullanılan yazar çıkarılmalı"""
+        cache = AuthorCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+    
+    def test_persisted_between_runs(self):
+        """Dosyaya kaydedilen adlar yeniden yüklenmeli"""
+        temp_dir = tempfile.mkdtemp()
+        filename = os.path.join(temp_dir, 'author_cache.json')
+        
+        cache = AuthorCache(filename=filename)
+        cache.put("/authors/A", "Sabahattin Ali")
+        cache.save()
+        
+        assert AuthorCache(filename=filename).get("/authors/A") == "Sabahattin Ali"
+        
+        os.unlink(filename)
+        os.rmdir(temp_dir)
+    
+    def test_concurrent_threads_fetch_once(self):
+        """Aynı yazar için eşzamanlı thread'ler tek istek yapmalı"""
+        cache = AuthorCache()
+        calls = []
+        
+        def fetch(key):
+            calls.append(key)
+            time.sleep(0.05)
+            return "Yaşar Kemal"
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.lookup("/authors/A", fetch)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert results == ["Yaşar Kemal"] * 8
+        assert len(calls) == 1
+        assert cache.misses == 1
+    
+    def test_missing_names_not_cached(self):
+        """Bulunamayan yazarlar önbelleğe alınmamalı"""
+        cache = AuthorCache()
+        
+        assert cache.lookup("/authors/X", lambda key: None) is None
+        assert len(cache) == 0
+    
+    def test_series_by_one_author_single_request(self):
+        """Aynı yazarın 40 kitabı tek yazar isteğiyle çözülmeli"""
+        author_requests = []
+        
+        async def handler(request):
+            author_requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"name": "Terry Pratchett"})
+        
+        async def run():
+            api = LibraryAPI(cache_file=None, author_cache=AuthorCache())
+            api._client = httpx.AsyncClient(
+                base_url=api.base_url, transport=httpx.MockTransport(handler))
+            data = {"title": "Discworld", "authors": [{"key": "/authors/OL25712A"}]}
+            books = await asyncio.gather(*(api._parse_book_data(data, str(n)) for n in range(40)))
+            await api.aclose()
+            return api, books
+        
+        api, books = asyncio.run(run())
+        
+        assert {book.author for book in books} == {"Terry Pratchett"}
+        assert author_requests == ["/authors/OL25712A.json"]
+        assert api.get_stats()['author_cache']['hit_ratio'] == 0.975
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,106 @@
+"""
+Open Library döküm dizini için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import gzip
+import json
+import tempfile
+import shutil
+import httpx
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dump_index import DumpIndex
+from isbn import NegativeCache
+from library_api import LibraryAPI
+
+def dump_line(record_type, key, record):
+    """Open Library döküm formatında tek satır üretir"""
+    return f"{record_type}\t{key}\t1\t2024-01-01T00:00:00\t{json.dumps(record)}\n"
+
+class TestDumpIndex:
+    """DumpIndex test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.test_dir = tempfile.mkdtemp()
+        self.index_file = os.path.join(self.test_dir, "index.sqlite")
+        self.dump_file = os.path.join(self.test_dir, "dump.txt.gz")
+        lines = [
+            dump_line('/type/author', '/authors/OL1A', {'name': 'Orhan Pamuk'}),
+            dump_line('/type/edition', '/books/OL1M', {
+                'title': 'Kar', 'isbn_13': ['978-975-470-000-8'], 'isbn_10': ['9754700001'],
+                'authors': [{'key': '/authors/OL1A'}]}),
+            # Yazarı sadece eser kaydında olan edition
+            dump_line('/type/edition', '/books/OL2M', {
+                'title': 'Masumiyet Müzesi', 'isbn_13': ['9780134685991'],
+                'works': [{'key': '/works/OL2W'}]}),
+            dump_line('/type/work', '/works/OL2W', {
+                'title': 'Masumiyet Müzesi',
+                'authors': [{'author': {'key': '/authors/OL1A'}, 'type': {'key': '/type/author_role'}}]}),
+            "bozuk satır\n",
+            dump_line('/type/redirect', '/books/OL3M', {'location': '/books/OL1M'}),
+        ]
+        with gzip.open(self.dump_file, 'wt', encoding='utf-8') as file:
+            file.writelines(lines)
+
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_ingest_and_lookup(self):
+        """Döküm aktarılıp ISBN-10 ve ISBN-13 ile aranabilmeli"""
+        index = DumpIndex(self.index_file)
+        counts = index.ingest(self.dump_file, batch_size=2)
+
+        assert counts == {'isbns': 3, 'works': 1, 'authors': 1}
+        assert index.lookup("9789754700008") == ("Kar", "Orhan Pamuk")
+        assert index.lookup("975470000-1") == ("Kar", "Orhan Pamuk")
+        assert index.lookup("978-0134685991") == ("Masumiyet Müzesi", "Orhan Pamuk")
+        assert index.lookup("9780306406157") is None
+        assert index.get_stats()['hits'] == 3
+        index.close()
+
+    def test_missing_index_not_created(self):
+        """Dizin dosyası yoksa arama dosya oluşturmamalı"""
+        index = DumpIndex(self.index_file)
+        assert index.lookup("9789754700008") is None
+        assert not os.path.exists(self.index_file)
+
+    def test_library_api_uses_index_first(self):
+        """Dizinde bulunan ISBN için API'ye istek yapılmamalı"""
+        index = DumpIndex(self.index_file)
+        index.ingest(self.dump_file)
+        index.close()
+
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(404)
+
+        api = LibraryAPI(cache_file=None, negative_cache=NegativeCache(),
+                         index_file=self.index_file)
+
+        async def run():
+            async with api:
+                api._client = httpx.AsyncClient(base_url=api.base_url,
+                                                transport=httpx.MockTransport(handler))
+                book = await api.get_book_by_isbn("978-975-470-000-8")
+                missing = await api.get_book_by_isbn("9780306406157")
+                batch = await api.get_books_by_isbns(["9780134685991"])
+                return book, missing, batch
+
+        book, missing, batch = asyncio.run(run())
+        assert (book.title, book.author) == ("Kar", "Orhan Pamuk")
+        assert missing is None
+        assert batch[0].title == "Masumiyet Müzesi"
+        assert requests == ["/isbn/9780306406157.json"]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+"""
+Önceden kodlanmış yanıt gövdeleri için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import gzip
+import json
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import encoded_body
+from encoded_body import EncodedBody, accepted_encodings, choose_encoding, gzip_chunks, iter_ndjson
+
+class TestEncodedBody:
+    """EncodedBody ve kodlama seçimi test sınıfı"""
+
+    def test_accepted_encodings(self):
+        """q=0 ile reddedilen kodlamalar listelenmemeli"""
+        assert accepted_encodings("gzip, deflate;q=0.5, br;q=0") == ["gzip", "deflate"]
+        assert accepted_encodings("") == []
+
+    def test_choose_encoding(self, monkeypatch):
+        """Brotli varsa tercih edilmeli, yoksa gzip seçilmeli"""
+        monkeypatch.setattr(encoded_body, 'BROTLI_AVAILABLE', False)
+        assert choose_encoding("gzip, br") == "gzip"
+        assert choose_encoding("identity") == "identity"
+        assert choose_encoding("*") == "gzip"
+
+        monkeypatch.setattr(encoded_body, 'BROTLI_AVAILABLE', True)
+        assert choose_encoding("gzip, br") == "br"
+        assert choose_encoding("gzip, br;q=0") == "gzip"
+
+    def test_gzip_variant_cached(self):
+        """gzip hâli bir kez üretilmeli ve aynı nesne döndürülmeli"""
+        body = EncodedBody(b'{"books":[]}' * 100)
+        compressed = body.get('gzip')
+
+        assert gzip.decompress(compressed) == body.get()
+        assert body.get('gzip') is compressed
+        assert body.size == 1200 + len(compressed)
+
+    def test_unknown_encoding(self):
+        """Desteklenmeyen kodlama ValueError fırlatmalı"""
+        with pytest.raises(ValueError):
+            EncodedBody(b'{}').get('deflate')
+
+    def test_iter_ndjson_chunks(self):
+        """Her kayıt bir satır olmalı; satırlar parça sınırında bölünmemeli"""
+        items = [{"isbn": str(i), "title": "Çalıkuşu"} for i in range(100)]
+        chunks = list(iter_ndjson(iter(items), chunk_size=256))
+
+        assert len(chunks) > 1
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == items
+        assert list(iter_ndjson([])) == []
+
+    def test_gzip_chunks_round_trip(self):
+        """Akış halinde sıkıştırılan parçalar tek gzip dosyası olarak açılmalı"""
+        chunks = [b'{"isbn":"%d"}\n' % i for i in range(1000)]
+        compressed = b"".join(gzip_chunks(iter(chunks)))
+
+        assert gzip.decompress(compressed) == b"".join(chunks)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
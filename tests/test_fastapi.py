@@ -4,106 +4,136 @@ Aşama 3: FastAPI testleri
 """
 
 import pytest
-import httpx
 import asyncio
-from fastapi.testclient import TestClient
+import gzip
+import json
 import sys
 import os
 
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
 # src klasörünü Python path'ine ekle
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from book import Book
+
+
+@pytest.fixture
+def api(library_project, library_api, monkeypatch):
+    """
+    library_project/api.py modülü; global kütüphane teste özel olanla değişir
 
-from api import app
+    Kütüphane geçici klasörde tutulur ve Open Library yerine sahte aktarım
+    kullanılır; listeleme önbelleği de her test için boştur.
+    """
+    module = library_project.api
+    monkeypatch.setattr(module, 'library', library_api)
+    monkeypatch.setattr(module, 'async_library', module.AsyncLibrary(library_api))
+    monkeypatch.setattr(module, 'listing_cache', module.QueryCache())
+    return module
 
-# Test client oluştur
-client = TestClient(app)
+
+@pytest.fixture
+def client(api):
+    """Uygulama ömrünü (lifespan) de çalıştıran test istemcisi"""
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+def add_books(library, count):
+    """Kütüphaneye sırayla numaralı test kitapları ekler"""
+    for i in range(count):
+        library.add_book(Book(f"Kitap {i}", f"Yazar {i}", f"isbn-{i:03d}"))
 
 
 class TestFastAPI:
     """FastAPI endpoint'leri için test sınıfı"""
-    
-    def test_root_endpoint(self):
+
+    def test_root_endpoint(self, client):
         """Ana sayfa endpoint'ini test eder"""
         response = client.get("/")
         assert response.status_code == 200
         assert "message" in response.json()
-    
-    def test_get_books_endpoint(self):
+
+    def test_get_books_endpoint(self, client):
         """GET /books endpoint'ini test eder"""
         response = client.get("/books")
         assert response.status_code == 200
         assert "books" in response.json()
         assert isinstance(response.json()["books"], list)
-    
-    def test_post_books_endpoint_valid_isbn(self):
+
+    def test_post_books_endpoint_valid_isbn(self, client, open_library):
         """POST /books endpoint'ini geçerli ISBN ile test eder"""
         # Test ISBN'i (Harry Potter)
         test_data = {"isbn": "978-0-7475-3269-9"}
-        
+
         response = client.post("/books", json=test_data)
-        
-        # API çağrısı başarılı olmalı
-        assert response.status_code in [200, 201]
-        response_data = response.json()
-        
-        # Başarılı ise kitap bilgileri dönmeli
-        if response_data.get("success"):
-            assert "book" in response_data
-            assert response_data["book"]["isbn"] == test_data["isbn"]
-        else:
-            # Başarısız ise hata mesajı olmalı
-            assert "message" in response_data
-    
-    def test_post_books_endpoint_invalid_isbn(self):
+
+        # Eklenen kitabın bilgileri dönmeli
+        assert response.status_code == 201
+        assert response.json() == {
+            "title": "Harry Potter and the Philosopher's Stone",
+            "author": "J. K. Rowling",
+            "isbn": test_data["isbn"]
+        }
+
+        # Aynı ISBN ikinci kez eklenemez ve API'ye tekrar sorulmaz
+        requests = len(open_library.requests)
+        response = client.post("/books", json=test_data)
+        assert response.status_code == 400
+        assert len(open_library.requests) == requests
+
+    def test_post_books_endpoint_not_found(self, client):
+        """Open Library'de olmayan ISBN 404 döndürmeli"""
+        response = client.post("/books", json={"isbn": "9780306406157"})
+
+        assert response.status_code == 404
+        assert response.json()["success"] is False
+
+    def test_post_books_endpoint_invalid_isbn(self, client):
         """POST /books endpoint'ini geçersiz ISBN ile test eder"""
         test_data = {"isbn": "invalid-isbn-123"}
-        
+
         response = client.post("/books", json=test_data)
-        
+
         # Geçersiz ISBN için hata dönmeli
         assert response.status_code in [400, 404, 422]
         response_data = response.json()
         assert "message" in response_data
-    
-    def test_post_books_endpoint_missing_isbn(self):
+
+    def test_post_books_endpoint_missing_isbn(self, client):
         """POST /books endpoint'ini eksik ISBN ile test eder"""
         test_data = {}  # ISBN yok
-        
+
         response = client.post("/books", json=test_data)
-        
+
         # Eksik veri için hata dönmeli
         assert response.status_code == 422  # Validation error
         response_data = response.json()
         assert "detail" in response_data
-    
-    def test_delete_books_endpoint(self):
+
+    def test_delete_books_endpoint(self, client, library_api):
         """DELETE /books/{isbn} endpoint'ini test eder"""
         # Önce bir kitap ekle
         test_isbn = "test-delete-123"
-        test_book = {
-            "title": "Test Kitap",
-            "author": "Test Yazar",
-            "isbn": test_isbn
-        }
-        
-        # Kitabı ekle
-        add_response = client.post("/books", json=test_book)
-        if add_response.status_code == 200:
-            # Şimdi sil
-            delete_response = client.delete(f"/books/{test_isbn}")
-            assert delete_response.status_code in [200, 204]
-        else:
-            # Kitap eklenemezse test atla
-            pytest.skip("Kitap eklenemedi, silme testi atlanıyor")
-    
-    def test_docs_endpoint(self):
+        library_api.add_book(Book("Test Kitap", "Test Yazar", test_isbn))
+
+        delete_response = client.delete(f"/books/{test_isbn}")
+        assert delete_response.status_code == 200
+        assert library_api.find_book(test_isbn) is None
+
+        # Olmayan kitap silinemez
+        assert client.delete(f"/books/{test_isbn}").status_code == 404
+
+    def test_docs_endpoint(self, client):
         """/docs endpoint'ini test eder"""
         response = client.get("/docs")
         assert response.status_code == 200
         # HTML içeriği olmalı
         assert "text/html" in response.headers.get("content-type", "")
-    
-    def test_openapi_endpoint(self):
+
+    def test_openapi_endpoint(self, client):
         """/openapi.json endpoint'ini test eder"""
         response = client.get("/openapi.json")
         assert response.status_code == 200
@@ -111,52 +141,224 @@ class TestFastAPI:
         assert "paths" in response.json()
 
 
+class TestBookListing:
+    """GET /books sayfalama, ETag ve sıkıştırma testleri"""
+
+    def test_cursor_paging(self, client, library_api):
+        """next_cursor ile tüm kitaplar ekleme sırasıyla ve tekrarsız gezilmeli"""
+        add_books(library_api, 5)
+
+        isbns = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            data = client.get("/books", params=params).json()
+            assert data["total"] == 5
+            isbns.extend(book["isbn"] for book in data["books"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert isbns == [f"isbn-{i:03d}" for i in range(5)]
+
+    def test_invalid_cursor(self, client, library_api):
+        """Geçersiz imleç 400 döndürmeli"""
+        add_books(library_api, 1)
+
+        response = client.get("/books", params={"cursor": "bozuk"})
+
+        assert response.status_code == 400
+        assert response.json()["success"] is False
+
+    def test_not_modified(self, client, library_api):
+        """Eşleşen If-None-Match 304 döndürmeli; kütüphane değişince ETag değişmeli"""
+        add_books(library_api, 2)
+        headers = {"Accept-Encoding": "identity"}
+
+        response = client.get("/books", headers=headers)
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+
+        cached = client.get("/books", headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        library_api.add_book(Book("Yeni Kitap", "Yeni Yazar", "isbn-new"))
+        changed = client.get("/books", headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total"] == 3
+
+    def test_gzip_etag_suffix(self, client, library_api):
+        """Sıkıştırılmış yanıtın ETag'i kodlama sonekiyle ayrışmalı"""
+        add_books(library_api, 3)
+
+        plain = client.get("/books", headers={"Accept-Encoding": "identity"})
+        compressed = client.get("/books", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in plain.headers
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert compressed.headers["Vary"] == "Accept-Encoding"
+        assert compressed.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+        assert compressed.json() == plain.json()
+
+        # Sıkıştırılmamış ETag gzip isteğini doğrulamaz
+        response = client.get("/books", headers={
+            "Accept-Encoding": "gzip", "If-None-Match": plain.headers["ETag"]})
+        assert response.status_code == 200
+        response = client.get("/books", headers={
+            "Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]})
+        assert response.status_code == 304
+
+    def test_listing_cache_reused(self, client, api, library_api):
+        """Aynı sayfa kütüphane değişmedikçe önbellekteki baytlardan gönderilmeli"""
+        add_books(library_api, 3)
+        headers = {"Accept-Encoding": "identity"}
+
+        first = client.get("/books", headers=headers)
+        second = client.get("/books", headers=headers)
+        assert first.content == second.content
+        assert api.listing_cache.hits == 1
+
+        library_api.remove_book("isbn-000")
+        third = client.get("/books", headers=headers)
+        assert third.json()["total"] == 2
+        assert api.listing_cache.hits == 1
+
+
+class TestExportAndSuggest:
+    """Dışa aktarma ve öneri endpoint testleri"""
+
+    def test_export_identity(self, client, library_api):
+        """Dışa aktarma satır başına bir kitap içeren NDJSON olmalı"""
+        add_books(library_api, 3)
+
+        response = client.get("/books/export", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "Content-Encoding" not in response.headers
+        lines = response.content.decode("utf-8").splitlines()
+        assert [json.loads(line)["isbn"] for line in lines] == ["isbn-000", "isbn-001", "isbn-002"]
+
+    def test_export_gzip(self, client, library_api):
+        """İstemci kabul ediyorsa dışa aktarma gzip ile sıkıştırılmalı"""
+        add_books(library_api, 3)
+
+        with client.stream("GET", "/books/export", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        lines = gzip.decompress(raw).decode("utf-8").splitlines()
+        assert len(lines) == 3
+
+    def test_export_bad_format(self, client):
+        """Desteklenmeyen format 400 döndürmeli"""
+        response = client.get("/books/export", params={"format": "csv"})
+
+        assert response.status_code == 400
+        assert "csv" in response.json()["message"]
+
+    def test_suggest(self, client, library_api):
+        """Öneriler başlık ve yazar öneklerinden gelmeli"""
+        library_api.add_book(Book("Sefiller", "Victor Hugo", "111"))
+        library_api.add_book(Book("Serenad", "Zülfü Livaneli", "222"))
+
+        data = client.get("/books/suggest", params={"q": " se "}).json()
+        assert data["query"] == "se"
+        assert set(data["suggestions"]) == {"Sefiller", "Serenad"}
+
+        assert client.get("/books/suggest", params={"q": "se", "limit": 1}).json()["suggestions"] \
+            in (["Sefiller"], ["Serenad"])
+        assert client.get("/books/suggest").json()["suggestions"] == []
+        assert client.get("/books/suggest", params={"q": "se", "limit": 0}).status_code == 422
+
+
+class TestSearchAndStats:
+    """Arama, istatistik ve API testi endpoint testleri"""
+
+    def test_search_paging(self, client, library_api):
+        """Arama sonuçları limit/offset ile sayfalanmalı"""
+        add_books(library_api, 5)
+
+        first = client.get("/books/search/kitap", params={"limit": 2}).json()
+        second = client.get("/books/search/kitap", params={"limit": 2, "offset": 2}).json()
+
+        assert first["total"] == second["total"] == 5
+        assert (first["limit"], second["offset"]) == (2, 2)
+        assert len(first["books"]) == len(second["books"]) == 2
+        assert not {b["isbn"] for b in first["books"]} & {b["isbn"] for b in second["books"]}
+
+    def test_search_fuzzy(self, client, library_api):
+        """fuzzy=true yazım hatalı aramada da sonuç bulmalı"""
+        library_api.add_book(Book("Sefiller", "Victor Hugo", "111"))
+
+        assert client.get("/books/search/sefilller").json()["total"] == 0
+        data = client.get("/books/search/sefilller", params={"fuzzy": "true"}).json()
+        assert [book["isbn"] for book in data["books"]] == ["111"]
+
+    def test_stats_not_modified(self, client, library_api):
+        """İstatistikler kütüphane değişmedikçe 304 ile doğrulanmalı"""
+        add_books(library_api, 2)
+
+        response = client.get("/stats")
+        etag = response.headers["ETag"]
+        assert response.json()["total_books"] == 2
+        assert client.get("/stats", headers={"If-None-Match": etag}).status_code == 304
+
+        add_books(library_api, 3)
+        response = client.get("/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total_books"] == 3
+
+    def test_cache_stats(self, client, library_api):
+        """Önbellek sayaçları ayrı ve önbelleklenmeyen endpoint'te olmalı"""
+        response = client.get("/stats/cache")
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert response.json()["circuit_breaker"] == "closed"
+        assert set(response.json()) == {
+            "cache_hits", "cache_misses", "author_cache_hit_ratio", "circuit_breaker"}
+
+    def test_api_connection(self, client, open_library):
+        """API testi async istemciyle sahte Open Library'ye bağlanmalı"""
+        response = client.get("/api-test")
+
+        assert response.json()["success"] is True
+        assert open_library.requests == ["/isbn/978-0134685991.json"]
+
+
 class TestFastAPIIntegration:
     """FastAPI ile Library sınıfı entegrasyon testleri"""
-    
-    def test_library_class_integration(self):
+
+    def test_library_class_integration(self, library_project, tmp_path):
         """Library sınıfının FastAPI ile entegrasyonunu test eder"""
-        from library import Library
-        
-        # Test kütüphanesi oluştur
-        test_library = Library("test_library.json")
-        
+        # Test kütüphanesi oluştur (dosyalar geçici dizinde)
+        test_library = library_project.library.Library(str(tmp_path / "test_library.json"))
+
         # Kitap ekle
-        from book import Book
         test_book = Book("Test Kitap", "Test Yazar", "test-123")
         success = test_library.add_book(test_book)
-        
+
         assert success == True
         assert len(test_library.books) == 1
-        
-        # Test dosyasını temizle
-        if os.path.exists("test_library.json"):
-            os.remove("test_library.json")
 
 
 # Async test fonksiyonları
 @pytest.mark.asyncio
-async def test_async_library_api():
+async def test_async_library_api(library_api):
     """LibraryAPI sınıfının async fonksiyonlarını test eder"""
-    try:
-        from library_api import LibraryAPI
-        
-        api = LibraryAPI()
-        
-        # Test ISBN ile kitap çekme
-        book = await api.get_book_by_isbn("978-0-7475-3269-9")
-        
-        # Kitap bulunabilir veya bulunamayabilir (API durumuna bağlı)
-        if book:
-            assert hasattr(book, 'title')
-            assert hasattr(book, 'author')
-            assert hasattr(book, 'isbn')
-        else:
-            # API erişilemez olabilir
-            pytest.skip("Open Library API erişilemez")
-            
-    except ImportError:
-        pytest.skip("LibraryAPI modülü bulunamadı")
+    # Test ISBN ile kitap çekme
+    book = await library_api.get_book_by_isbn("978-0-7475-3269-9")
+    await library_api.aclose()
+
+    assert book.title == "Harry Potter and the Philosopher's Stone"
+    assert book.author == "J. K. Rowling"
+    assert book.isbn == "978-0-7475-3269-9"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+HTTPCache ve önbellekli transport için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import asyncio
+import threading
+import httpx
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from http_cache import AsyncCachingTransport, CachingTransport, HTTPCache
+
+
+class FakeUpstream:
+    """İstekleri kaydeden, ETag destekli sahte sunucu"""
+    
+    def __init__(self):
+        self.requests = []
+        self.online = True
+        self.status = 200
+    
+    def __call__(self, request):
+        self.requests.append(request)
+        if not self.online:
+            raise httpx.ConnectError("ağ yok", request=request)
+        if self.status != 200:
+            return httpx.Response(self.status)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, json={"title": "Test Kitap"}, headers={'ETag': '"v1"'})
+
+
+class TestHTTPCache:
+    """HTTPCache sınıfı test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, 'http_cache.sqlite')
+        self.cache = HTTPCache(self.filename, ttl=60)
+        self.upstream = FakeUpstream()
+        self.client = httpx.Client(
+            base_url="https://openlibrary.org",
+            transport=CachingTransport(self.cache, httpx.MockTransport(self.upstream)))
+    
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        self.client.close()
+        self.cache.close()
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def expire(self, url):
+        """Girişin süresini doldurur"""
+        self.cache.refresh(url, {}, ttl=-1)
+    
+    def test_repeat_request_served_from_cache(self):
+        """İkinci istek ağa gitmeden önbellekten gelmeli"""
+        first = self.client.get("/isbn/123.json")
+        second = self.client.get("/isbn/123.json")
+        
+        assert first.headers['X-Cache'] == 'MISS'
+        assert second.headers['X-Cache'] == 'HIT'
+        assert second.json() == {"title": "Test Kitap"}
+        assert len(self.upstream.requests) == 1
+    
+    def test_stale_entry_revalidated_with_etag(self):
+        """Süresi dolan giriş If-None-Match ile doğrulanmalı"""
+        self.client.get("/isbn/123.json")
+        self.expire("https://openlibrary.org/isbn/123.json")
+        
+        response = self.client.get("/isbn/123.json")
+        
+        assert self.upstream.requests[-1].headers['If-None-Match'] == '"v1"'
+        assert response.status_code == 200
+        assert response.headers['X-Cache'] == 'REVALIDATED'
+        assert response.json() == {"title": "Test Kitap"}
+        assert self.cache.get("https://openlibrary.org/isbn/123.json").fresh
+    
+    def test_offline_serves_stale(self):
+        """Sunucuya ulaşılamazsa eski yanıt kullanılmalı"""
+        self.client.get("/isbn/123.json")
+        self.expire("https://openlibrary.org/isbn/123.json")
+        self.upstream.online = False
+        
+        response = self.client.get("/isbn/123.json")
+        
+        assert response.headers['X-Cache'] == 'STALE'
+        assert response.json() == {"title": "Test Kitap"}
+        with pytest.raises(httpx.ConnectError):
+            self.client.get("/isbn/456.json")
+    
+    def test_server_error_serves_stale(self):
+        """Sunucu hatasında eski yanıt kullanılmalı, hata önbelleğe alınmamalı"""
+        self.client.get("/isbn/123.json")
+        self.expire("https://openlibrary.org/isbn/123.json")
+        self.upstream.status = 503
+        
+        assert self.client.get("/isbn/123.json").headers['X-Cache'] == 'STALE'
+        assert self.client.get("/isbn/456.json").status_code == 503
+        assert self.cache.get("https://openlibrary.org/isbn/456.json") is None
+    
+    def test_lru_eviction(self):
+        """Sınır aşılınca en uzun süredir kullanılmayan giriş silinmeli"""
+        cache = HTTPCache(os.path.join(self.temp_dir, 'small.sqlite'), max_entries=2,
+                          touch_interval=0)
+        cache.put("a", 200, b"A", {})
+        cache.put("b", 200, b"B", {})
+        cache.get("a")
+        cache.put("c", 200, b"C", {})
+        
+        assert cache.get("b") is None
+        assert cache.get("a").body == b"A"
+        assert len(cache) == 2
+        cache.close()
+    
+    def test_access_time_written_at_most_once_per_interval(self):
+        """Okumalar son kullanım zamanını her seferinde diske yazmamalı"""
+        self.cache.put("a", 200, b"A", {})
+        conn = self.cache._conn
+        changes = conn.total_changes
+        for _ in range(5):
+            assert self.cache.get("a").body == b"A"
+        assert conn.total_changes == changes
+        
+        self.cache.touch_interval = 0
+        self.cache.get("a")
+        assert conn.total_changes == changes + 1
+    
+    def test_persists_across_instances(self):
+        """Önbellek yeniden açıldığında girişler korunmalı"""
+        self.client.get("/isbn/123.json")
+        self.cache.close()
+        
+        reopened = HTTPCache(self.filename)
+        cached = reopened.get("https://openlibrary.org/isbn/123.json")
+        reopened.close()
+        
+        assert cached.status == 200
+        assert cached.headers['etag'] == '"v1"'
+    
+    def test_async_transport(self):
+        """Async istemci de aynı önbelleği kullanmalı"""
+        self.client.get("/isbn/123.json")
+        
+        async def fetch():
+            async with httpx.AsyncClient(
+                    base_url="https://openlibrary.org",
+                    transport=AsyncCachingTransport(self.cache, httpx.MockTransport(self.upstream))) as client:
+                return await client.get("/isbn/123.json")
+        
+        response = asyncio.run(fetch())
+        
+        assert response.headers['X-Cache'] == 'HIT'
+        assert len(self.upstream.requests) == 1
+    
+    def test_async_transport_queries_off_event_loop(self):
+        """Async transport SQLite işlemlerini event loop thread'inde yapmamalı"""
+        threads = []
+        lookup, update = self.cache.lookup, self.cache.update
+        
+        def recording(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+            return wrapper
+        
+        self.cache.lookup = recording(lookup)
+        self.cache.update = recording(update)
+        
+        async def fetch():
+            async with httpx.AsyncClient(
+                    base_url="https://openlibrary.org",
+                    transport=AsyncCachingTransport(self.cache, httpx.MockTransport(self.upstream))) as client:
+                first = await client.get("/isbn/123.json")
+                second = await client.get("/isbn/123.json")
+                return first, second, threading.current_thread()
+        
+        first, second, loop_thread = asyncio.run(fetch())
+        
+        assert first.headers['X-Cache'] == 'MISS'
+        assert second.headers['X-Cache'] == 'HIT'
+        assert len(threads) == 3 and loop_thread not in threads
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
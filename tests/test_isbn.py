@@ -0,0 +1,79 @@
+"""
+ISBN doğrulama ve NegativeCache için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from isbn import NegativeCache, compact_isbn, is_valid_isbn
+
+class TestIsValidISBN:
+    """is_valid_isbn fonksiyonu test sınıfı"""
+    
+    @pytest.mark.parametrize("isbn", [
+        "978-0-7475-3269-9",
+        "9780134685991",
+        "0-7475-3269-9",
+        "0-8044-2957-X",
+        "0-8044-2957-x",
+        "978 975 07 0395 9",
+    ])
+    def test_valid(self, isbn):
+        """Kontrol basamağı doğru ISBN'ler kabul edilmeli"""
+        assert is_valid_isbn(isbn)
+    
+    @pytest.mark.parametrize("isbn", [
+        "",
+        "invalid-isbn-123",
+        "978-0-7475-3269-8",
+        "0-7475-3269-8",
+        "123-456-789",
+        "97807475326991",
+        "X-7475-3269-9",
+        "978-0-7475-3269-9!",
+    ])
+    def test_invalid(self, isbn):
+        """Hatalı ISBN'ler reddedilmeli"""
+        assert not is_valid_isbn(isbn)
+    
+    def test_compact(self):
+        """Tire ve boşluklar kaldırılmalı"""
+        assert compact_isbn("0-8044-2957-x") == "080442957X"
+
+class TestNegativeCache:
+    """NegativeCache sınıfı test sınıfı"""
+    
+    def test_hyphenation_ignored(self):
+        """Tireli ve tiresiz yazılışlar aynı girişi kullanmalı"""
+        cache = NegativeCache()
+        cache.add("978-0-7475-3269-9")
+        
+        assert "9780747532699" in cache
+        assert "9780134685991" not in cache
+        assert cache.hits == 1
+    
+    def test_entries_expire(self):
+        """Süresi dolan girişler tekrar denenebilmeli"""
+        cache = NegativeCache(ttl=0.01)
+        cache.add("9780747532699")
+        time.sleep(0.02)
+        
+        assert "9780747532699" not in cache
+        assert len(cache) == 0
+    
+    def test_bounded(self):
+        """Giriş sayısı sınırı aşılmamalı"""
+        cache = NegativeCache(max_entries=2)
+        for isbn in ["1", "2", "3"]:
+            cache.add(isbn)
+        
+        assert len(cache) == 2
+        assert "1" not in cache
+
+if __name__ == "__main__":
+    pytest.main([__file__])
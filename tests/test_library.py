@@ -7,12 +7,16 @@ import sys
 import os
 import tempfile
 import json
+import asyncio
+import threading
 
 # src klasörünü Python path'ine ekle
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from library import Library
+from library_api import LibraryAPI
 from book import Book
+from journal import Journal
 
 class TestLibrary:
     """Library sınıfı test sınıfı"""
@@ -95,6 +99,46 @@ class TestLibrary:
         
         assert found_book is None
     
+    def test_isbn_index_keeps_insertion_order(self):
+        """ISBN indeksi ekleme/silme sonrası sırayı ve tutarlılığı korumalı"""
+        for i in range(5):
+            self.library.add_book(Book(f"Book {i}", "Author", f"isbn-{i}"))
+        
+        self.library.remove_book("isbn-2")
+        self.library.add_book(Book("Book 2b", "Author", "isbn-2"))
+        
+        assert [b.isbn for b in self.library.books] == ["isbn-0", "isbn-1", "isbn-3", "isbn-4", "isbn-2"]
+        assert self.library.find_book("isbn-2").title == "Book 2b"
+        assert self.library.get_stats()['total_books'] == 5
+    
+    def test_search_cache_hits_and_invalidation(self):
+        """Tekrarlanan arama önbellekten gelmeli, değişiklik önbelleği geçersiz kılmalı"""
+        self.library.add_book(Book("Python Programming", "John Doe", "123-456-789"))
+        
+        first = self.library.search_books("python")
+        second = self.library.search_books("python")
+        stats = self.library.get_stats()
+        
+        assert first == second
+        assert stats['cache_hits'] == 1
+        assert stats['cache_misses'] == 1
+        
+        version = self.library.version
+        self.library.add_book(Book("Python Advanced", "Bob Johnson", "555-555-555"))
+        assert self.library.version > version
+        assert len(self.library.search_books("python")) == 2
+        assert self.library.get_stats()['cache_misses'] == 2
+    
+    def test_cached_results_are_copies(self):
+        """Dönen listeyi değiştirmek önbelleği bozmamalı"""
+        self.library.add_book(Book("Python Programming", "John Doe", "123-456-789"))
+        
+        self.library.search_books("python").clear()
+        self.library.ranked_search("python")[0].clear()
+        
+        assert len(self.library.search_books("python")) == 1
+        assert len(self.library.ranked_search("python")[0]) == 1
+    
     def test_search_books_by_keyword(self):
         """Anahtar kelime ile kitap arama testi"""
         book1 = Book("Python Programming", "John Doe", "123-456-789")
@@ -142,5 +186,390 @@ class TestLibrary:
         self.library.list_books()
         assert True  # Eğer buraya kadar geldiyse hata yok demektir
 
+    def test_page_books_cursor(self):
+        """İmleçli sayfalar tüm kitapları sırayla ve tekrarsız vermeli"""
+        for i in range(7):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        
+        page, cursor = self.library.page_books(limit=3)
+        assert [b.isbn for b in page] == ["isbn-0", "isbn-1", "isbn-2"]
+        
+        # Sayfalar arasında yapılan silme ve ekleme sonraki sayfayı kaydırmamalı
+        self.library.remove_book("isbn-1")
+        self.library.remove_book("isbn-2")
+        self.library.add_book(Book("Yeni", "Yazar", "isbn-7"))
+        
+        page, cursor = self.library.page_books(cursor, limit=3)
+        assert [b.isbn for b in page] == ["isbn-3", "isbn-4", "isbn-5"]
+        page, cursor = self.library.page_books(cursor, limit=3)
+        assert [b.isbn for b in page] == ["isbn-6", "isbn-7"]
+        assert cursor is None
+        assert len(self.library) == 6
+    
+    def test_page_books_skips_deleted(self):
+        """Silinen kitaplar sayfalarda görünmemeli; ölü numaralar toplu temizlenmeli"""
+        for i in range(100):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        for i in range(80):
+            self.library.remove_book(f"isbn-{i}")
+        
+        # Temizlik yarıdan sonra yapıldığı için liste kitap sayısına yakın kalmalı
+        assert len(self.library._order) < 2 * len(self.library)
+        isbns = []
+        cursor = None
+        while True:
+            page, cursor = self.library.page_books(cursor, limit=7)
+            isbns += [b.isbn for b in page]
+            if cursor is None:
+                break
+        assert isbns == [f"isbn-{i}" for i in range(80, 100)]
+    
+    def test_page_books_cursor_book_readded(self):
+        """İmlecin kitabı silinip yeniden eklenirse sonraki sayfa boş kalmamalı"""
+        for i in range(4):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"i{i}"))
+        
+        page, cursor = self.library.page_books(limit=2)
+        assert [b.isbn for b in page] == ["i0", "i1"]
+        
+        self.library.remove_book("i1")
+        self.library.add_book(Book("Kitap 1", "Yazar", "i1"))
+        
+        page, cursor = self.library.page_books(cursor, limit=2)
+        assert [b.isbn for b in page] == ["i2", "i3"]
+        page, cursor = self.library.page_books(cursor, limit=2)
+        assert [b.isbn for b in page] == ["i1"]
+        assert cursor is None
+    
+    def test_etag_follows_version(self):
+        """ETag değişiklik olmadıkça sabit kalmalı, her değişiklikte yenilenmeli"""
+        etag = self.library.etag('books')
+        assert self.library.etag('books') == etag
+        assert self.library.etag('books', 'imleç') != etag
+        
+        self.library.add_book(Book("Test Book", "Test Author", "123-456-789"))
+        assert self.library.etag('books') != etag
+        
+        # Aynı dosyayı açan başka bir nesne aynı sürümle çakışmamalı
+        assert Library(self.temp_filename).etag('books') != self.library.etag('books')
+    
+    def test_page_books_invalid_cursor(self):
+        """Geçersiz imleç ValueError fırlatmalı"""
+        with pytest.raises(ValueError):
+            self.library.page_books("bozuk-imleç")
+    
+    def test_iter_books(self):
+        """iter_books tüm kitapları ekleme sırasıyla, parça parça vermeli"""
+        for i in range(7):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        
+        assert [b.isbn for b in self.library.iter_books(batch_size=3)] == \
+            [f"isbn-{i}" for i in range(7)]
+
+    def test_concurrent_reads_during_writes(self):
+        """Başka thread ekleme/silme yaparken okumalar hata vermemeli"""
+        self.library.journal = Journal(self.temp_filename + '.journal')
+        for i in range(50):
+            self.library.add_book(Book(f"Kalıcı Kitap {i}", "Orhan Pamuk", f"keep-{i}"))
+        stop = threading.Event()
+        errors = []
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                self.library.add_book(Book(f"Geçici Kitap {i}", "Oğuz Atay", f"tmp-{i}"))
+                if i >= 20:
+                    self.library.remove_book(f"tmp-{i - 20}")
+                i += 1
+
+        def reader():
+            try:
+                for _ in range(300):
+                    self.library.search_books("kitap")
+                    self.library.search_books("pamuk", fuzzy=True)
+                    self.library.ranked_search("atay", limit=5)
+                    self.library.ranked_search("geçci", fuzzy=True)
+                    self.library.suggest("ge")
+                    self.library.etag('books')
+                    list(self.library.iter_books(batch_size=7))
+            except Exception as e:  # noqa: BLE001 - tüm hatalar raporlanır
+                errors.append(e)
+
+        writer_thread = threading.Thread(target=writer)
+        reader_threads = [threading.Thread(target=reader) for _ in range(2)]
+        # Thread'ler sık sık yer değiştirsin ki yarış koşulları ortaya çıksın
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            writer_thread.start()
+            for thread in reader_threads:
+                thread.start()
+            for thread in reader_threads:
+                thread.join()
+        finally:
+            stop.set()
+            writer_thread.join()
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert len(self.library.search_books("kalıcı")) == 50
+
+class TestLibraryJournal:
+    """Günlük (journal) modunda Library test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_filename = os.path.join(self.temp_dir, 'library.json')
+        self.library = Library(self.temp_filename, journal=True, compact_threshold=10)
+    
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_mutations_append_to_journal(self):
+        """Ekleme/silme işlemleri JSON dosyasını yeniden yazmamalı"""
+        self.library.add_book(Book("Test Book 1", "Test Author 1", "123-456-789"))
+        self.library.add_book(Book("Test Book 2", "Test Author 2", "987-654-321"))
+        self.library.remove_book("123-456-789")
+        
+        assert not os.path.exists(self.temp_filename)
+        assert self.library.journal.entry_count == 3
+        with open(self.temp_filename + '.journal', encoding='utf-8') as file:
+            ops = [json.loads(line)['op'] for line in file]
+        assert ops == ['add', 'add', 'remove']
+    
+    def test_replay_journal_on_load(self):
+        """Yeni Library nesnesi günlüğü anlık görüntü üzerine uygulamalı"""
+        self.library.add_book(Book("Test Book 1", "Test Author 1", "123-456-789"))
+        self.library.save_books()
+        self.library.add_book(Book("Test Book 2", "Test Author 2", "987-654-321"))
+        self.library.update_book("123-456-789", "Yeni Başlık", "Yeni Yazar")
+        self.library.remove_book("987-654-321")
+        
+        new_library = Library(self.temp_filename, journal=True)
+        
+        assert len(new_library.books) == 1
+        book = new_library.find_book("123-456-789")
+        assert book.title == "Yeni Başlık"
+        assert book.author == "Yeni Yazar"
+    
+    def test_compaction_after_threshold(self):
+        """Eşik aşılınca günlük JSON dosyasına katlanmalı"""
+        for i in range(10):
+            self.library.add_book(Book(f"Book {i}", "Author", f"isbn-{i}"))
+        
+        assert self.library.journal.entry_count == 0
+        assert not os.path.exists(self.temp_filename + '.journal')
+        with open(self.temp_filename, encoding='utf-8') as file:
+            assert len(json.load(file)) == 10
+    
+    def test_update_nonexistent_book(self):
+        """Var olmayan kitap güncelleme testi"""
+        assert self.library.update_book("999-999-999", "Başlık", "Yazar") is None
+        assert self.library.journal.entry_count == 0
+
+class TestLibrarySQLite:
+    """SQLite depolu Library test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_filename = os.path.join(self.temp_dir, 'library.sqlite')
+        self.library = Library(self.temp_filename)
+    
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        self.library.db.close()
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_sqlite_backend_selected(self):
+        """'.sqlite' uzantısı SQLite deposunu seçmeli"""
+        assert self.library.db is not None
+        assert self.library.get_stats()['storage'] == 'sqlite'
+        assert self.library.books == []
+    
+    def test_add_find_remove(self):
+        """Ekleme, bulma ve silme doğrudan veritabanına gitmeli"""
+        book = Book("Test Book", "Test Author", "123-456-789")
+        
+        assert self.library.add_book(book) == True
+        assert self.library.add_book(Book("Other", "Other", "123-456-789")) == False
+        assert self.library.find_book("123-456-789").title == "Test Book"
+        
+        assert self.library.remove_book("123-456-789") == True
+        assert self.library.find_book("123-456-789") is None
+        assert self.library.remove_book("123-456-789") == False
+    
+    def test_search_matches_substrings(self):
+        """Arama sonuçları bellek içi aramayla aynı olmalı"""
+        self.library.add_book(Book("Python Programming", "John Doe", "123-456-789"))
+        self.library.add_book(Book("Java Basics", "Jane Smith", "987-654-321"))
+        self.library.add_book(Book("Advanced PYTHON", "Bob Johnson", "555-555-555"))
+        
+        assert [b.isbn for b in self.library.search_books("pyth")] == ["123-456-789", "555-555-555"]
+        assert [b.isbn for b in self.library.search_books("ja")] == ["987-654-321"]
+        assert [b.isbn for b in self.library.search_books("654")] == ["987-654-321"]
+        assert self.library.search_books("ruby") == []
+    
+    def test_turkish_search(self):
+        """Veritabanı araması da Türkçe karakter duyarsız olmalı"""
+        self.library.add_book(Book("Işık Ülkesi", "İlhan Yazar", "111-111-111"))
+        
+        assert [b.isbn for b in self.library.search_books("IŞIK")] == ["111-111-111"]
+        assert [b.isbn for b in self.library.search_books("isik ulk")] == ["111-111-111"]
+        assert [b.isbn for b in self.library.search_books("il")] == ["111-111-111"]
+    
+    def test_suggest(self):
+        """Öneriler indeksli sütunlardan gelmeli"""
+        self.library.add_book(Book("Python Programming", "John Doe", "123-456-789"))
+        self.library.add_book(Book("Pythonic Code", "Jane Smith", "987-654-321"))
+        
+        assert self.library.suggest("pyth") == ["Python Programming", "Pythonic Code"]
+        assert self.library.suggest("jane") == ["Jane Smith"]
+        assert self.library.suggest("jo", limit=1) == ["John Doe"]
+    
+    def test_suggest_matches_memory_backend(self):
+        """Türkçe harfli önekler bellek içi depoyla aynı önerileri vermeli"""
+        memory = Library(os.path.join(self.temp_dir, 'library.json'))
+        for library in (self.library, memory):
+            library.add_book(Book("Işık Ülkesi", "İlhan Işıkçı", "111"))
+            library.add_book(Book("Şeker Portakalı", "José Mauro", "222"))
+            library.add_book(Book("ışık ülkesi", "Başka Yazar", "333"))
+        
+        for prefix in ["IŞ", "ış", "isik", "İl", "şek", "SEKER", "jose", "b"]:
+            assert self.library.suggest(prefix) == memory.suggest(prefix), prefix
+        assert self.library.suggest("IŞ") == ["Işık Ülkesi"]
+    
+    def test_cursor_survives_deleting_last_row(self):
+        """En son satır silinip yeni kitap eklense de imleç onu atlamamalı"""
+        for i in range(3):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        page, cursor = self.library.page_books(limit=2)
+        assert [b.isbn for b in page] == ["isbn-0", "isbn-1"]
+        
+        # Silinen en büyük numaralar yeni kitaba verilmemeli
+        self.library.remove_book("isbn-2")
+        self.library.remove_book("isbn-1")
+        self.library.add_book(Book("Yeni", "Yazar", "isbn-3"))
+        
+        page, cursor = self.library.page_books(cursor, limit=2)
+        assert [b.isbn for b in page] == ["isbn-3"]
+        assert cursor is None
+    
+    def test_insert_many(self):
+        """Toplu ekleme tek işlemde yapılmalı ve tekrarları atlamalı"""
+        self.library.add_book(Book("Existing", "Author", "111"))
+        
+        added = self.library._add_batch([Book("A", "Author", "222"), Book("B", "Author", "111")])
+        
+        assert added == [True, False]
+        assert self.library.find_book("222").title == "A"
+        assert self.library.find_book("111").title == "Existing"
+    
+    def test_page_books(self):
+        """SQLite deposunda sayfalama satır numarasıyla yapılmalı"""
+        for i in range(5):
+            self.library.add_book(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        
+        page, cursor = self.library.page_books(limit=2)
+        assert [b.isbn for b in page] == ["isbn-0", "isbn-1"]
+        self.library.remove_book("isbn-2")
+        page, cursor = self.library.page_books(cursor, limit=2)
+        assert [b.isbn for b in page] == ["isbn-3", "isbn-4"]
+        assert cursor is None
+        assert [b.isbn for b in self.library.iter_books(batch_size=2)] == \
+            ["isbn-0", "isbn-1", "isbn-3", "isbn-4"]
+    
+    def test_update_and_reopen(self):
+        """Güncellemeler yeniden açılışta korunmalı"""
+        self.library.add_book(Book("Test Book", "Test Author", "123-456-789"))
+        self.library.update_book("123-456-789", "Yeni Başlık", "Yeni Yazar")
+        
+        reopened = Library(self.temp_filename)
+        book = reopened.find_book("123-456-789")
+        found_books = reopened.search_books("yeni")
+        reopened.db.close()
+        
+        assert book.title == "Yeni Başlık"
+        assert found_books[0].isbn == "123-456-789"
+
+def isbn13(n):
+    """Kontrol basamağı doğru, sıralı bir ISBN-13 üretir"""
+    body = f"978000{n:06d}"
+    check = (10 - sum(int(c) * (3 if i % 2 else 1) for i, c in enumerate(body)) % 10) % 10
+    return body + str(check)
+
+class TestBulkImport:
+    """add_books_by_isbn toplu içe aktarma test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_filename = os.path.join(self.temp_dir, 'library.json')
+        # HTTP önbelleği ve döküm dizini kapalı: çalışma dizinine dosya yazılmaz
+        api = LibraryAPI(cache_file=None, index_file=None)
+        self.library = Library(self.temp_filename, journal=True, api=api)
+        self.library.add_book(Book("Existing Book", "Author", "111"))
+    
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        self.library.close_api()
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_report_and_single_save(self, monkeypatch):
+        """Sonuçlar ISBN bazında raporlanmalı ve dosya bir kez yazılmalı"""
+        catalog = {"222": Book("Second", "Author", "222"), "333": Book("Third", "Author", "333")}
+        requested = []
+        
+        async def fake_fetch(api, isbns, concurrency):
+            requested.extend(isbns)
+            return [catalog.get(isbn) for isbn in isbns]
+        
+        saves = []
+        original_save = self.library.save_books
+        monkeypatch.setattr(self.library, '_fetch_books', fake_fetch)
+        monkeypatch.setattr(self.library, 'save_books', lambda: saves.append(1) or original_save())
+        
+        report = self.library.add_books_by_isbn(["111", "222", " 333 ", "444", "222", ""])
+        
+        assert report == {"111": "exists", "222": "added", "333": "added", "444": "not_found"}
+        assert requested == ["222", "333", "444"]
+        assert len(saves) == 1
+        assert self.library.journal.entry_count == 0
+        assert [b.isbn for b in Library(self.temp_filename).books] == ["111", "222", "333"]
+    
+    def test_concurrency_is_bounded(self, monkeypatch):
+        """Aynı anda yapılan toplu istek sayısı concurrency değerini aşmamalı"""
+        import library_api
+        in_flight = 0
+        max_in_flight = 0
+        batches = []
+        
+        async def fake_batch(api, isbns):
+            nonlocal in_flight, max_in_flight
+            batches.append(len(isbns))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {isbn: Book(f"Book {isbn}", "Author", isbn) for isbn in isbns}
+        
+        monkeypatch.setattr(library_api.LibraryAPI, '_fetch_batch', fake_batch)
+        
+        isbns = [isbn13(n) for n in range(120)]
+        report = self.library.add_books_by_isbn(isbns, concurrency=2)
+        
+        assert list(report.values()) == ["added"] * 120
+        assert batches == [50, 50, 20]
+        assert max_in_flight == 2
+        assert len(self.library.books) == 121
+
 if __name__ == "__main__":
     pytest.main([__file__])
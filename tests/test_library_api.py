@@ -7,6 +7,7 @@ import pytest
 import asyncio
 import sys
 import os
+import httpx
 
 # src klasörünü Python path'ine ekle
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -14,24 +15,70 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 try:
     from library_api import LibraryAPI
     from book import Book
+    from author_cache import AuthorCache
+    from isbn import NegativeCache
+    from resilience import CircuitBreaker
     LIBRARY_API_AVAILABLE = True
 except ImportError:
     LIBRARY_API_AVAILABLE = False
 
 
+def make_api(**kwargs):
+    """
+    Testler için LibraryAPI oluşturur
+    
+    HTTP önbelleği ve döküm dizini kapalıdır (çalışma dizinine dosya
+    yazılmaz); yazar, negatif önbellek ve devre kesici her test için
+    yenidir, testler modül düzeyindeki paylaşılan nesneleri değiştirmez.
+    """
+    kwargs.setdefault('cache_file', None)
+    kwargs.setdefault('index_file', None)
+    kwargs.setdefault('author_cache', AuthorCache())
+    kwargs.setdefault('negative_cache', NegativeCache())
+    kwargs.setdefault('circuit_breaker', CircuitBreaker())
+    return LibraryAPI(**kwargs)
+
+
 @pytest.mark.skipif(not LIBRARY_API_AVAILABLE, reason="LibraryAPI modülü bulunamadı")
 class TestLibraryAPI:
     """LibraryAPI sınıfı için test sınıfı"""
     
     def setup_method(self):
         """Her test öncesi çalışır"""
-        self.api = LibraryAPI()
+        self.api = make_api()
     
     def test_init(self):
         """LibraryAPI constructor'ını test eder"""
         assert self.api.base_url == "https://openlibrary.org"
         assert self.api.timeout == 10.0
     
+    def test_connection_pool_settings(self):
+        """Bağlantı havuzu ayarlarını test eder"""
+        api = make_api(max_connections=5, max_keepalive_connections=2)
+        
+        assert api.limits.max_connections == 5
+        assert api.limits.max_keepalive_connections == 2
+        assert api.sync_client is api.sync_client
+        
+        api.close()
+        assert api._sync_client is None
+
+    def test_data_files_not_in_working_directory(self, tmp_path):
+        """Göreli önbellek ve dizin yolları çalışma dizinine değil data_dir'e göre çözülmeli"""
+        api = LibraryAPI(data_dir=str(tmp_path))
+        assert api.http_cache.filename == str(tmp_path / "http_cache.sqlite")
+        assert api.dump_index.filename == str(tmp_path / "openlibrary_index.sqlite")
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        api = LibraryAPI()
+        assert os.path.dirname(api.http_cache.filename) == root
+        assert os.path.dirname(api.dump_index.filename) == root
+
+        # Mutlak yollar olduğu gibi kullanılır
+        api = LibraryAPI(cache_file=str(tmp_path / "c.sqlite"), index_file=None, data_dir="/")
+        assert api.http_cache.filename == str(tmp_path / "c.sqlite")
+        assert api.dump_index is None
+
     def test_clean_isbn(self):
         """ISBN temizleme işlemini test eder"""
         # Test ISBN'leri
@@ -48,7 +95,63 @@ class TestLibraryAPI:
             clean_isbn = ''.join(c for c in input_isbn if c.isdigit() or c == '-')
             assert clean_isbn == expected
     
-    def test_parse_book_data(self):
+    def test_search_books(self):
+        """Kitap arama işlemini test eder"""
+        query = "Harry Potter"
+        limit = 5
+        
+        results = self.api.search_books(query, limit)
+        
+        assert isinstance(results, list)
+        assert len(results) <= limit
+        
+        if results:
+            # İlk sonucu kontrol et
+            first_book = results[0]
+            assert isinstance(first_book, Book)
+            assert hasattr(first_book, 'title')
+            assert hasattr(first_book, 'author')
+            assert hasattr(first_book, 'isbn')
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not LIBRARY_API_AVAILABLE, reason="LibraryAPI modülü bulunamadı")
+class TestLibraryAPIAsync:
+    """LibraryAPI async fonksiyonları için test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.api = make_api()
+    
+    async def test_get_book_by_isbn_valid(self):
+        """Geçerli ISBN ile kitap çekme işlemini test eder"""
+        # Harry Potter ISBN'i
+        test_isbn = "978-0-7475-3269-9"
+        
+        book = await self.api.get_book_by_isbn(test_isbn)
+        
+        if book:
+            # Kitap bulundu
+            assert isinstance(book, Book)
+            assert book.isbn == test_isbn
+            assert hasattr(book, 'title')
+            assert hasattr(book, 'author')
+            assert len(book.title) > 0
+            assert len(book.author) > 0
+        else:
+            # API erişilemez olabilir
+            pytest.skip("Open Library API erişilemez")
+    
+    async def test_client_shared_and_closed(self):
+        """Async istemci paylaşılmalı ve context manager çıkışında kapanmalı"""
+        async with make_api() as api:
+            client = api.client
+            assert api.client is client
+        
+        assert client.is_closed
+        assert api._client is None
+    
+    async def test_parse_book_data(self):
         """Kitap verisi parse etme işlemini test eder"""
         # Mock API yanıtı
         mock_data = {
@@ -61,7 +164,7 @@ class TestLibraryAPI:
         test_isbn = "978-0-7475-3269-9"
         
         # _parse_book_data metodunu test et
-        book = self.api._parse_book_data(mock_data, test_isbn)
+        book = await self.api._parse_book_data(mock_data, test_isbn)
         
         assert isinstance(book, Book)
         assert book.title == "Test Kitap"
@@ -69,77 +172,128 @@ class TestLibraryAPI:
         # Yazar adı API'den çekilecek, şimdilik "Bilinmeyen Yazar" olabilir
         assert hasattr(book, 'author')
     
-    def test_parse_book_data_missing_fields(self):
+    async def test_parse_book_data_missing_fields(self):
         """Eksik alanlarla kitap verisi parse etme işlemini test eder"""
         # Eksik alanlarla mock veri
         mock_data = {}
         test_isbn = "978-0-7475-3269-9"
         
-        book = self.api._parse_book_data(mock_data, test_isbn)
+        book = await self.api._parse_book_data(mock_data, test_isbn)
         
         assert isinstance(book, Book)
         assert book.title == "Bilinmeyen Başlık"
         assert book.author == "Bilinmeyen Yazar"
         assert book.isbn == test_isbn
     
-    def test_get_author_name(self):
+    async def test_get_author_name(self):
         """Yazar adı çekme işlemini test eder"""
         # Mock yazar anahtarı
         author_key = "/authors/OL12345A"
         
         # _get_author_name metodunu test et
-        author_name = self.api._get_author_name(author_key)
+        author_name = await self.api._get_author_name(author_key)
         
         # API erişilebilir olabilir veya olmayabilir
         assert isinstance(author_name, str)
         assert len(author_name) > 0
     
-    def test_search_books(self):
-        """Kitap arama işlemini test eder"""
-        query = "Harry Potter"
-        limit = 5
+    async def test_authors_resolved_concurrently(self):
+        """Tüm yazarlar eşzamanlı çözülmeli ve sırayla birleştirilmeli"""
+        names = {"/authors/A.json": "Terry Pratchett", "/authors/B.json": "Neil Gaiman"}
+        in_flight = 0
+        max_in_flight = 0
         
-        results = self.api.search_books(query, limit)
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            name = names.get(request.url.path)
+            if name is None:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"name": name})
         
-        assert isinstance(results, list)
-        assert len(results) <= limit
+        self.api._client = httpx.AsyncClient(
+            base_url=self.api.base_url, transport=httpx.MockTransport(handler))
+        data = {
+            "title": "Good Omens",
+            "authors": [{"key": "/authors/A"}, {"key": "/authors/B"},
+                        {"key": "/authors/C"}, {"key": "/authors/A"}]
+        }
         
-        if results:
-            # İlk sonucu kontrol et
-            first_book = results[0]
-            assert isinstance(first_book, Book)
-            assert hasattr(first_book, 'title')
-            assert hasattr(first_book, 'author')
-            assert hasattr(first_book, 'isbn')
-
-
-@pytest.mark.asyncio
-@pytest.mark.skipif(not LIBRARY_API_AVAILABLE, reason="LibraryAPI modülü bulunamadı")
-class TestLibraryAPIAsync:
-    """LibraryAPI async fonksiyonları için test sınıfı"""
+        book = await self.api._parse_book_data(data, "978-0-06-085398-3")
+        await self.api.aclose()
+        
+        assert book.author == "Terry Pratchett, Neil Gaiman"
+        assert max_in_flight == 3
     
-    def setup_method(self):
-        """Her test öncesi çalışır"""
-        self.api = LibraryAPI()
+    async def test_batched_books_api(self):
+        """Toplu Books API tek istekte çok kitabı yazarlarıyla döndürmeli"""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={
+                "ISBN:9780747532699": {
+                    "title": "Harry Potter and the Philosopher's Stone",
+                    "authors": [{"url": "/authors/OL23919A", "name": "J. K. Rowling"}]
+                },
+                "ISBN:0060853980": {
+                    "title": "Good Omens",
+                    "authors": [{"name": "Terry Pratchett"}, {"name": "Neil Gaiman"}]
+                }
+            })
+        
+        self.api._client = httpx.AsyncClient(
+            base_url=self.api.base_url, transport=httpx.MockTransport(handler))
+        
+        books = await self.api.get_books_by_isbns(
+            ["978-0-7475-3269-9", "0060853980", "123", "9780747532699"])
+        await self.api.aclose()
+        
+        assert len(requests) == 1
+        params = requests[0].url.params
+        assert requests[0].url.path == "/api/books"
+        assert params["jscmd"] == "data"
+        assert params["bibkeys"] == "ISBN:9780747532699,ISBN:0060853980"
+        assert books[0].author == "J. K. Rowling"
+        assert books[0].isbn == "978-0-7475-3269-9"
+        assert books[1].author == "Terry Pratchett, Neil Gaiman"
+        assert books[2] is None
+        assert books[3].title == books[0].title
     
-    async def test_get_book_by_isbn_valid(self):
-        """Geçerli ISBN ile kitap çekme işlemini test eder"""
-        # Harry Potter ISBN'i
-        test_isbn = "978-0-7475-3269-9"
+    async def test_not_found_isbn_cached(self):
+        """404 dönen ISBN tekrar sorulmamalı, hatalı ISBN hiç sorulmamalı"""
+        requests = []
         
-        book = await self.api.get_book_by_isbn(test_isbn)
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(404)
         
-        if book:
-            # Kitap bulundu
-            assert isinstance(book, Book)
-            assert book.isbn == test_isbn
-            assert hasattr(book, 'title')
-            assert hasattr(book, 'author')
-            assert len(book.title) > 0
-            assert len(book.author) > 0
-        else:
-            # API erişilemez olabilir
-            pytest.skip("Open Library API erişilemez")
+        api = make_api()
+        api._client = httpx.AsyncClient(base_url=api.base_url, transport=httpx.MockTransport(handler))
+        
+        assert await api.get_book_by_isbn("978-0-7475-3269-9") is None
+        assert await api.get_book_by_isbn("9780747532699") is None
+        assert await api.get_book_by_isbn("978-0-7475-3269-8") is None
+        assert await api.get_books_by_isbns(["978-0-7475-3269-9"]) == [None]
+        await api.aclose()
+        
+        assert requests == ["/isbn/978-0-7475-3269-9.json"]
+    
+    async def test_batch_misses_cached(self):
+        """Toplu yanıtta olmayan ISBN'ler negatif önbelleğe eklenmeli"""
+        def handler(request):
+            return httpx.Response(200, json={})
+        
+        api = make_api()
+        api._client = httpx.AsyncClient(base_url=api.base_url, transport=httpx.MockTransport(handler))
+        
+        await api.get_books_by_isbns(["9780134685991"])
+        await api.aclose()
+        
+        assert "9780134685991" in api.negative_cache
     
     async def test_get_book_by_isbn_invalid(self):
         """Geçersiz ISBN ile kitap çekme işlemini test eder"""
@@ -178,26 +332,23 @@ class TestLibraryAPIAsync:
 class TestLibraryAPIIntegration:
     """LibraryAPI entegrasyon testleri"""
     
-    def test_library_api_with_library_class(self):
+    def test_library_api_with_library_class(self, tmp_path):
         """LibraryAPI'nin Library sınıfı ile entegrasyonunu test eder"""
         try:
             from library import Library
             
-            # Test kütüphanesi oluştur
-            test_library = Library("test_library_api.json")
+            # Test kütüphanesi oluştur (dosyalar geçici dizinde)
+            test_library = Library(str(tmp_path / "test_library_api.json"), api=make_api())
             
             # ISBN ile kitap ekleme metodunu test et
             test_isbn = "978-0-7475-3269-9"
             
             # Bu test API çağrısı yapar, zaman alabilir
             success = test_library.add_book_by_isbn(test_isbn)
+            test_library.close_api()
             
             # Başarılı veya başarısız olabilir (API durumuna bağlı)
             assert isinstance(success, bool)
-            
-            # Test dosyasını temizle
-            if os.path.exists("test_library_api.json"):
-                os.remove("test_library_api.json")
                 
         except Exception as e:
             # API erişilemez olabilir
@@ -0,0 +1,58 @@
+"""
+QueryCache sınıfı için test dosyası
+"""
+
+import pytest
+import sys
+import os
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from query_cache import QueryCache
+
+class TestQueryCache:
+    """QueryCache sınıfı test sınıfı"""
+    
+    def test_hit_and_miss(self):
+        """Aynı sürümde isabet, farklı sürümde ıskalama olmalı"""
+        cache = QueryCache()
+        cache.put('key', 1, ['value'], 10)
+        
+        assert cache.get('key', 1) == (True, ['value'])
+        assert cache.get('key', 2) == (False, None)
+        assert cache.get('other', 1) == (False, None)
+        assert cache.hits == 1
+        assert cache.misses == 2
+    
+    def test_lru_eviction_by_entries(self):
+        """Giriş sınırı aşılınca en az kullanılan çıkarılmalı"""
+        cache = QueryCache(max_entries=2)
+        cache.put('a', 1, 'A', 1)
+        cache.put('b', 1, 'B', 1)
+        cache.get('a', 1)
+        cache.put('c', 1, 'C', 1)
+        
+        assert cache.get('b', 1) == (False, None)
+        assert cache.get('a', 1) == (True, 'A')
+        assert cache.get('c', 1) == (True, 'C')
+    
+    def test_eviction_by_bytes(self):
+        """Boyut sınırı aşılınca eski girişler çıkarılmalı"""
+        cache = QueryCache(max_bytes=100)
+        cache.put('a', 1, 'A', 60)
+        cache.put('b', 1, 'B', 60)
+        
+        assert len(cache) == 1
+        assert cache.bytes == 60
+        assert cache.get('b', 1) == (True, 'B')
+    
+    def test_oversized_value_not_cached(self):
+        """Sınırdan büyük değer önbelleğe alınmamalı"""
+        cache = QueryCache(max_bytes=100)
+        cache.put('a', 1, 'A', 500)
+        
+        assert len(cache) == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__])
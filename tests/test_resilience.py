@@ -0,0 +1,231 @@
+"""
+Hız sınırı, yeniden deneme ve devre kesici için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import time
+import httpx
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from resilience import (AsyncResilientTransport, CircuitBreaker, CircuitOpenError,
+                        ResilientTransport, TokenBucket)
+from isbn import NegativeCache
+from library_api import LibraryAPI
+
+def status_sequence(*statuses):
+    """Sırayla verilen durum kodlarını döndüren sayaçlı handler"""
+    calls = []
+
+    def handler(request):
+        status = statuses[min(len(calls), len(statuses) - 1)]
+        calls.append(request.url.path)
+        return httpx.Response(status, json={})
+
+    return handler, calls
+
+class TestTokenBucket:
+    """TokenBucket test sınıfı"""
+
+    def test_burst_then_throttle(self):
+        """Kapasite kadar istek beklemeden, sonrakiler hız sınırıyla geçmeli"""
+        bucket = TokenBucket(rate=50, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+        for _ in range(5):
+            bucket.acquire()
+        # 5 ek token için en az ~0.1 saniye beklenmeli
+        assert time.monotonic() - start >= 0.09
+
+    def test_async_acquire(self):
+        """Async bekleme de hız sınırına uymalı"""
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        async def run():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(4)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.05
+
+class TestCircuitBreaker:
+    """CircuitBreaker test sınıfı"""
+
+    def test_opens_after_threshold(self):
+        """Eşik kadar hatadan sonra devre açılmalı ve istekler reddedilmeli"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.get_stats()['rejected'] == 1
+
+    def test_half_open_single_trial(self):
+        """Süre dolunca tek deneme isteği geçmeli; başarıyla devre kapanmalı"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Başarısız deneme devreyi yeniden açmalı"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.01)
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+class TestResilientTransport:
+    """Yeniden deneme transport'ları test sınıfı"""
+
+    def test_retries_5xx_then_succeeds(self):
+        """503 yanıtları yeniden denenmeli"""
+        handler, calls = status_sequence(503, 503, 200)
+        transport = ResilientTransport(httpx.MockTransport(handler), max_retries=3,
+                                       base_delay=0.001)
+        with httpx.Client(transport=transport) as client:
+            assert client.get("https://example.com/x").status_code == 200
+        assert len(calls) == 3
+
+    def test_gives_up_after_max_retries(self):
+        """Deneme hakkı bitince son yanıt döndürülmeli"""
+        handler, calls = status_sequence(500)
+        transport = ResilientTransport(httpx.MockTransport(handler), max_retries=2,
+                                       base_delay=0.001)
+        with httpx.Client(transport=transport) as client:
+            assert client.get("https://example.com/x").status_code == 500
+        assert len(calls) == 3
+
+    def test_404_not_retried(self):
+        """404 gibi istemci hataları yeniden denenmemeli"""
+        handler, calls = status_sequence(404)
+        breaker = CircuitBreaker(failure_threshold=1)
+        transport = ResilientTransport(httpx.MockTransport(handler),
+                                       circuit_breaker=breaker, base_delay=0.001)
+        with httpx.Client(transport=transport) as client:
+            assert client.get("https://example.com/x").status_code == 404
+        assert len(calls) == 1
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_retry_after_honoured(self):
+        """429 yanıtındaki Retry-After süresine uyulmalı"""
+        transport = ResilientTransport(httpx.MockTransport(lambda r: httpx.Response(200)),
+                                       max_delay=0.5)
+        response = httpx.Response(429, headers={'Retry-After': '3'})
+        assert transport._delay(0, response) == 0.5
+        assert 0 <= transport._delay(1) <= 1.0
+
+    def test_open_circuit_fails_fast(self):
+        """Devre açıldıktan sonra istek ağa gitmeden hata vermeli"""
+        handler, calls = status_sequence(503)
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        transport = ResilientTransport(httpx.MockTransport(handler), circuit_breaker=breaker,
+                                       max_retries=5, base_delay=0.001)
+        with httpx.Client(transport=transport) as client:
+            with pytest.raises(CircuitOpenError):
+                client.get("https://example.com/x")
+            with pytest.raises(CircuitOpenError):
+                client.get("https://example.com/y")
+        assert len(calls) == 2
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_trial_429_releases_slot(self):
+        """Deneme isteği 429 alırsa devre kilitlenmemeli; sonraki istek denenebilmeli"""
+        handler, calls = status_sequence(500, 429, 200)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        transport = ResilientTransport(httpx.MockTransport(handler), circuit_breaker=breaker,
+                                       max_retries=0)
+        with httpx.Client(transport=transport) as client:
+            assert client.get("https://example.com/x").status_code == 500
+            assert breaker.state == CircuitBreaker.OPEN
+            time.sleep(0.02)
+
+            # 429 deneme sonucu sayılmaz: devre yarı açık kalır, hak serbest kalır
+            assert client.get("https://example.com/x").status_code == 429
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert client.get("https://example.com/x").status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert len(calls) == 3
+
+    def test_cancelled_trial_releases_slot(self):
+        """İptal edilen async deneme isteği deneme hakkını bırakmalı"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        async def handler(request):
+            if request.url.path == "/slow":
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={})
+
+        async def run():
+            transport = AsyncResilientTransport(httpx.MockTransport(handler),
+                                                circuit_breaker=breaker)
+            async with httpx.AsyncClient(transport=transport) as client:
+                task = asyncio.create_task(client.get("https://example.com/slow"))
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert breaker.state == CircuitBreaker.HALF_OPEN
+                return await client.get("https://example.com/fast")
+
+        assert asyncio.run(run()).status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_async_retries_connect_error(self):
+        """Async transport bağlantı hatalarını yeniden denemeli"""
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            if len(calls) < 3:
+                raise httpx.ConnectError("bağlantı yok", request=request)
+            return httpx.Response(200, json={})
+
+        async def run():
+            transport = AsyncResilientTransport(httpx.MockTransport(handler),
+                                                rate_limiter=TokenBucket(rate=1000),
+                                                base_delay=0.001)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.get("https://example.com/x")
+
+        assert asyncio.run(run()).status_code == 200
+        assert len(calls) == 3
+
+    def test_library_api_open_circuit_returns_none(self):
+        """Devre açıkken kitap araması None döndürmeli"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        api = LibraryAPI(cache_file=None, negative_cache=NegativeCache(),
+                         circuit_breaker=breaker)
+
+        async def run():
+            async with api:
+                api._client = httpx.AsyncClient(
+                    base_url=api.base_url,
+                    transport=AsyncResilientTransport(
+                        httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+                        circuit_breaker=breaker))
+                return await api.get_book_by_isbn("978-0134685991")
+
+        assert asyncio.run(run()) is None
+        assert api.get_stats()['circuit_breaker']['state'] == CircuitBreaker.OPEN
+
+if __name__ == "__main__":
+    pytest.main([__file__])
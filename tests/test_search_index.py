@@ -0,0 +1,329 @@
+"""
+Arama indeksleri için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from search_index import (BKTree, FuzzyIndex, InvertedIndex, PrefixIndex, RankingIndex,
+                          TrigramIndex, levenshtein, matches_keyword, normalize,
+                          search_key)
+from library import Library
+from book import Book
+
+
+SAMPLE_BOOKS = [
+    Book("Python Programming", "John Doe", "123-456-789"),
+    Book("Java Basics", "Jane Smith", "987-654-321"),
+    Book("Advanced Python  Patterns", "Bob Johnson", "555-555-555"),
+    Book("Harry Potter and the Philosopher's Stone", "J. K. Rowling", "978-0-7475-3269-9"),
+    Book("Suç ve Ceza", "Fyodor Dostoyevski", "978-975-07-0395-9"),
+    Book("IŞIK ÜLKESİ", "İlhan Işıkçı", "978-605-00-0000-1"),
+]
+
+QUERIES = [
+    "python", "pyth", "thon", "ON", "a", "j", "ja", "rowling", "k. row",
+    "python programming", "n prog", "python  patterns", "python patterns",
+    "and the", "555", "-0-7475-", "x", "ceza", "suç ve", " ", "",
+    "ışık", "isik", "Işıkçı", "ülkesi", "ilhan", "İLHAN",
+]
+
+
+class TestNormalize:
+    """normalize fonksiyonu test sınıfı"""
+
+    def test_turkish_case_folding(self):
+        """Türkçe I/ı ve İ/i doğru eşleşmeli"""
+        assert normalize("IŞIK") == normalize("ışık") == "isik"
+        assert normalize("İstanbul") == normalize("istanbul") == "istanbul"
+
+    def test_diacritics_removed(self):
+        """Aksanlar kaldırılmalı"""
+        assert normalize("Çağlar Güzel Öykü") == "caglar guzel oyku"
+        assert normalize("Émile Zola") == "emile zola"
+
+    def test_whitespace_collapsed(self):
+        """Boşluklar tek boşluğa indirilmeli"""
+        assert normalize("  Suç   ve\tCeza ") == "suc ve ceza"
+
+
+class TestInvertedIndex:
+    """InvertedIndex sınıfı test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.index = InvertedIndex()
+        for book in SAMPLE_BOOKS:
+            self.index.add(book)
+
+    def test_postings_for_tokens(self):
+        """Her kelime onu içeren kitapları göstermeli"""
+        assert self.index.postings["python"] == {"123-456-789", "555-555-555"}
+        assert self.index.postings["and"] == {"978-0-7475-3269-9"}
+
+    def test_remove_cleans_postings(self):
+        """Kitap çıkarılınca boş kalan kelimeler silinmeli"""
+        self.index.remove("987-654-321")
+
+        assert "java" not in self.index.postings
+        assert "987-654-321" not in self.index.postings.get("basics", set())
+
+    def test_multi_word_intersection(self):
+        """Çok kelimeli arama kümelerin kesişimini döndürmeli"""
+        assert self.index.candidates("python programming") == {"123-456-789"}
+        assert self.index.candidates("java python") == set()
+
+    def test_whitespace_query_not_indexed(self):
+        """Boş veya sadece boşluk içeren arama indeks kullanmamalı"""
+        assert self.index.candidates("") is None
+        assert self.index.candidates("   ") is None
+
+    def test_partial_words_match_brute_force(self):
+        """Kelime parçası aramaları tüm kelimeleri taramakla aynı sonucu vermeli"""
+        for query in ["y", "th", "ytho", "rowl", "ing", "-0-", "isikci"]:
+            expected = {book.isbn for book in SAMPLE_BOOKS if query in search_key(book)}
+            assert self.index.candidates(query) == expected, query
+        # Çok kelimeli terimlerde aday kümesi eşleşmeleri kapsamalı
+        for query in ["harry pot", "k. row", "ava bas", "ced pyth"]:
+            expected = {book.isbn for book in SAMPLE_BOOKS if query in search_key(book)}
+            assert expected and expected <= self.index.candidates(query), query
+        assert self.index.candidates("ythx") == set()
+
+    def test_remove_cleans_token_grams(self):
+        """Kitap çıkarılınca sadece o kitaptaki kelimelerin parçaları silinmeli"""
+        self.index.remove("987-654-321")
+
+        assert "jav" not in self.index._token_grams
+        assert self.index.candidates("ja") == set()
+        assert self.index.candidates("ytho") == {"123-456-789", "555-555-555"}
+
+
+class TestTrigramIndex:
+    """TrigramIndex sınıfı test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.index = TrigramIndex()
+        for book in SAMPLE_BOOKS:
+            self.index.add(book)
+
+    def test_trigrams(self):
+        """Metin üçlülere doğru bölünmeli"""
+        assert TrigramIndex.trigrams("java") == {"jav", "ava"}
+        assert TrigramIndex.trigrams("ja") == set()
+
+    def test_candidates_for_partial_words(self):
+        """Kelime ortasındaki parçalar da aday üretmeli"""
+        assert self.index.candidates("ytho") == {"123-456-789", "555-555-555"}
+        assert self.index.candidates("7475-3") == {"978-0-7475-3269-9"}
+        assert self.index.candidates("zzz") == set()
+
+    def test_short_query_not_indexed(self):
+        """Üç karakterden kısa terimler indeks kullanmamalı"""
+        assert self.index.candidates("py") is None
+
+    def test_remove_cleans_postings(self):
+        """Kitap çıkarılınca boş kalan üçlüler silinmeli"""
+        self.index.remove("987-654-321")
+
+        assert "jav" not in self.index.postings
+        assert self.index.candidates("java") == set()
+
+
+class TestPrefixIndex:
+    """PrefixIndex sınıfı test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.index = PrefixIndex()
+        for book in SAMPLE_BOOKS:
+            self.index.add(book)
+
+    def test_suggest_titles_and_authors(self):
+        """Önekle başlayan başlık ve yazarlar alfabetik dönmeli"""
+        assert self.index.suggest("ja") == ["Jane Smith", "Java Basics"]
+        assert self.index.suggest("J. K") == ["J. K. Rowling"]
+
+    def test_bulk_matches_single_adds(self):
+        """Toplu ekleme tek tek eklemeyle aynı sıralı indeksi üretmeli"""
+        index = PrefixIndex()
+        with index.bulk():
+            for book in reversed(SAMPLE_BOOKS):
+                index.add(book)
+
+        assert index._keys == self.index._keys
+        assert index.suggest("ja") == ["Jane Smith", "Java Basics"]
+        index.remove("987-654-321")
+        assert index.suggest("ja") == []
+        assert self.index.suggest("zz") == []
+
+    def test_suggest_limit(self):
+        """Öneri sayısı sınırı uygulanmalı"""
+        assert len(self.index.suggest("j", limit=2)) == 2
+
+    def test_shared_author_removed_last(self):
+        """Aynı yazarın son kitabı silinene kadar öneri kalmalı"""
+        self.index.add(Book("Another Book", "Jane Smith", "111-111-111"))
+
+        self.index.remove("987-654-321")
+        assert self.index.suggest("jane") == ["Jane Smith"]
+
+        self.index.remove("111-111-111")
+        assert self.index.suggest("jane") == []
+
+
+class TestFuzzyIndex:
+    """BK-ağacı ve FuzzyIndex test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.index = FuzzyIndex()
+        for book in SAMPLE_BOOKS:
+            self.index.add(book)
+
+    def test_levenshtein(self):
+        """Düzenleme mesafesi doğru hesaplanmalı"""
+        assert levenshtein("rowling", "rowlling") == 1
+        assert levenshtein("kitten", "sitting") == 3
+        assert levenshtein("", "abc") == 3
+
+    def test_bk_tree_find(self):
+        """BK-ağacı mesafe içindeki kelimeleri bulmalı"""
+        tree = BKTree()
+        for word in ["book", "books", "cake", "boo", "cape", "cart"]:
+            tree.add(word)
+
+        assert sorted(word for _, word in tree.find("bool", 1)) == ["boo", "book"]
+        assert tree.find("zzzz", 1) == []
+
+    def test_misspelled_author(self):
+        """Yazım hatalı yazar adı eşleşmeli"""
+        assert self.index.candidates("Rowlling", 2) == {"978-0-7475-3269-9"}
+        assert self.index.candidates("pyhton programing", 2) == {"123-456-789"}
+
+    def test_short_words_limited(self):
+        """Kısa kelimelerde mesafe sınırlanmalı"""
+        assert self.index.candidates("ve", 2) == {"978-975-07-0395-9"}
+
+    def test_removed_words_not_returned(self):
+        """Silinen kitabın kelimeleri sonuçlarda olmamalı"""
+        self.index.remove("987-654-321")
+
+        assert self.index.candidates("jva", 2) == set()
+
+
+class TestRankingIndex:
+    """RankingIndex (BM25) test sınıfı"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.index = RankingIndex()
+        self.books = [
+            Book("Cooking Basics", "Python Jones", "1"),
+            Book("Python", "Jane Smith", "2"),
+            Book("Python Programming for Beginners and Experts", "John Doe", "3"),
+            Book("Java Basics", "Jane Smith", "4"),
+        ]
+        for book in self.books:
+            self.index.add(book)
+
+    def test_title_boost_and_length(self):
+        """Başlık eşleşmesi yazardan, kısa başlık uzundan önde olmalı"""
+        scores = self.index.scores(["1", "2", "3"], "python")
+
+        assert scores["2"] > scores["3"] > scores["1"] > 0
+
+    def test_rare_terms_weigh_more(self):
+        """Nadir terimler yaygın terimlerden daha yüksek puan almalı"""
+        scores = self.index.scores(["1", "4"], "cooking basics")
+
+        assert scores["1"] > scores["4"]
+
+    def test_unmatched_scores_zero(self):
+        """Eşleşmeyen kitapların puanı sıfır olmalı"""
+        assert self.index.scores(["4"], "python") == {"4": 0.0}
+
+    def test_remove_updates_statistics(self):
+        """Silinen kitap istatistiklerden çıkmalı"""
+        self.index.remove("2")
+
+        assert "2" not in self.index.postings["python"]
+        assert self.index.scores(["3"], "python")["3"] > 0
+
+
+class TestIndexedSearch:
+    """İndeksli aramanın doğrusal tarama ile aynı sonucu verdiğini test eder"""
+
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.library = Library(os.path.join(self.temp_dir, 'library.json'))
+        for book in SAMPLE_BOOKS:
+            self.library.add_book(Book(book.title, book.author, book.isbn))
+
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def linear_search(self, keyword):
+        """Referans doğrusal arama"""
+        keyword = normalize(keyword)
+        return [book.isbn for book in self.library.books if matches_keyword(book, keyword)]
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_same_results_as_linear_scan(self, query):
+        """İndeksli arama doğrusal tarama ile aynı sonuçları vermeli"""
+        found = [book.isbn for book in self.library.search_books(query)]
+
+        assert found == self.linear_search(query)
+
+    def test_turkish_search(self):
+        """Türkçe karakterlerle yazılış farkı sonucu değiştirmemeli"""
+        expected = ["978-605-00-0000-1"]
+
+        assert [b.isbn for b in self.library.search_books("ışık")] == expected
+        assert [b.isbn for b in self.library.search_books("IŞIK")] == expected
+        assert [b.isbn for b in self.library.search_books("ulkesi")] == expected
+
+    def test_fuzzy_search(self):
+        """Bulanık arama tam eşleşmeleri de içermeli"""
+        assert self.library.search_books("Rowlling") == []
+
+        found = self.library.search_books("Rowlling", fuzzy=True)
+        assert [b.isbn for b in found] == ["978-0-7475-3269-9"]
+
+        found = self.library.search_books("pyth", fuzzy=True)
+        assert [b.isbn for b in found] == ["123-456-789", "555-555-555"]
+
+    def test_ranked_search(self):
+        """Sıralı arama alaka puanına göre sayfalamalı"""
+        self.library.add_book(Book("Python", "Guido", "000-000-001"))
+
+        page, total = self.library.ranked_search("python", limit=2)
+        assert total == 3
+        assert [b.isbn for b in page] == ["000-000-001", "123-456-789"]
+
+        page, total = self.library.ranked_search("python", limit=2, offset=2)
+        assert [b.isbn for b in page] == ["555-555-555"]
+
+    def test_index_follows_updates(self):
+        """Güncelleme ve silme sonrası indeks güncel kalmalı"""
+        self.library.update_book("987-654-321", "Kotlin Basics", "Jane Smith")
+        self.library.remove_book("123-456-789")
+
+        assert self.library.search_books("java") == []
+        assert [b.isbn for b in self.library.search_books("kotlin")] == ["987-654-321"]
+        assert [b.isbn for b in self.library.search_books("python")] == ["555-555-555"]
+        assert self.library.suggest("kot") == ["Kotlin Basics"]
+        assert self.library.suggest("java") == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
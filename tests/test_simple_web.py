@@ -0,0 +1,166 @@
+"""
+Flask web arayüzü (simple_web.py) API endpoint'leri için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import gzip
+import json
+
+pytest.importorskip("flask")
+
+# Proje kökünü ve src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import simple_web
+from library import Library
+from book import Book
+
+
+class TestSimpleWeb:
+    """simple_web API test sınıfı"""
+
+    @pytest.fixture(autouse=True)
+    def app_client(self, tmp_path, monkeypatch):
+        """Her test geçici klasördeki boş bir kütüphane ve test istemcisiyle çalışır"""
+        self.library = Library(str(tmp_path / "library.json"), journal=True)
+        monkeypatch.setattr(simple_web, 'library', self.library)
+        self.client = simple_web.app.test_client()
+
+    def add_books(self, count):
+        """Kütüphaneye sırayla numaralı test kitapları ekler"""
+        for i in range(count):
+            self.library.add_book(Book(f"Kitap {i}", f"Yazar {i}", f"isbn-{i:03d}"))
+
+    def test_cursor_paging(self):
+        """next_cursor ile tüm kitaplar ekleme sırasıyla ve tekrarsız gezilmeli"""
+        self.add_books(5)
+
+        isbns = []
+        cursor = None
+        while True:
+            query = {"limit": 2}
+            if cursor:
+                query["cursor"] = cursor
+            data = self.client.get("/api/books", query_string=query).get_json()
+            assert data["total"] == 5
+            isbns.extend(book["isbn"] for book in data["books"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert isbns == [f"isbn-{i:03d}" for i in range(5)]
+
+    def test_invalid_cursor(self):
+        """Geçersiz imleç 400 döndürmeli"""
+        self.add_books(1)
+
+        response = self.client.get("/api/books", query_string={"cursor": "bozuk"})
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+    def test_books_not_modified(self):
+        """Eşleşen If-None-Match 304 döndürmeli; kütüphane değişince ETag değişmeli"""
+        self.add_books(2)
+
+        response = self.client.get("/api/books")
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+
+        cached = self.client.get("/api/books", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+        self.library.remove_book("isbn-000")
+        changed = self.client.get("/api/books", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.get_json()["total"] == 1
+
+    def test_export_identity(self):
+        """Dışa aktarma satır başına bir kitap içeren NDJSON olmalı"""
+        self.add_books(3)
+
+        response = self.client.get("/api/books/export")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert "Content-Encoding" not in response.headers
+        lines = response.data.decode("utf-8").splitlines()
+        assert [json.loads(line)["isbn"] for line in lines] == ["isbn-000", "isbn-001", "isbn-002"]
+
+    def test_export_gzip(self):
+        """İstemci kabul ediyorsa dışa aktarma gzip ile sıkıştırılmalı"""
+        self.add_books(3)
+
+        response = self.client.get("/api/books/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert len(gzip.decompress(response.data).decode("utf-8").splitlines()) == 3
+
+    def test_export_bad_format(self):
+        """Desteklenmeyen format 400 döndürmeli"""
+        response = self.client.get("/api/books/export", query_string={"format": "csv"})
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+    def test_suggest(self):
+        """Öneriler başlık ve yazar öneklerinden gelmeli"""
+        self.library.add_book(Book("Sefiller", "Victor Hugo", "111"))
+        self.library.add_book(Book("Serenad", "Zülfü Livaneli", "222"))
+
+        data = self.client.get("/api/books/suggest", query_string={"q": " se "}).get_json()
+        assert data["query"] == "se"
+        assert set(data["suggestions"]) == {"Sefiller", "Serenad"}
+        assert self.client.get("/api/books/suggest").get_json()["suggestions"] == []
+
+    def test_search(self):
+        """Arama alaka sırasıyla sayfalanmalı; fuzzy yazım hatasına dayanmalı"""
+        self.add_books(5)
+
+        first = self.client.get("/api/books/search",
+                                query_string={"q": "kitap", "limit": 2}).get_json()
+        assert (first["total"], len(first["books"]), first["limit"]) == (5, 2, 2)
+
+        assert self.client.get("/api/books/search",
+                               query_string={"q": "kitapp"}).get_json()["total"] == 0
+        fuzzy = self.client.get("/api/books/search",
+                                query_string={"q": "kitapp", "fuzzy": "1"}).get_json()
+        assert fuzzy["fuzzy"] is True
+        assert fuzzy["total"] == 5
+
+        assert self.client.get("/api/books/search").status_code == 400
+
+    def test_stats_not_modified(self):
+        """İstatistikler kütüphane değişmedikçe 304 ile doğrulanmalı"""
+        self.add_books(2)
+
+        response = self.client.get("/api/stats")
+        etag = response.headers["ETag"]
+        assert response.get_json()["stats"]["total_books"] == 2
+        assert self.client.get("/api/stats", headers={"If-None-Match": etag}).status_code == 304
+
+        self.add_books(3)
+        response = self.client.get("/api/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["stats"]["total_books"] == 3
+
+    def test_cache_stats(self):
+        """Önbellek sayaçları ayrı ve önbelleklenmeyen endpoint'te olmalı"""
+        self.library.search_books("kitap")
+        self.library.search_books("kitap")
+
+        response = self.client.get("/api/stats/cache")
+
+        assert "ETag" not in response.headers
+        stats = response.get_json()["stats"]
+        assert stats["cache_hits"] == 1
+        assert "total_books" not in stats
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,180 @@
+"""
+Single-flight yardımcıları için test dosyası
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+import httpx
+
+# src klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from single_flight import AsyncSingleFlight, SingleFlight
+from author_cache import AuthorCache
+from isbn import NegativeCache
+from library import Library
+from library_api import LibraryAPI
+from resilience import CircuitBreaker
+
+def run_threads(count, target):
+    """Aynı fonksiyonu birden çok thread'de çalıştırır"""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+class TestSingleFlight:
+    """SingleFlight test sınıfı"""
+    
+    def test_concurrent_calls_share_result(self):
+        """Aynı anahtar için eşzamanlı çağrılar tek çalıştırma paylaşmalı"""
+        flight = SingleFlight()
+        calls = []
+        results = []
+        
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return "sonuç"
+        
+        run_threads(8, lambda: results.append(flight.do("isbn", work)))
+        
+        assert results == ["sonuç"] * 8
+        assert len(calls) == 1
+        assert flight.shared == 7
+    
+    def test_error_propagates_and_key_released(self):
+        """Hata bekleyenlere iletilmeli, sonraki çağrı yeniden çalışmalı"""
+        flight = SingleFlight()
+        
+        def fail():
+            raise ValueError("hata")
+        
+        with pytest.raises(ValueError):
+            flight.do("isbn", fail)
+        assert flight.do("isbn", lambda: 42) == 42
+
+class TestAsyncSingleFlight:
+    """AsyncSingleFlight test sınıfı"""
+    
+    def test_concurrent_coroutines_share_result(self):
+        """Eşzamanlı coroutine'ler tek çalıştırma paylaşmalı"""
+        flight = AsyncSingleFlight()
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "sonuç"
+        
+        async def run():
+            return await asyncio.gather(*(flight.do("isbn", work) for _ in range(5)))
+        
+        assert asyncio.run(run()) == ["sonuç"] * 5
+        assert len(calls) == 1
+    
+    def test_owner_cancellation_keeps_waiters(self):
+        """İşi başlatan çağıran iptal edilirse bekleyenler sonucu almaya devam etmeli"""
+        flight = AsyncSingleFlight()
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "sonuç"
+        
+        async def run():
+            owner = asyncio.create_task(flight.do("isbn", work))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flight.do("isbn", work))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await owner
+            return await waiter
+        
+        assert asyncio.run(run()) == "sonuç"
+        assert len(calls) == 1
+        assert flight._calls == {}
+    
+    def test_identical_isbn_lookups_coalesced(self):
+        """Aynı ISBN'in eşzamanlı aramaları tek API isteği yapmalı"""
+        requests = []
+        
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"title": "Tutunamayanlar"})
+        
+        async def run():
+            api = LibraryAPI(cache_file=None, negative_cache=NegativeCache())
+            api._client = httpx.AsyncClient(
+                base_url=api.base_url, transport=httpx.MockTransport(handler))
+            books = await asyncio.gather(
+                api.get_book_by_isbn("978-975-470-000-8"),
+                api.get_book_by_isbn("9789754700008"),
+                api.get_book_by_isbn("978-975-470-000-8"))
+            await api.aclose()
+            return books
+        
+        books = asyncio.run(run())
+        
+        assert requests == ["/isbn/978-975-470-000-8.json"]
+        assert [book.isbn for book in books] == ["978-975-470-000-8", "9789754700008",
+                                                 "978-975-470-000-8"]
+        assert books[0] is not books[2]
+
+class TestLibrarySharedAPI:
+    """Library'nin ISBN eklemede tek LibraryAPI kullanması test sınıfı"""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.requests = []
+        
+        async def handler(request):
+            self.requests.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"title": "Tutunamayanlar"})
+        
+        self.api = LibraryAPI(cache_file=None, index_file=None, author_cache=AuthorCache(),
+                              negative_cache=NegativeCache(), circuit_breaker=CircuitBreaker())
+        self.api._client = httpx.AsyncClient(
+            base_url=self.api.base_url, transport=httpx.MockTransport(handler))
+        self.library = Library(os.path.join(self.temp_dir, "library.json"), api=self.api)
+    
+    def teardown_method(self):
+        """Her test sonrası çalışır"""
+        self.library.close_api()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_threads_share_one_request(self):
+        """Farklı thread'lerden aynı ISBN'i ekleme tek API isteği yapmalı"""
+        results = []
+        run_threads(4, lambda: results.append(self.library.add_book_by_isbn("9789754700008")))
+        
+        assert self.requests == ["/isbn/9789754700008.json"]
+        assert sorted(results) == [False, False, False, True]
+        assert self.library.find_book("9789754700008").title == "Tutunamayanlar"
+    
+    def test_api_reused_between_calls(self):
+        """Ardışık çağrılar aynı API nesnesini ve istemciyi kullanmalı"""
+        client = self.api._client
+        assert self.library.add_book_by_isbn("9789754700008")
+        assert self.library.add_book_by_isbn("9780306406157")
+        
+        assert self.library._api is self.api
+        assert self.api._client is client
+        
+        self.library.close_api()
+        assert client.is_closed
+
+if __name__ == "__main__":
+    pytest.main([__file__])
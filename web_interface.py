@@ -16,28 +16,68 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from library import Library
 from book import Book
+from encoded_body import accepted_encodings, gzip_chunks, iter_ndjson
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'kutuphane_yonetim_sistemi_2024'
 socketio = SocketIO(app, async_mode='threading')
 
 # Global kütüphane nesnesi
-library = Library()
+library = Library(journal=True)
 
 @app.route('/')
 def index():
     """Ana sayfa"""
     return render_template('index.html')
 
+def not_modified(etag: str):
+    """İstemcideki kopya güncelse (If-None-Match) gövdesiz 304 yanıtı döndürür"""
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
 @app.route('/api/books', methods=['GET'])
 def get_books():
-    """Tüm kitapları JSON formatında döndürür"""
-    books_data = [book.to_dict() for book in library.books]
-    return jsonify({
+    """Kitapları ekleme sırasıyla, imleç tabanlı sayfalar halinde döndürür"""
+    cursor = request.args.get('cursor') or None
+    limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+    etag = library.etag('books', cursor, limit)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    try:
+        books, next_cursor = library.page_books(cursor, limit)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    response = jsonify({
         'success': True,
-        'books': books_data,
-        'total': len(books_data)
+        'books': [book.to_dict() for book in books],
+        'total': len(library),
+        'next_cursor': next_cursor
     })
+    response.set_etag(etag)
+    return response
+
+@app.route('/api/books/export', methods=['GET'])
+def export_books():
+    """Tüm kataloğu NDJSON olarak, bellekte biriktirmeden akış halinde gönderir"""
+    export_format = request.args.get('format', 'ndjson')
+    if export_format != 'ndjson':
+        return jsonify({
+            'success': False,
+            'message': f'Desteklenmeyen format: {export_format} (sadece ndjson)'
+        }), 400
+    
+    chunks = iter_ndjson(book.to_dict() for book in library.iter_books())
+    headers = {'Vary': 'Accept-Encoding'}
+    if 'gzip' in accepted_encodings(request.headers.get('Accept-Encoding', '')):
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    # Uzunluk bilinmediği için yanıt chunked olarak gönderilir
+    return app.response_class(chunks, mimetype='application/x-ndjson', headers=headers)
 
 @app.route('/api/books', methods=['POST'])
 def add_book():
@@ -109,23 +149,68 @@ def search_books():
             'message': 'Arama terimi gerekli!'
         }), 400
     
-    found_books = library.search_books(keyword)
+    # ?fuzzy=1 ile yazım hatalarına dayanıklı arama
+    fuzzy = request.args.get('fuzzy', '').lower() in ('1', 'true', 'yes')
+    max_distance = min(max(request.args.get('max_distance', 2, type=int), 0), 3)
+    # Sonuçlar alaka puanına göre sıralanır, sadece istenen sayfa döner
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    
+    found_books, total = library.ranked_search(
+        keyword, limit=limit, offset=offset, fuzzy=fuzzy, max_distance=max_distance)
     books_data = [book.to_dict() for book in found_books]
     
     return jsonify({
         'success': True,
         'books': books_data,
-        'total': len(books_data),
-        'keyword': keyword
+        'total': total,
+        'limit': limit,
+        'offset': offset,
+        'keyword': keyword,
+        'fuzzy': fuzzy
+    })
+
+@app.route('/api/books/suggest', methods=['GET'])
+def suggest_books():
+    """Başlık ve yazar adları için otomatik tamamlama önerileri"""
+    prefix = request.args.get('q', '').strip()
+    limit = request.args.get('limit', 10, type=int)
+    
+    suggestions = library.suggest(prefix, min(max(limit, 1), 50)) if prefix else []
+    
+    return jsonify({
+        'success': True,
+        'suggestions': suggestions,
+        'query': prefix
     })
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
-    """Kütüphane istatistiklerini döndürür"""
-    stats = library.get_stats()
+    """
+    Kütüphane istatistiklerini döndürür
+    
+    Sadece kütüphane değişince değişen bilgiler döner; ETag sürümden
+    üretildiği için güncel istemciye istatistik hesaplanmadan 304 döner.
+    Her istekte değişen sayaçlar /api/stats/cache adresindedir.
+    """
+    etag = library.etag('stats')
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    response = jsonify({
+        'success': True,
+        'stats': library.get_catalog_stats()
+    })
+    response.set_etag(etag)
+    return response
+
+@app.route('/api/stats/cache', methods=['GET'])
+def get_cache_stats():
+    """Önbellek sayaçlarını döndürür (önbelleklenmez)"""
     return jsonify({
         'success': True,
-        'stats': stats
+        'stats': library.get_cache_stats()
     })
 
 if __name__ == '__main__':